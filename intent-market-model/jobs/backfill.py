@@ -2,4 +2,4 @@ from jobs.daily_pipeline import run
 
 
 if __name__ == "__main__":
-    run()
+    run(batch_drift_min_items=1)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from typing import Iterable
+import logging
 
 from core.config import get_settings
 from core.logger import setup_logging
-from data.storage.db import SessionLocal
+from data.storage.db import Company, SessionLocal
 from data.storage.repositories import company_repo, tenant_repo
 from agents.orchestrator import Orchestrator
 
+logger = logging.getLogger(__name__)
+
 
 def _parse_watchlist(value: str | None) -> list[str]:
     if not value:
@@ -15,21 +17,26 @@ def _parse_watchlist(value: str | None) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
-def run() -> dict[int, int]:
+def run(batch_drift_min_items: int | None = None) -> dict[int, int]:
     settings = get_settings()
     setup_logging()
     with SessionLocal() as session:
-        results: dict[int, int] = {}
         watchlist = _parse_watchlist(settings.watchlist_companies)
         orchestrator = Orchestrator(session)
+        if batch_drift_min_items is not None:
+            orchestrator.harvester.batch_drift_min_items = batch_drift_min_items
+        companies: list[Company] = []
         for tenant in tenant_repo.list_tenants(session):
-            companies = company_repo.list_companies(session, tenant.id)
+            tenant_companies = company_repo.list_companies(session, tenant.id)
             if watchlist:
-                companies = [
-                    c for c in companies if c.domain in watchlist or c.name in watchlist
+                tenant_companies = [
+                    c for c in tenant_companies if c.domain in watchlist or c.name in watchlist
                 ]
-            results.update(orchestrator.run(companies))
-        return results
+            companies.extend(tenant_companies)
+        result = orchestrator.run_concurrent(companies, workers=settings.pipeline_workers)
+        for company_id, error in result.errors.items():
+            logger.error("Pipeline failed for company %s: %s", company_id, error)
+        return result.inserted
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-request overhead of BaseHTTPMiddleware and pure ASGI middleware."
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--companies", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="middleware-bench-") as workdir:
+        os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{Path(workdir) / 'bench.db'}"
+        os.environ.setdefault("RATE_LIMITER_BACKEND", "memory")
+        asyncio.run(_run(args.requests, args.companies))
+
+
+async def _run(total: int, company_count: int) -> None:
+    import httpx
+
+    from app.main import app
+    from data.storage.db import Company, SessionLocal, init_db
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    init_db()
+    asgi_stack = list(app.user_middleware)
+    stacks = {
+        "pure ASGI": asgi_stack,
+        "BaseHTTPMiddleware": _base_http_stack(asgi_stack),
+        "none": [],
+    }
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            tenant = (await client.post("/tenants", json={"name": "Bench"})).json()
+            api_key = (
+                await client.post(
+                    f"/tenants/{tenant['id']}/api-keys",
+                    json={"name": "bench", "rate_limit_per_min": total * 10},
+                )
+            ).json()
+            with SessionLocal() as session:
+                session.add_all(
+                    Company(tenant_id=tenant["id"], name=f"Company {idx}", domain=f"c{idx}.example")
+                    for idx in range(company_count)
+                )
+                session.commit()
+            headers = {"X-API-Key": api_key["key"]}
+            targets = {
+                "/health": {},
+                f"/tenants/{tenant['id']}/watchlist": headers,
+            }
+
+            results = {}
+            for label, stack in stacks.items():
+                app.user_middleware = stack
+                app.middleware_stack = None
+                for path, path_headers in targets.items():
+                    results[(label, path)] = await _measure(client, path, path_headers, total)
+            app.user_middleware = asgi_stack
+            app.middleware_stack = None
+
+    for path in targets:
+        baseline = results[("none", path)]
+        columns = "  ".join(
+            f"{label}={results[(label, path)]:8.1f}us ({results[(label, path)] - baseline:+8.1f})"
+            for label in ("BaseHTTPMiddleware", "pure ASGI")
+        )
+        print(f"{path:<32} none={baseline:8.1f}us  {columns}")
+
+
+def _base_http_stack(asgi_stack: list[Middleware]) -> list[Middleware]:
+    # The dispatch-based auth and audit middleware the pure ASGI versions replaced.
+    from datetime import datetime, timezone
+
+    from app.api.middleware import auth
+    from app.api.middleware.audit import AuditLogMiddleware
+    from app.services.api_key_cache import api_key_cache
+    from app.services.audit_sink import audit_sink
+    from app.services.rate_limiter import rate_limiter
+    from core.utils.hashing import hash_string
+
+    class AuthMiddleware(BaseHTTPMiddleware):
+        def __init__(self, app, allow_paths=None) -> None:
+            super().__init__(app)
+            self.allow_paths = set(allow_paths or [])
+
+        async def dispatch(self, request: Request, call_next):
+            path = request.url.path
+            if auth._is_allowed_request(path, request.method, self.allow_paths):
+                return await call_next(request)
+            api_key_value = request.headers.get("X-API-Key")
+            if not api_key_value:
+                return JSONResponse({"detail": "Missing API key"}, status_code=401)
+            api_key = api_key_cache.resolve(hash_string(api_key_value), auth._load_api_key)
+            if not api_key:
+                return JSONResponse({"detail": "Invalid API key"}, status_code=401)
+            tenant_id = auth._extract_tenant_id(path)
+            if tenant_id is not None and api_key.tenant_id != tenant_id:
+                return JSONResponse({"detail": "API key not authorized"}, status_code=403)
+            if not rate_limiter.allow(api_key.id, api_key.rate_limit_per_min):
+                return JSONResponse({"detail": "Rate limit exceeded"}, status_code=429)
+            request.state.api_key_id = api_key.id
+            request.state.tenant_id = api_key.tenant_id
+            api_key_cache.touch(api_key.id)
+            return await call_next(request)
+
+    class AuditMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            started = time.perf_counter()
+            response = await call_next(request)
+            audit_sink.record(
+                {
+                    "api_key_id": getattr(request.state, "api_key_id", None),
+                    "tenant_id": getattr(request.state, "tenant_id", None),
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                    "duration_ms": int((time.perf_counter() - started) * 1000),
+                    "created_at": datetime.now(timezone.utc),
+                }
+            )
+            return response
+
+    replacements = {auth.ApiKeyAuthMiddleware: AuthMiddleware, AuditLogMiddleware: AuditMiddleware}
+    return [
+        Middleware(replacements[item.cls], *item.args, **item.kwargs) for item in asgi_stack
+    ]
+
+
+async def _measure(client, path: str, headers: dict, total: int) -> float:
+    for _ in range(min(100, total)):
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+    started = time.perf_counter()
+    for _ in range(total):
+        await client.get(path, headers=headers)
+    return (time.perf_counter() - started) / total * 1_000_000
+
+
+if __name__ == "__main__":
+    main()
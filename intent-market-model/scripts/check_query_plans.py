@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from data.storage.db import SessionLocal, init_db
+from data.storage.query_plans import missing_indexes, sequential_scans
+
+
+def main() -> None:
+    init_db()
+    with SessionLocal() as session:
+        missing = missing_indexes(session)
+        failures = sequential_scans(session)
+    for name in missing:
+        print(f"{name} is declared on the models but not created by the migrations.")
+    for name, plan in failures.items():
+        print(f"{name} falls back to a sequential scan:")
+        for line in plan:
+            print(f"  {line}")
+    if missing or failures:
+        raise SystemExit(1)
+    print("All hot queries use an index.")
+
+
+if __name__ == "__main__":
+    main()
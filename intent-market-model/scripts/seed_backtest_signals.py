@@ -6,8 +6,13 @@ from pathlib import Path
 
 from agents.intent_inference.agent import IntentInferenceAgent
 from data.quality.dedupe import compute_signal_hash
-from data.storage.db import Company, IntentHypothesis, SignalEvent, SessionLocal
-from data.storage.repositories import company_repo, signals_repo, tenant_repo
+from data.storage.db import Company, SignalEvent, SessionLocal
+from data.storage.repositories import (
+    company_repo,
+    intents_repo,
+    signals_repo,
+    tenant_repo,
+)
 
 
 IPO_RULE_TEXT = (
@@ -68,15 +73,8 @@ def _get_or_create_company(
 def _seed_company_signals(
     session, company: Company, s1_date: datetime | None, snapshot_rows: list[dict[str, str]]
 ) -> None:
-    session.query(IntentHypothesis).filter(
-        IntentHypothesis.tenant_id == company.tenant_id,
-        IntentHypothesis.company_id == company.id,
-    ).delete(synchronize_session=False)
-    session.query(SignalEvent).filter(
-        SignalEvent.tenant_id == company.tenant_id,
-        SignalEvent.company_id == company.id,
-        SignalEvent.source == "backtest_seed",
-    ).delete(synchronize_session=False)
+    intents_repo.delete_company_intents(session, company.tenant_id, company.id)
+    signals_repo.delete_signals(session, company.tenant_id, company.id, source="backtest_seed")
     session.commit()
     if s1_date:
         anchor = s1_date - timedelta(days=15)
@@ -1,18 +1,34 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 
 from agents.base import AgentBase
 from agents.intent_inference.fusion import fuse
+from agents.intent_inference.scorers import rule_scorer
+from core.utils.time import ensure_utc
 from data.storage.db import IntentHypothesis, SignalEvent
-from data.storage.repositories import intents_repo, signals_repo
+from data.storage.repositories import intents_repo, rule_sets_repo, signals_repo
 
 _READINESS_THRESHOLD = 70.0
 _PERSISTENCE_DAYS = 60
 _SOURCE_WINDOW_DAYS = 30
 
 
+@dataclass(frozen=True)
+class _TrustWindow:
+    high_readiness_times: list[datetime]
+    source_times: list[datetime]
+
+    def persisted_since(self, since: datetime) -> bool:
+        return bisect_left(self.high_readiness_times, since) < len(self.high_readiness_times)
+
+    def sources_since(self, since: datetime) -> int:
+        return len(self.source_times) - bisect_left(self.source_times, since)
+
+
 class IntentInferenceAgent(AgentBase):
     name = "intent_inference"
 
@@ -20,41 +36,63 @@ class IntentInferenceAgent(AgentBase):
         self.session = session
 
     def infer(self, signals: list[SignalEvent]) -> list[IntentHypothesis]:
+        return self._infer(signals)
+
+    def _infer(
+        self, signals: list[SignalEvent], carry_forward: bool = False
+    ) -> list[IntentHypothesis]:
         if not signals:
             return []
         tenant_id = signals[0].tenant_id
-        existing_pairs, existing_signal_ids = _load_existing_intents(
-            self.session, tenant_id, signals[0].company_id
+        existing_pairs = intents_repo.list_evidence_pairs(
+            self.session, [signal.id for signal in signals if signal.id]
         )
+        existing_signal_ids = {signal_id for _, signal_id in existing_pairs}
         fresh_signals = [
             signal for signal in signals if signal.id and signal.id not in existing_signal_ids
         ]
         intents = fuse(fresh_signals)
-        if not intents:
-            return []
+        now = datetime.now(timezone.utc)
         for intent in intents:
             intent.tenant_id = tenant_id
-            if intent.intent_type == "IPO_PREP":
-                _apply_trust_layer(self.session, tenant_id, intent)
+            intent.ruleset_version = rule_scorer.RULESET_VERSION
+        windows = _load_trust_windows(self.session, tenant_id, intents, now)
+        ipo_intents = [intent for intent in intents if intent.intent_type == "IPO_PREP"]
+        if carry_forward:
+            ipo_intents.sort(key=lambda intent: _reference_time(intent, now))
+        for intent in ipo_intents:
+            window = windows.get(intent.company_id)
+            _apply_trust_layer(intent, window, now)
+            if carry_forward and window is not None and _needs_trust_window(intent):
+                insort(window.high_readiness_times, _reference_time(intent, now))
         intents = _dedupe_intents(intents, existing_pairs)
+        if intents:
+            rule_sets_repo.save_rule_set(
+                self.session,
+                rule_scorer.RULESET_VERSION,
+                rule_scorer.serialize_rules(rule_scorer.IPO_PREP_RULES),
+            )
+        signals_repo.mark_scored(self.session, [signal.id for signal in signals if signal.id])
         if not intents:
+            self.session.commit()
             return []
         return intents_repo.insert_intents(self.session, intents)
 
+    def rescore_window(
+        self, tenant_id: int, company_id: int, limit: int = 50
+    ) -> list[IntentHypothesis]:
+        signals = signals_repo.list_recent_signals(self.session, tenant_id, company_id, limit=limit)
+        return self.rescore(signals)
 
-def _load_existing_intents(
-    session: Session, tenant_id: int, company_id: int
-) -> tuple[set[tuple[str, int]], set[int]]:
-    existing_pairs: set[tuple[str, int]] = set()
-    existing_signal_ids: set[int] = set()
-    for intent in intents_repo.list_company_intents(session, tenant_id, company_id):
-        for evidence in intent.evidence or []:
-            signal_id = evidence.get("signal_event_id")
-            if signal_id is None:
-                continue
-            existing_signal_ids.add(signal_id)
-            existing_pairs.add((intent.intent_type, signal_id))
-    return existing_pairs, existing_signal_ids
+    def rescore(self, signals: list[SignalEvent]) -> list[IntentHypothesis]:
+        intents_repo.delete_signal_intents(
+            self.session, [signal.id for signal in signals if signal.id]
+        )
+        # The deleted intents no longer count towards persistence, so feed the
+        # recomputed ones forward in time order as streaming inference would.
+        intents = self._infer(signals, carry_forward=True)
+        self.session.commit()
+        return intents
 
 
 def _dedupe_intents(
@@ -77,30 +115,60 @@ def _dedupe_intents(
     return deduped
 
 
-def _apply_trust_layer(session: Session, tenant_id: int, intent: IntentHypothesis) -> None:
+def _needs_trust_window(intent: IntentHypothesis) -> bool:
+    return (
+        intent.intent_type == "IPO_PREP"
+        and (intent.readiness_score or 0.0) >= _READINESS_THRESHOLD
+    )
+
+
+def _reference_time(intent: IntentHypothesis, now: datetime) -> datetime:
+    return ensure_utc(intent.created_at) if intent.created_at else now
+
+
+def _load_trust_windows(
+    session: Session, tenant_id: int, intents: list[IntentHypothesis], now: datetime
+) -> dict[int, _TrustWindow]:
+    earliest: dict[int, datetime] = {}
+    for intent in intents:
+        if not _needs_trust_window(intent):
+            continue
+        reference_time = _reference_time(intent, now)
+        if intent.company_id not in earliest or reference_time < earliest[intent.company_id]:
+            earliest[intent.company_id] = reference_time
+    windows: dict[int, _TrustWindow] = {}
+    for company_id, reference_time in earliest.items():
+        intent_times = intents_repo.list_intent_times_since(
+            session,
+            tenant_id,
+            company_id,
+            reference_time - timedelta(days=_PERSISTENCE_DAYS),
+            intent_type="IPO_PREP",
+            min_readiness=_READINESS_THRESHOLD,
+        )
+        source_times = signals_repo.latest_signal_time_by_source(
+            session, tenant_id, company_id, reference_time - timedelta(days=_SOURCE_WINDOW_DAYS)
+        )
+        windows[company_id] = _TrustWindow(
+            high_readiness_times=sorted(ensure_utc(value) for value in intent_times),
+            source_times=sorted(ensure_utc(value) for value in source_times.values()),
+        )
+    return windows
+
+
+def _apply_trust_layer(
+    intent: IntentHypothesis, window: _TrustWindow | None, now: datetime
+) -> None:
     readiness = intent.readiness_score or 0.0
-    if readiness < _READINESS_THRESHOLD:
+    if window is None or readiness < _READINESS_THRESHOLD:
         intent.alert_eligible = False
         intent.alert_reason = f"Readiness below {_READINESS_THRESHOLD:.0f} threshold."
         _append_trust_explanation(intent, 0, False, False)
         return
 
-    reference_time = intent.created_at or datetime.now(timezone.utc)
-    since_persistence = reference_time - timedelta(days=_PERSISTENCE_DAYS)
-    since_sources = reference_time - timedelta(days=_SOURCE_WINDOW_DAYS)
-
-    recent_intents = intents_repo.list_intents_since(
-        session, tenant_id, intent.company_id, since_persistence, intent_type="IPO_PREP"
-    )
-    persisted = any(
-        prior.readiness_score is not None and prior.readiness_score >= _READINESS_THRESHOLD
-        for prior in recent_intents
-    )
-
-    recent_signals = signals_repo.list_signals_since(
-        session, tenant_id, intent.company_id, since_sources
-    )
-    source_count = len({signal.source for signal in recent_signals})
+    reference_time = _reference_time(intent, now)
+    persisted = window.persisted_since(reference_time - timedelta(days=_PERSISTENCE_DAYS))
+    source_count = window.sources_since(reference_time - timedelta(days=_SOURCE_WINDOW_DAYS))
     multi_source = source_count >= 2
 
     if persisted or multi_source:
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+import re
+import threading
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy.orm import Session
+
+from agents.intent_inference.agent import IntentInferenceAgent
+from agents.intent_inference.scorers import rule_scorer
+from core.config import get_settings
+from data.storage.db import SessionLocal
+from data.storage.repositories import intents_repo, rule_sets_repo, signals_repo
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+_ANCHOR_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*")
+_OPTIONAL_SUFFIXES = {"?", "*", "{"}
+_TEXT_CHECK_BATCH = 500
+
+
+@dataclass(frozen=True)
+class RuleRescan:
+    name: str
+    patterns: tuple[str, ...]
+    signal_types: frozenset[str]
+
+
+@dataclass
+class RescorePlan:
+    to_version: str
+    from_versions: list[str] = field(default_factory=list)
+    tenant_id: int | None = None
+    changed_rules: list[str] = field(default_factory=list)
+    signals: dict[tuple[int, int], set[int]] = field(default_factory=dict)
+
+    @property
+    def signal_count(self) -> int:
+        return sum(len(signal_ids) for signal_ids in self.signals.values())
+
+    def add(self, keys: Iterable[tuple[int, int, int]]) -> None:
+        for tenant_id, company_id, signal_id in keys:
+            self.signals.setdefault((tenant_id, company_id), set()).add(signal_id)
+
+
+@dataclass
+class RescoreResult:
+    signals: int = 0
+    intents: int = 0
+    stamped: int = 0
+    errors: dict[int, str] = field(default_factory=dict)
+
+
+def pattern_anchors(pattern: str) -> set[str] | None:
+    body = pattern.removeprefix(r"\b").removesuffix(r"\b")
+    alternatives = _split_alternatives(body)
+    if alternatives is None:
+        return None
+    if len(alternatives) == 1 and body.startswith("(") and body.endswith(")"):
+        if body.startswith("(?:"):
+            return pattern_anchors(body[3:-1])
+        if not body.startswith("(?"):
+            return pattern_anchors(body[1:-1])
+    anchors: set[str] = set()
+    for alternative in alternatives:
+        found = _ANCHOR_RE.match(alternative)
+        if not found:
+            return None
+        anchor = found.group(0)
+        if alternative[found.end() : found.end() + 1] in _OPTIONAL_SUFFIXES:
+            anchor = anchor[:-1]
+        if len(anchor) < 2:
+            return None
+        anchors.add(anchor.lower())
+    return anchors
+
+
+def diff_rule_sets(
+    old_rules: list[dict], new_rules: list[dict]
+) -> tuple[set[str], list[RuleRescan]]:
+    old = {rule["name"]: rule for rule in old_rules}
+    new = {rule["name"]: rule for rule in new_rules}
+    rehit = set(old) - set(new)
+    rescans: list[RuleRescan] = []
+    for name, rule in new.items():
+        signal_types = set(rule["signal_types"])
+        previous = old.get(name)
+        if previous is None:
+            rescans.append(RuleRescan(name, tuple(rule["patterns"]), frozenset(signal_types)))
+            continue
+        if previous != rule:
+            rehit.add(name)
+        added_patterns = tuple(
+            pattern for pattern in rule["patterns"] if pattern not in previous["patterns"]
+        )
+        if added_patterns:
+            rescans.append(RuleRescan(name, added_patterns, frozenset(signal_types)))
+        added_types = signal_types - set(previous["signal_types"])
+        if added_types:
+            rescans.append(RuleRescan(name, tuple(rule["patterns"]), frozenset(added_types)))
+    old_order = [name for name in old if name in new]
+    new_order = [name for name in new if name in old]
+    rehit.update(before for before, after in zip(old_order, new_order) if before != after)
+    return rehit, rescans
+
+
+def plan_rescore(
+    session: Session, tenant_id: int | None = None, from_version: str | None = None
+) -> RescorePlan:
+    to_version = rule_scorer.RULESET_VERSION
+    current_rules = rule_scorer.serialize_rules(rule_scorer.IPO_PREP_RULES)
+    rule_sets_repo.save_rule_set(session, to_version, current_rules)
+    session.commit()
+    versions = intents_repo.list_ruleset_versions(session, tenant_id) - {None, to_version}
+    if from_version is not None:
+        if rule_sets_repo.get_rule_set(session, from_version) is None:
+            raise ValueError(f"Unknown rule set version {from_version}")
+        versions.add(from_version)
+    versions.discard(to_version)
+    plan = RescorePlan(to_version=to_version, tenant_id=tenant_id)
+    rehit_rules: set[str] = set()
+    rescans: list[RuleRescan] = []
+    for version in sorted(versions):
+        rule_set = rule_sets_repo.get_rule_set(session, version)
+        if rule_set is None:
+            continue
+        plan.from_versions.append(version)
+        rehit, version_rescans = diff_rule_sets(rule_set.rules, current_rules)
+        plan.add(intents_repo.list_rule_hit_signals(session, version, rehit, tenant_id))
+        rehit_rules.update(rehit)
+        rescans.extend(rescan for rescan in version_rescans if rescan not in rescans)
+    plan.changed_rules = sorted(rehit_rules | {rescan.name for rescan in rescans})
+    plan.add(_rescan_signals(session, rescans, tenant_id))
+    plan.add(
+        intents_repo.list_version_signals(session, [to_version, *plan.from_versions], tenant_id)
+    )
+    return plan
+
+
+def run_rescore(
+    plan: RescorePlan,
+    workers: int | None = None,
+    batch_size: int | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> RescoreResult:
+    workers = workers or settings.rescore_workers
+    batch_size = batch_size or settings.rescore_batch_size
+    result = RescoreResult()
+    lock = threading.Lock()
+
+    def rescore_company(key: tuple[int, int], signal_ids: set[int]) -> None:
+        rescored = inserted = 0
+        try:
+            with session_factory() as session:
+                agent = IntentInferenceAgent(session)
+                for batch in _chunks(sorted(signal_ids), batch_size):
+                    signals = signals_repo.list_signals_by_ids(session, batch)
+                    inserted += len(agent.rescore(signals))
+                    rescored += len(signals)
+        except Exception as exc:
+            logger.exception("Rescore failed for company %s", key[1])
+            with lock:
+                result.errors[key[1]] = str(exc)
+        with lock:
+            result.signals += rescored
+            result.intents += inserted
+
+    if plan.signals:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(plan.signals))),
+            thread_name_prefix="rescore-worker",
+        ) as executor:
+            list(executor.map(lambda item: rescore_company(*item), plan.signals.items()))
+    if not result.errors:
+        with session_factory() as session:
+            for version in plan.from_versions:
+                result.stamped += intents_repo.stamp_ruleset_version(
+                    session, version, plan.to_version, plan.tenant_id
+                )
+    return result
+
+
+def _rescan_signals(
+    session: Session, rescans: list[RuleRescan], tenant_id: int | None
+) -> set[tuple[int, int, int]]:
+    if not rescans:
+        return set()
+    anchors = [(rescan, _rescan_anchors(rescan)) for rescan in rescans]
+    signal_types = set().union(*(rescan.signal_types for rescan in rescans))
+    pending: dict[int, tuple[tuple[int, int, int], list[RuleRescan]]] = {}
+    for row in signals_repo.iter_signal_tokens(session, signal_types, tenant_id):
+        relevant = [item for item in anchors if row.signal_type in item[0].signal_types]
+        if row.vectorizer_version is not None:
+            tokens = "\n".join(row.tokens or [])
+            relevant = [
+                (rescan, words)
+                for rescan, words in relevant
+                if words is None or any(word in tokens for word in words)
+            ]
+        if relevant:
+            pending[row.id] = (
+                (row.tenant_id, row.company_id, row.id),
+                [rescan for rescan, _ in relevant],
+            )
+    compiled = {
+        rescan: [re.compile(pattern, re.IGNORECASE) for pattern in rescan.patterns]
+        for rescan in rescans
+    }
+    found: set[tuple[int, int, int]] = set()
+    for batch in _chunks(list(pending), _TEXT_CHECK_BATCH):
+        for signal_id, text in signals_repo.list_signal_texts(session, batch).items():
+            key, relevant = pending[signal_id]
+            if any(
+                pattern.search(text or "") for rescan in relevant for pattern in compiled[rescan]
+            ):
+                found.add(key)
+    return found
+
+
+def _split_alternatives(pattern: str) -> list[str] | None:
+    alternatives: list[str] = []
+    depth = 0
+    start = 0
+    idx = 0
+    in_class = False
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == "\\":
+            idx += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif char == "|" and depth == 0:
+            alternatives.append(pattern[start:idx])
+            start = idx + 1
+        idx += 1
+    if depth or in_class:
+        return None
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+def _rescan_anchors(rescan: RuleRescan) -> set[str] | None:
+    anchors: set[str] = set()
+    for pattern in rescan.patterns:
+        pattern_words = pattern_anchors(pattern)
+        if pattern_words is None:
+            return None
+        anchors.update(pattern_words)
+    return anchors
+
+
+def _chunks(items: list[int], size: int) -> Iterator[list[int]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import Iterable
+import hashlib
+import json
 import math
 import re
 
-from core.utils.text import keyword_scores, normalize_text
+from core.utils.text import KEYWORDS, keyword_scores_from_counts, normalize_text, term_counts
 from data.storage.db import IntentHypothesis, SignalEvent
 
 
@@ -95,6 +98,27 @@ IPO_PREP_RULES = [
     },
 ]
 
+
+def serialize_rules(rules: list[dict]) -> list[dict]:
+    return [
+        {
+            "name": rule["name"],
+            "patterns": list(rule["patterns"]),
+            "weight": rule["weight"],
+            "signal_types": sorted(rule["signal_types"]),
+            "snippet_template": rule["snippet_template"],
+        }
+        for rule in rules
+    ]
+
+
+def ruleset_version(rules: list[dict]) -> str:
+    payload = json.dumps(serialize_rules(rules), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+RULESET_VERSION = ruleset_version(IPO_PREP_RULES)
+
 _RULE_PATTERNS = [
     {
         **rule,
@@ -103,6 +127,50 @@ _RULE_PATTERNS = [
     for rule in IPO_PREP_RULES
 ]
 
+
+class RuleMatcher:
+    def __init__(self, rules: list[dict]) -> None:
+        self.rules = rules
+        self._patterns: dict[str, re.Pattern] = {}
+        alternatives: list[str] = []
+        for rule_idx, rule in enumerate(rules):
+            for pattern_idx, pattern in enumerate(rule["compiled"]):
+                group = f"r{rule_idx}p{pattern_idx}"
+                self._patterns[group] = pattern
+                alternatives.append(f"(?P<{group}>{pattern.pattern})")
+        bounded = all(pattern.pattern.startswith(r"\b") for pattern in self._patterns.values())
+        merged = (r"\b" if bounded else "") + "(?=" + "|".join(alternatives) + ")"
+        self._scanner = re.compile(merged, re.IGNORECASE)
+        self._lower_scanner = re.compile(_lower_literals(merged))
+
+    def find(self, text: str) -> list[tuple[dict, re.Match]]:
+        if text.isascii():
+            candidates = self._lower_scanner.finditer(text.lower())
+        else:
+            candidates = self._scanner.finditer(text)
+        pending = dict(self._patterns)
+        found: dict[str, re.Match] = {}
+        for candidate in candidates:
+            position = candidate.start()
+            for group, pattern in list(pending.items()):
+                match = pattern.match(text, position)
+                if match:
+                    found[group] = match
+                    del pending[group]
+            if not pending:
+                break
+        hits: list[tuple[dict, re.Match]] = []
+        for rule_idx, rule in enumerate(self.rules):
+            for pattern_idx in range(len(rule["compiled"])):
+                match = found.get(f"r{rule_idx}p{pattern_idx}")
+                if match:
+                    hits.append((rule, match))
+                    break
+        return hits
+
+
+_MATCHERS: dict[str, RuleMatcher] = {}
+
 IPO_TERMS = ["compliance", "governance", "audit", "sox"]
 SECURITY_TERMS = ["security", "risk", "privacy"]
 PLATFORM_TERMS = ["platform", "infrastructure", "infra"]
@@ -110,12 +178,27 @@ SUNSET_TERMS = ["sunset", "deprecate", "migrate off"]
 COST_TERMS = ["optimize", "efficiency", "cost", "contract", "contractor"]
 PRODUCT_TERMS = ["product", "growth", "expansion"]
 
+_SCORED_TERMS = tuple(
+    dict.fromkeys(
+        chain(
+            *KEYWORDS.values(),
+            IPO_TERMS,
+            SECURITY_TERMS,
+            PLATFORM_TERMS,
+            SUNSET_TERMS,
+            COST_TERMS,
+            PRODUCT_TERMS,
+        )
+    )
+)
+
 
 def score(signals: Iterable[SignalEvent]) -> list[IntentHypothesis]:
     intents: list[IntentHypothesis] = []
     for signal in signals:
         text = normalize_text(signal.raw_text)
-        scores = keyword_scores(text)
+        counts = term_counts(text, _SCORED_TERMS)
+        scores = keyword_scores_from_counts(counts)
         structured = signal.structured_fields or {}
         role_bucket = structured.get("role_bucket")
         employment_type = (structured.get("employment_type") or "").lower()
@@ -124,23 +207,23 @@ def score(signals: Iterable[SignalEvent]) -> list[IntentHypothesis]:
         if intent:
             intents.append(intent)
 
-        intent = _security_ramp(signal, text, scores)
+        intent = _security_ramp(signal, counts)
         if intent:
             intents.append(intent)
 
-        intent = _platform_pivot(signal, text, role_bucket)
+        intent = _platform_pivot(signal, counts, role_bucket)
         if intent:
             intents.append(intent)
 
-        intent = _cost_pressure(signal, text, scores, employment_type)
+        intent = _cost_pressure(signal, counts, employment_type)
         if intent:
             intents.append(intent)
 
-        intent = _sunsetting(signal, text)
+        intent = _sunsetting(signal, counts)
         if intent:
             intents.append(intent)
 
-        intent = _product_expansion(signal, text, scores, role_bucket)
+        intent = _product_expansion(signal, counts, scores, role_bucket)
         if intent:
             intents.append(intent)
 
@@ -187,9 +270,9 @@ def _ipo_prep(signal: SignalEvent, text: str, scores: dict[str, int]) -> IntentH
     )
 
 
-def _security_ramp(signal: SignalEvent, text: str, scores: dict[str, int]) -> IntentHypothesis | None:
-    security_hits = _count_terms(text, SECURITY_TERMS)
-    compliance_hits = _count_terms(text, IPO_TERMS)
+def _security_ramp(signal: SignalEvent, counts: dict[str, int]) -> IntentHypothesis | None:
+    security_hits = _count_terms(counts, SECURITY_TERMS)
+    compliance_hits = _count_terms(counts, IPO_TERMS)
     if security_hits + compliance_hits < 2:
         return None
     confidence = min(0.8, 0.55 + 0.05 * (security_hits + compliance_hits))
@@ -207,12 +290,14 @@ def _security_ramp(signal: SignalEvent, text: str, scores: dict[str, int]) -> In
     )
 
 
-def _platform_pivot(signal: SignalEvent, text: str, role_bucket: str | None) -> IntentHypothesis | None:
+def _platform_pivot(
+    signal: SignalEvent, counts: dict[str, int], role_bucket: str | None
+) -> IntentHypothesis | None:
     if role_bucket not in {"infra", "ml"}:
         return None
-    if not _has_any(text, PLATFORM_TERMS):
+    if not _has_any(counts, PLATFORM_TERMS):
         return None
-    if "product" in text:
+    if counts["product"]:
         return None
     confidence = 0.65 if role_bucket == "ml" else 0.6
     explanation = (
@@ -230,9 +315,9 @@ def _platform_pivot(signal: SignalEvent, text: str, role_bucket: str | None) ->
 
 
 def _cost_pressure(
-    signal: SignalEvent, text: str, scores: dict[str, int], employment_type: str
+    signal: SignalEvent, counts: dict[str, int], employment_type: str
 ) -> IntentHypothesis | None:
-    cost_hits = _count_terms(text, COST_TERMS)
+    cost_hits = _count_terms(counts, COST_TERMS)
     if cost_hits == 0 and "contract" not in employment_type:
         return None
     confidence = min(0.75, 0.55 + 0.05 * cost_hits)
@@ -250,8 +335,8 @@ def _cost_pressure(
     )
 
 
-def _sunsetting(signal: SignalEvent, text: str) -> IntentHypothesis | None:
-    if not _has_any(text, SUNSET_TERMS):
+def _sunsetting(signal: SignalEvent, counts: dict[str, int]) -> IntentHypothesis | None:
+    if not _has_any(counts, SUNSET_TERMS):
         return None
     confidence = 0.7
     explanation = (
@@ -269,11 +354,11 @@ def _sunsetting(signal: SignalEvent, text: str) -> IntentHypothesis | None:
 
 
 def _product_expansion(
-    signal: SignalEvent, text: str, scores: dict[str, int], role_bucket: str | None
+    signal: SignalEvent, counts: dict[str, int], scores: dict[str, int], role_bucket: str | None
 ) -> IntentHypothesis | None:
     if role_bucket != "product":
         return None
-    if scores.get("scale", 0) == 0 and not _has_any(text, PRODUCT_TERMS):
+    if scores.get("scale", 0) == 0 and not _has_any(counts, PRODUCT_TERMS):
         return None
     confidence = 0.6
     explanation = (
@@ -299,25 +384,20 @@ def _evidence(signal: SignalEvent, triggers: list[str]) -> dict:
     }
 
 
-def _count_terms(text: str, terms: list[str]) -> int:
-    return sum(text.count(term) for term in terms)
+def _count_terms(counts: dict[str, int], terms: list[str]) -> int:
+    return sum(counts[term] for term in terms)
 
 
-def _has_any(text: str, terms: list[str]) -> bool:
-    return any(term in text for term in terms)
+def _has_any(counts: dict[str, int], terms: list[str]) -> bool:
+    return any(counts[term] for term in terms)
 
 
 def _apply_rules(signal: SignalEvent) -> list[dict]:
     signal_type = getattr(signal, "signal_type", None) or "job_post"
     text = signal.raw_text or ""
     hits: list[dict] = []
-    for rule in _RULE_PATTERNS:
-        if signal_type not in rule["signal_types"]:
-            continue
-        match = _first_match(rule["compiled"], text)
-        if not match:
-            continue
-        snippet = _extract_snippet(text, match)
+    for rule, found in _matcher_for(signal_type).find(text):
+        match = found.group(0)
         hits.append(
             {
                 "rule_name": rule["name"],
@@ -325,27 +405,32 @@ def _apply_rules(signal: SignalEvent) -> list[dict]:
                 "signal_type": signal_type,
                 "match": match,
                 "snippet": rule["snippet_template"].format(match=match),
-                "source_snippet": snippet,
+                "source_snippet": _extract_snippet(text, found.start(), found.end()),
             }
         )
     return hits
 
 
-def _first_match(patterns: list[re.Pattern], text: str) -> str | None:
-    for pattern in patterns:
-        found = pattern.search(text)
-        if found:
-            return found.group(0)
-    return None
+def _matcher_for(signal_type: str) -> RuleMatcher:
+    matcher = _MATCHERS.get(signal_type)
+    if matcher is None:
+        matcher = RuleMatcher(
+            [rule for rule in _RULE_PATTERNS if signal_type in rule["signal_types"]]
+        )
+        _MATCHERS[signal_type] = matcher
+    return matcher
+
+
+def _lower_literals(pattern: str) -> str:
+    def lower(found: re.Match) -> str:
+        token = found.group(0)
+        return token.lower() if len(token) == 1 else token
+
+    return re.sub(r"\\.|\(\?P<\w+>|[A-Z]", lower, pattern)
 
 
-def _extract_snippet(text: str, match: str, window: int = 120) -> str:
-    idx = text.lower().find(match.lower())
-    if idx == -1:
-        return text[:200]
-    start = max(0, idx - window)
-    end = min(len(text), idx + len(match) + window)
-    return text[start:end]
+def _extract_snippet(text: str, start: int, end: int, window: int = 120) -> str:
+    return text[max(0, start - window) : min(len(text), end + window)]
 
 
 def _readiness_score(rule_weight: float, drift_score: float, role_bucket_delta: float) -> float:
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, field
+import asyncio
+import logging
+import queue
+import threading
+
 from sqlalchemy.orm import Session
 
-from agents.signal_harvester.agent import SignalHarvesterAgent
+from agents.signal_harvester.agent import SignalHarvesterAgent, resolve_company_key
 from agents.intent_inference.agent import IntentInferenceAgent
 from agents.causal_memory.agent import CausalMemoryAgent
-from data.storage.repositories import signals_repo
-from data.storage.db import Company
+from data.connectors.http_client import AsyncHttpClient, CachedValidators, HttpCache
+from data.ingestion.fetcher import ASYNC_CONNECTORS, fetch_posts_async
+from data.storage.repositories import company_repo, fetch_state_repo, signals_repo
+from data.storage.db import Company, SessionLocal, SignalEvent
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineRunResult:
+    inserted: dict[int, int] = field(default_factory=dict)
+    errors: dict[int, str] = field(default_factory=dict)
 
 
 class Orchestrator:
@@ -16,17 +32,188 @@ class Orchestrator:
         self.inferencer = IntentInferenceAgent(session)
         self.causal = CausalMemoryAgent()
 
-    def run(self, companies: list[Company], source: str = "mock") -> dict[int, int]:
+    def run(
+        self,
+        companies: list[Company],
+        source: str = "mock",
+        rescore_window: int | None = None,
+    ) -> dict[int, int]:
         results: dict[int, int] = {}
-        sources = [item.strip() for item in source.split(",") if item.strip()]
+        sources = _parse_sources(source)
         for company in companies:
-            total_inserted = 0
-            for src in sources:
-                total_inserted += self.harvester.harvest(company, src)
-            recent_signals = signals_repo.list_recent_signals(
-                self.session, company.tenant_id, company.id, limit=50
+            results[company.id] = self._process_company(
+                company, sources, rescore_window=rescore_window
             )
-            intents = self.inferencer.infer(recent_signals)
-            self.causal.update_memory(intents, outcomes=[])
-            results[company.id] = total_inserted
         return results
+
+    def run_concurrent(
+        self,
+        companies: list[Company],
+        source: str = "mock",
+        workers: int = 4,
+        rescore_window: int | None = None,
+    ) -> PipelineRunResult:
+        sources = _parse_sources(source)
+        jobs = [
+            (
+                company.tenant_id,
+                company.id,
+                {
+                    src: resolve_company_key(company, src)
+                    for src in sources
+                    if src in ASYNC_CONNECTORS
+                },
+            )
+            for company in companies
+        ]
+        validators = {
+            key: {url: CachedValidators(**state) for url, state in states.items()}
+            for key, states in fetch_state_repo.load_states(
+                self.session, [(tenant_id, company_id) for tenant_id, company_id, _ in jobs]
+            ).items()
+        }
+        worker_count = max(1, min(workers, len(jobs)))
+        pending: queue.Queue = queue.Queue(maxsize=worker_count * 4)
+        result = PipelineRunResult()
+        lock = threading.Lock()
+
+        threads = [
+            threading.Thread(
+                target=_prefetch_companies,
+                args=(jobs, validators, pending, worker_count, result, lock),
+                name="pipeline-prefetch",
+                daemon=True,
+            )
+        ]
+        threads.extend(
+            threading.Thread(
+                target=self._worker,
+                args=(pending, sources, result, lock, rescore_window),
+                name=f"pipeline-worker-{idx}",
+                daemon=True,
+            )
+            for idx in range(worker_count)
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return result
+
+    def _worker(
+        self,
+        pending: queue.Queue,
+        sources: list[str],
+        result: PipelineRunResult,
+        lock: threading.Lock,
+        rescore_window: int | None = None,
+    ) -> None:
+        with SessionLocal() as session:
+            worker = Orchestrator(session)
+            worker.harvester.batch_drift_min_items = self.harvester.batch_drift_min_items
+            while True:
+                item = pending.get()
+                if item is None:
+                    return
+                tenant_id, company_id, prefetched, fetch_states = item
+                try:
+                    if isinstance(prefetched, BaseException):
+                        raise prefetched
+                    company = company_repo.get_company(session, tenant_id, company_id)
+                    if not company:
+                        raise ValueError(f"Company {company_id} not found")
+                    inserted = worker._process_company(
+                        company, sources, prefetched, rescore_window
+                    )
+                    fetch_state_repo.save_states(
+                        session,
+                        tenant_id,
+                        company_id,
+                        {url: asdict(state) for url, state in fetch_states.items()},
+                    )
+                except Exception as exc:
+                    session.rollback()
+                    logger.exception("Pipeline failed for company %s", company_id)
+                    with lock:
+                        result.errors[company_id] = str(exc)
+                else:
+                    with lock:
+                        result.inserted[company_id] = inserted
+
+    def _process_company(
+        self,
+        company: Company,
+        sources: list[str],
+        prefetched: dict[str, list[dict] | None] | None = None,
+        rescore_window: int | None = None,
+    ) -> int:
+        prefetched = prefetched or {}
+        new_signals: list[SignalEvent] = []
+        for src in sources:
+            if src in prefetched and prefetched[src] is None:
+                continue
+            new_signals.extend(
+                self.harvester.harvest_signals(company, src, prefetched.get(src))
+            )
+        if rescore_window:
+            intents = self.inferencer.rescore_window(
+                company.tenant_id, company.id, limit=rescore_window
+            )
+        else:
+            intents = self.inferencer.infer(
+                signals_repo.list_unscored_signals(self.session, company.tenant_id, company.id)
+            )
+        self.causal.update_memory(intents, outcomes=[])
+        return len(new_signals)
+
+
+def _prefetch_companies(
+    jobs: list[tuple[int, int, dict[str, str]]],
+    validators: dict[tuple[int, int], dict[str, CachedValidators]],
+    pending: queue.Queue,
+    worker_count: int,
+    result: PipelineRunResult,
+    lock: threading.Lock,
+) -> None:
+    enqueued: set[int] = set()
+    try:
+        asyncio.run(_prefetch(jobs, validators, pending, enqueued))
+    except Exception as exc:
+        logger.exception("Pipeline prefetch failed")
+        with lock:
+            for _, company_id, _ in jobs:
+                if company_id not in enqueued:
+                    result.errors[company_id] = str(exc)
+    finally:
+        for _ in range(worker_count):
+            pending.put(None)
+
+
+async def _prefetch(
+    jobs: list[tuple[int, int, dict[str, str]]],
+    validators: dict[tuple[int, int], dict[str, CachedValidators]],
+    pending: queue.Queue,
+    enqueued: set[int],
+) -> None:
+    loop = asyncio.get_running_loop()
+    in_flight = asyncio.Semaphore(max(1, pending.maxsize))
+    async with AsyncHttpClient() as client:
+
+        async def fetch_company(tenant_id: int, company_id: int, keys: dict[str, str]) -> None:
+            async with in_flight:
+                cache = HttpCache(entries=validators.get((tenant_id, company_id), {}))
+                prefetched: dict[str, list[dict] | None] | BaseException = {}
+                try:
+                    for src, company_key in keys.items():
+                        prefetched[src] = await fetch_posts_async(company_key, src, client, cache)
+                except Exception as exc:
+                    prefetched = exc
+                item = (tenant_id, company_id, prefetched, cache.updated)
+                await loop.run_in_executor(None, pending.put, item)
+                enqueued.add(company_id)
+
+        await asyncio.gather(*(fetch_company(*job) for job in jobs))
+
+
+def _parse_sources(source: str) -> list[str]:
+    return [item.strip() for item in source.split(",") if item.strip()]
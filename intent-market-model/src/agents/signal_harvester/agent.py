@@ -1,97 +1,176 @@
 from __future__ import annotations
 
+import copy
+
 from sqlalchemy.orm import Session
 
 from agents.base import AgentBase
-from agents.signal_harvester.features.semantic_drift import compute_drift
+from agents.signal_harvester.features.semantic_drift import VECTORIZER_VERSION, DriftBaseline
 from data.ingestion.fetcher import fetch_posts
 from data.ingestion.normalizer import normalize_post
 from data.ingestion.filings_normalizer import normalize_filing
 from data.connectors.sec_filings import fetch_filings
 from data.quality.dedupe import compute_signal_hash
 from data.storage.db import Company, SignalEvent
-from data.storage.repositories import signals_repo
+from data.storage.repositories import baselines_repo, signals_repo
+
+
+_BATCH_DRIFT_MIN_ITEMS = 8
+_FILING_SOURCES = {"sec_mock", "sec"}
 
 
 class SignalHarvesterAgent(AgentBase):
     name = "signal_harvester"
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self, session: Session, batch_drift_min_items: int = _BATCH_DRIFT_MIN_ITEMS
+    ) -> None:
         self.session = session
+        self.batch_drift_min_items = batch_drift_min_items
 
-    def harvest(self, company: Company, source: str) -> int:
-        raw_items, normalizer = _resolve_source(company, source)
+    def harvest(
+        self, company: Company, source: str, raw_items: list[dict] | None = None
+    ) -> int:
+        return len(self.harvest_signals(company, source, raw_items))
+
+    def harvest_signals(
+        self, company: Company, source: str, raw_items: list[dict] | None = None
+    ) -> list[SignalEvent]:
+        if raw_items is None:
+            raw_items = _fetch_source(company, source)
+        normalizer = _normalizer_for(source)
         if not raw_items:
-            return 0
+            return []
 
-        baseline_signals = signals_repo.list_baseline_signals(
-            self.session, company.tenant_id, company.id
-        )
-        baseline_texts: list[str] = []
-        baseline_role_counts: dict[str, int] = {}
-        baseline_tech_tags: set[str] = set()
-        for signal in baseline_signals:
-            baseline_texts.append(signal.raw_text)
-            role_bucket = signal.structured_fields.get("role_bucket")
-            if role_bucket:
-                baseline_role_counts[role_bucket] = baseline_role_counts.get(role_bucket, 0) + 1
-            baseline_tech_tags.update(signal.structured_fields.get("tech_tags", []))
-
-        inserted = 0
-        for item in raw_items:
-            normalized = normalizer(item)
-            event_hash = compute_signal_hash(
+        normalized_items = [normalizer(item) for item in raw_items]
+        event_hashes = [
+            compute_signal_hash(
                 company.id, source, normalized["raw_text"], normalized["timestamp"]
             )
-            if signals_repo.get_signal_by_hash(
-                self.session, company.tenant_id, company.id, event_hash
-            ):
+            for normalized in normalized_items
+        ]
+        seen_hashes = signals_repo.list_existing_hashes(
+            self.session, company.tenant_id, company.id, event_hashes
+        )
+        pending: list[tuple[dict, str]] = []
+        for normalized, event_hash in zip(normalized_items, event_hashes):
+            if event_hash in seen_hashes:
                 continue
+            seen_hashes.add(event_hash)
+            pending.append((normalized, event_hash))
+        if not pending:
+            return []
 
-            diff, tokens = compute_drift(
-                normalized["raw_text"],
-                normalized["signal_type"],
-                normalized["structured_fields"],
-                baseline_texts,
-                baseline_role_counts,
-                baseline_tech_tags,
-            )
+        baseline, last_signal_id, baseline_changed = _load_baseline(self.session, company)
+        drifts = _score_drift(
+            copy.deepcopy(baseline),
+            [normalized for normalized, _ in pending],
+            self.batch_drift_min_items,
+        )
+
+        signals = [
+            _build_signal(company, source, normalized, event_hash, diff, tokens)
+            for (normalized, event_hash), (diff, tokens) in zip(pending, drifts)
+        ]
+        inserted_ids = signals_repo.insert_signals(self.session, signals)
+        last_signal_id = max([last_signal_id, *inserted_ids])
+        inserted = [signal for signal in signals if signal.id is not None]
+        for signal in inserted:
+            baseline.add_tokens(signal.tokens, signal.structured_fields, signal.timestamp)
 
-            signal = SignalEvent(
-                tenant_id=company.tenant_id,
-                company_id=company.id,
-                source=source,
-                timestamp=normalized["timestamp"],
-                signal_type=normalized["signal_type"],
-                raw_text=normalized["raw_text"],
-                snippet=normalized["raw_text"][:240],
-                raw_text_uri=normalized.get("raw_text_uri"),
-                structured_fields=normalized["structured_fields"],
-                diff=diff,
-                vectorizer_version=diff["vectorizer_version"],
-                tokens=tokens,
-                drift_score=diff["drift_score"],
-                top_terms_delta=diff["top_terms_delta"],
-                role_bucket_delta=diff["role_bucket_delta"],
-                tech_tag_delta=diff["tech_tag_delta"],
-                event_hash=event_hash,
+        if inserted_ids or baseline_changed:
+            baselines_repo.save_baseline(
+                self.session,
+                company.tenant_id,
+                company.id,
+                VECTORIZER_VERSION,
+                baseline.to_snapshot(),
+                last_signal_id,
             )
-            if signals_repo.insert_signal(self.session, signal):
-                inserted += 1
-                baseline_texts.append(signal.raw_text)
-                role_bucket = signal.structured_fields.get("role_bucket")
-                if role_bucket:
-                    baseline_role_counts[role_bucket] = (
-                        baseline_role_counts.get(role_bucket, 0) + 1
-                    )
-                baseline_tech_tags.update(signal.structured_fields.get("tech_tags", []))
         return inserted
 
 
-def _resolve_source(company: Company, source: str):
-    company_key = company.domain or company.name
+def _load_baseline(session: Session, company: Company) -> tuple[DriftBaseline, int, bool]:
+    record = baselines_repo.get_baseline(
+        session, company.tenant_id, company.id, VECTORIZER_VERSION
+    )
+    if record:
+        baseline = DriftBaseline.from_snapshot(baselines_repo.to_snapshot(record))
+        last_signal_id = record.last_signal_id or 0
+    else:
+        baseline = DriftBaseline()
+        last_signal_id = 0
+
+    # Pick up signals inserted outside the harvester since the snapshot was saved.
+    caught_up = signals_repo.list_baseline_documents(
+        session, company.tenant_id, company.id, after_id=last_signal_id
+    )
+    for row in caught_up:
+        baseline.add(row.raw_text, row.structured_fields, row.timestamp)
+        last_signal_id = max(last_signal_id, row.id)
+
+    evicted = baseline.evict_before(signals_repo.baseline_window_start())
+    return baseline, last_signal_id, record is None or bool(caught_up) or evicted > 0
+
+
+def _score_drift(
+    baseline: DriftBaseline, items: list[dict], batch_min_items: int
+) -> list[tuple[dict, list[str]]]:
+    if len(items) >= batch_min_items:
+        return baseline.score_batch(items)
+    drifts: list[tuple[dict, list[str]]] = []
+    for item in items:
+        diff, tokens = baseline.score(
+            item["raw_text"], item["signal_type"], item["structured_fields"]
+        )
+        baseline.add_tokens(tokens, item["structured_fields"], item["timestamp"])
+        drifts.append((diff, tokens))
+    return drifts
+
+
+def _build_signal(
+    company: Company,
+    source: str,
+    normalized: dict,
+    event_hash: str,
+    diff: dict,
+    tokens: list[str],
+) -> SignalEvent:
+    return SignalEvent(
+        tenant_id=company.tenant_id,
+        company_id=company.id,
+        source=source,
+        timestamp=normalized["timestamp"],
+        signal_type=normalized["signal_type"],
+        raw_text=normalized["raw_text"],
+        snippet=normalized["raw_text"][:240],
+        raw_text_uri=normalized.get("raw_text_uri"),
+        structured_fields=normalized["structured_fields"],
+        diff=diff,
+        vectorizer_version=diff["vectorizer_version"],
+        tokens=tokens,
+        drift_score=diff["drift_score"],
+        top_terms_delta=diff["top_terms_delta"],
+        role_bucket_delta=diff["role_bucket_delta"],
+        tech_tag_delta=diff["tech_tag_delta"],
+        event_hash=event_hash,
+    )
+
+
+def resolve_company_key(company: Company, source: str) -> str:
     if source == "greenhouse" and company.greenhouse_board:
-        company_key = company.greenhouse_board
-    if source in {"sec_mock", "sec"}:
-        return fetch_filings(company_key), normalize_filing
-    return fetch_posts(company_key, source), normalize_post
+        return company.greenhouse_board
+    return company.domain or company.name
+
+
+def _fetch_source(company: Company, source: str) -> list[dict]:
+    company_key = resolve_company_key(company, source)
+    if source in _FILING_SOURCES:
+        return fetch_filings(company_key)
+    return fetch_posts(company_key, source)
+
+
+def _normalizer_for(source: str):
+    if source in _FILING_SOURCES:
+        return normalize_filing
+    return normalize_post
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from datetime import date, datetime
 from typing import Iterable
 import re
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
 
 from core.utils.text import KEYWORDS, ROLE_HINTS, TECH_STACK_TAGS, normalize_text, extract_tech_tags
+from core.utils.time import ensure_utc
 from data.storage.vector_store import cosine_similarity
 
 VECTORIZER_VERSION = "tfidf-v1"
@@ -32,6 +33,269 @@ def _build_vocab() -> list[str]:
 
 
 _VOCAB = _build_vocab()
+_VOCAB_INDEX = {term: idx for idx, term in enumerate(_VOCAB)}
+_BATCH_CHUNK_SIZE = 256
+
+
+def term_counts(tokens: Iterable[str]) -> np.ndarray:
+    counts = np.zeros(len(_VOCAB), dtype=np.float64)
+    for token in tokens:
+        idx = _VOCAB_INDEX.get(token)
+        if idx is not None:
+            counts[idx] += 1.0
+    return counts
+
+
+class DriftBaseline:
+    def __init__(self) -> None:
+        self.doc_freq = np.zeros(len(_VOCAB), dtype=np.float64)
+        self.role_counts: dict[str, int] = {}
+        self.tech_tag_counts: dict[str, int] = {}
+        self._rows = np.zeros((16, len(_VOCAB)), dtype=np.float64)
+        self._weights = np.zeros(16, dtype=np.float64)
+        self._row_index: dict[bytes, int] = {}
+        self._days: dict[date | None, dict] = {}
+        self._size = 0
+        self._doc_count = 0
+
+    @property
+    def doc_count(self) -> int:
+        return self._doc_count
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows[: self._size]
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights[: self._size]
+
+    @property
+    def tech_tags(self) -> set[str]:
+        return {tag for tag, count in self.tech_tag_counts.items() if count > 0}
+
+    def add(
+        self,
+        text: str,
+        structured_fields: dict | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        self.add_tokens(tokenize_text(text), structured_fields, timestamp)
+
+    def add_tokens(
+        self,
+        tokens: Iterable[str],
+        structured_fields: dict | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        self.add_counts(term_counts(tokens), structured_fields, timestamp)
+
+    def add_counts(
+        self,
+        counts: np.ndarray,
+        structured_fields: dict | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        row = self._row_for(counts)
+        self._weights[row] += 1
+        self._doc_count += 1
+        self.doc_freq += counts > 0
+        self._add_document(row, structured_fields or {}, timestamp)
+
+    def evict_before(self, cutoff: datetime) -> int:
+        # Documents are bucketed by UTC day, so a day leaves the window once it is
+        # entirely older than the cutoff.
+        cutoff_day = ensure_utc(cutoff).date()
+        evicted = 0
+        for day in [day for day in self._days if day is not None and day < cutoff_day]:
+            bucket = self._days.pop(day)
+            for row, count in bucket["rows"].items():
+                self._weights[row] -= count
+                self.doc_freq -= count * (self._rows[row] > 0)
+                evicted += count
+            for role_bucket, count in bucket["role_counts"].items():
+                _decrement(self.role_counts, role_bucket, count)
+            for tag, count in bucket["tech_tag_counts"].items():
+                _decrement(self.tech_tag_counts, tag, count)
+        if evicted:
+            self._doc_count -= evicted
+            self._compact()
+        return evicted
+
+    def _row_for(self, counts: np.ndarray) -> int:
+        key = counts.tobytes()
+        row = self._row_index.get(key)
+        if row is not None:
+            return row
+        if self._size == self._rows.shape[0]:
+            grown = np.zeros((self._size * 2, len(_VOCAB)))
+            grown[: self._size] = self.rows
+            self._rows = grown
+            self._weights = np.concatenate([self._weights, np.zeros(self._size)])
+        row = self._size
+        self._rows[row] = counts
+        self._row_index[key] = row
+        self._size += 1
+        return row
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self.weights > 0)
+        remap = {int(old): new for new, old in enumerate(keep)}
+        rows = self.rows[keep]
+        weights = self.weights[keep]
+        self._rows = np.zeros((max(len(keep), 16), len(_VOCAB)))
+        self._rows[: len(keep)] = rows
+        self._weights = np.zeros(self._rows.shape[0])
+        self._weights[: len(keep)] = weights
+        self._size = len(keep)
+        self._row_index = {row.tobytes(): idx for idx, row in enumerate(self.rows)}
+        for bucket in self._days.values():
+            bucket["rows"] = {remap[row]: count for row, count in bucket["rows"].items()}
+
+    def _add_document(
+        self, row: int, structured_fields: dict, timestamp: datetime | None
+    ) -> None:
+        role_bucket = structured_fields.get("role_bucket")
+        tech_tags = sorted(set(structured_fields.get("tech_tags", [])))
+        day = ensure_utc(timestamp).date() if timestamp else None
+        bucket = self._days.setdefault(
+            day, {"rows": {}, "role_counts": {}, "tech_tag_counts": {}}
+        )
+        bucket["rows"][row] = bucket["rows"].get(row, 0) + 1
+        if role_bucket:
+            self.role_counts[role_bucket] = self.role_counts.get(role_bucket, 0) + 1
+            bucket["role_counts"][role_bucket] = bucket["role_counts"].get(role_bucket, 0) + 1
+        for tag in tech_tags:
+            self.tech_tag_counts[tag] = self.tech_tag_counts.get(tag, 0) + 1
+            bucket["tech_tag_counts"][tag] = bucket["tech_tag_counts"].get(tag, 0) + 1
+
+    def score(
+        self, text: str, signal_type: str, structured_fields: dict
+    ) -> tuple[dict, list[str]]:
+        tokens = tokenize_text(text)
+        counts = term_counts(tokens)
+
+        drift_score = 0.0
+        top_terms_delta: list[dict[str, float | str]] = []
+        if self._doc_count:
+            idf = _smooth_idf(self.doc_freq + (counts > 0), self._doc_count + 1)
+            current_vec = _l2_normalize(counts * idf)
+            baseline_vec = _mean_normalized(self.rows, self.weights, idf)
+            similarity = cosine_similarity(current_vec.tolist(), baseline_vec.tolist())
+            drift_score = max(0.0, 1.0 - similarity)
+            top_terms_delta = _top_terms_delta(current_vec - baseline_vec)
+
+        diff = self._build_diff(
+            text, signal_type, structured_fields, drift_score, top_terms_delta
+        )
+        return diff, tokens
+
+    def score_batch(self, items: list[dict]) -> list[tuple[dict, list[str]]]:
+        token_lists = [tokenize_text(item["raw_text"]) for item in items]
+        if not token_lists:
+            return []
+        item_counts = np.vstack([term_counts(tokens) for tokens in token_lists])
+        prior_docs = self._doc_count
+        current_vecs, baseline_vecs, drift_scores = _score_prefixes(
+            self.rows, self.weights, self.doc_freq, item_counts
+        )
+
+        results: list[tuple[dict, list[str]]] = []
+        for idx, (item, tokens) in enumerate(zip(items, token_lists)):
+            drift_score = 0.0
+            top_terms_delta: list[dict[str, float | str]] = []
+            if prior_docs + idx:
+                drift_score = float(drift_scores[idx])
+                top_terms_delta = _top_terms_delta(current_vecs[idx] - baseline_vecs[idx])
+            structured_fields = item.get("structured_fields") or {}
+            diff = self._build_diff(
+                item["raw_text"],
+                item["signal_type"],
+                structured_fields,
+                drift_score,
+                top_terms_delta,
+            )
+            results.append((diff, tokens))
+            self.add_counts(item_counts[idx], structured_fields, item.get("timestamp"))
+        return results
+
+    def _build_diff(
+        self,
+        text: str,
+        signal_type: str,
+        structured_fields: dict,
+        drift_score: float,
+        top_terms_delta: list[dict[str, float | str]],
+    ) -> dict:
+        return {
+            "vectorizer_version": VECTORIZER_VERSION,
+            "drift_score": drift_score,
+            "top_terms_delta": top_terms_delta,
+            "role_bucket_delta": _role_bucket_delta(
+                signal_type, structured_fields, self.role_counts
+            ),
+            "tech_tag_delta": _tech_tag_delta(text, self.tech_tags),
+        }
+
+    def to_snapshot(self) -> dict:
+        return {
+            "doc_count": self._doc_count,
+            "doc_freq": self.doc_freq.tolist(),
+            "role_counts": dict(self.role_counts),
+            "tech_tag_counts": dict(self.tech_tag_counts),
+            "term_counts": [
+                {_VOCAB[idx]: int(row[idx]) for idx in np.flatnonzero(row)} for row in self.rows
+            ],
+            "day_buckets": [
+                {
+                    "day": day.isoformat() if day else None,
+                    "rows": [[row, count] for row, count in sorted(bucket["rows"].items())],
+                    "role_counts": dict(bucket["role_counts"]),
+                    "tech_tag_counts": dict(bucket["tech_tag_counts"]),
+                }
+                for day, bucket in self._days.items()
+            ],
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> DriftBaseline:
+        baseline = cls()
+        for terms in snapshot.get("term_counts", []):
+            counts = np.zeros(len(_VOCAB), dtype=np.float64)
+            for term, count in terms.items():
+                idx = _VOCAB_INDEX.get(term)
+                if idx is not None:
+                    counts[idx] = count
+            baseline._row_for(counts)
+        for entry in snapshot.get("day_buckets", []):
+            day = entry.get("day")
+            rows = {int(row): int(count) for row, count in entry["rows"]}
+            for row, count in rows.items():
+                baseline._weights[row] += count
+                baseline._doc_count += count
+            baseline._days[date.fromisoformat(day) if day else None] = {
+                "rows": rows,
+                "role_counts": dict(entry.get("role_counts", {})),
+                "tech_tag_counts": dict(entry.get("tech_tag_counts", {})),
+            }
+        baseline.doc_freq = np.array(snapshot["doc_freq"], dtype=np.float64)
+        baseline.role_counts = dict(snapshot.get("role_counts", {}))
+        baseline.tech_tag_counts = dict(snapshot.get("tech_tag_counts", {}))
+        return baseline
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        role_counts: dict[str, int] | None = None,
+        tech_tags: set[str] | None = None,
+    ) -> DriftBaseline:
+        baseline = cls()
+        for text in texts:
+            baseline.add(text)
+        baseline.role_counts = dict(role_counts or {})
+        baseline.tech_tag_counts = {tag: 1 for tag in tech_tags or set()}
+        return baseline
 
 
 def compute_drift(
@@ -42,56 +306,123 @@ def compute_drift(
     baseline_role_counts: dict[str, int],
     baseline_tech_tags: set[str],
 ) -> tuple[dict, list[str]]:
-    tokens = tokenize_text(text)
-
-    drift_score = 0.0
-    top_terms_delta: list[dict[str, float | str]] = []
-    if baseline_texts:
-        corpus = baseline_texts + [text]
-        vectorizer = TfidfVectorizer(
-            vocabulary=_VOCAB,
-            tokenizer=tokenize_text,
-            lowercase=False,
-            token_pattern=None,
+    baseline = DriftBaseline.from_texts(baseline_texts, baseline_role_counts, baseline_tech_tags)
+    return baseline.score(text, signal_type, structured_fields)
+
+
+def compute_drift_batch(
+    items: list[dict],
+    baseline_texts: list[str],
+    baseline_role_counts: dict[str, int],
+    baseline_tech_tags: set[str],
+) -> list[tuple[dict, list[str]]]:
+    baseline = DriftBaseline.from_texts(baseline_texts, baseline_role_counts, baseline_tech_tags)
+    return baseline.score_batch(items)
+
+
+def _score_prefixes(
+    rows: np.ndarray, weights: np.ndarray, doc_freq: np.ndarray, counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Item p is scored against the baseline rows plus items [0, p) with IDF fitted on
+    # the baseline plus items [0, p].
+    prior = rows.shape[0]
+    prior_docs = weights.sum()
+    prefix = np.vstack([rows, counts])
+    prefix_weights = np.concatenate([weights, np.ones(counts.shape[0])])
+    item_doc_freq = doc_freq + np.cumsum(counts > 0, axis=0)
+    current_vecs = np.zeros(counts.shape)
+    baseline_vecs = np.zeros_like(current_vecs)
+    for start in range(0, counts.shape[0], _BATCH_CHUNK_SIZE):
+        stop = min(start + _BATCH_CHUNK_SIZE, counts.shape[0])
+        positions = np.arange(start, stop)
+        idf = _smooth_idf(item_doc_freq[start:stop], prior_docs + positions[:, None] + 1)
+
+        window = prefix[: prior + stop]
+        norms = np.sqrt((window * window) @ (idf * idf).T)
+        scaled = np.divide(
+            prefix_weights[: prior + stop, None],
+            norms,
+            out=np.zeros_like(norms),
+            where=norms > 0,
         )
-        tfidf = vectorizer.fit_transform(corpus)
-        current_vec = tfidf[-1].toarray()[0]
-        baseline_vec = tfidf[:-1].mean(axis=0).A1
-        similarity = cosine_similarity(current_vec.tolist(), baseline_vec.tolist())
-        drift_score = max(0.0, 1.0 - similarity)
-
-        delta = current_vec - baseline_vec
-        top_idx = np.argsort(delta)[::-1]
-        terms = vectorizer.get_feature_names_out()
-        for idx in top_idx[:10]:
-            if delta[idx] <= 0:
-                break
-            top_terms_delta.append({"term": terms[idx], "delta": float(delta[idx])})
-
-    role_bucket_delta: dict[str, float] = {}
-    if signal_type == "job_post":
-        bucket = structured_fields.get("role_bucket", "other")
-        baseline_total = sum(baseline_role_counts.values())
-        baseline_share = (
-            baseline_role_counts.get(bucket, 0) / baseline_total if baseline_total else 0.0
+        scaled[np.arange(prior + stop)[:, None] >= prior + positions[None, :]] = 0.0
+        baseline = (scaled.T @ window) * idf
+        baseline /= np.maximum(prior_docs + positions, 1)[:, None]
+
+        current = counts[start:stop] * idf
+        current_norms = np.sqrt(np.einsum("ij,ij->i", current, current))[:, None]
+        current = np.divide(
+            current, current_norms, out=np.zeros_like(current), where=current_norms > 0
         )
-        role_bucket_delta = {bucket: 1.0 - baseline_share}
+        current_vecs[start:stop] = current
+        baseline_vecs[start:stop] = baseline
+
+    denom = np.linalg.norm(current_vecs, axis=1) * np.linalg.norm(baseline_vecs, axis=1)
+    similarity = np.divide(
+        np.einsum("ij,ij->i", current_vecs, baseline_vecs),
+        denom,
+        out=np.zeros_like(denom),
+        where=denom > 0,
+    )
+    return current_vecs, baseline_vecs, np.maximum(0.0, 1.0 - similarity)
+
+
+def _decrement(counts: dict[str, int], key: str, amount: int = 1) -> None:
+    remaining = counts.get(key, 0) - amount
+    if remaining > 0:
+        counts[key] = remaining
+    else:
+        counts.pop(key, None)
 
+
+def _smooth_idf(doc_freq: np.ndarray, n_docs: int) -> np.ndarray:
+    # Same smoothing as TfidfVectorizer(smooth_idf=True).
+    return np.log((n_docs + 1) / (doc_freq + 1)) + 1.0
+
+
+def _l2_normalize(vec: np.ndarray) -> np.ndarray:
+    norm = np.sqrt(np.dot(vec, vec))
+    if norm == 0:
+        return vec
+    return vec / norm
+
+
+def _mean_normalized(rows: np.ndarray, weights: np.ndarray, idf: np.ndarray) -> np.ndarray:
+    weighted = rows * idf
+    norms = np.sqrt(np.einsum("ij,ij->i", weighted, weighted))
+    scaled = np.divide(weights, norms, out=np.zeros_like(norms), where=norms > 0)
+    return (scaled @ weighted) / weights.sum()
+
+
+def _top_terms_delta(delta: np.ndarray, limit: int = 10) -> list[dict[str, float | str]]:
+    top_terms: list[dict[str, float | str]] = []
+    for idx in np.argsort(delta)[::-1][:limit]:
+        if delta[idx] <= 0:
+            break
+        top_terms.append({"term": _VOCAB[idx], "delta": float(delta[idx])})
+    return top_terms
+
+
+def _role_bucket_delta(
+    signal_type: str, structured_fields: dict, baseline_role_counts: dict[str, int]
+) -> dict[str, float]:
+    if signal_type != "job_post":
+        return {}
+    bucket = structured_fields.get("role_bucket", "other")
+    baseline_total = sum(baseline_role_counts.values())
+    baseline_share = (
+        baseline_role_counts.get(bucket, 0) / baseline_total if baseline_total else 0.0
+    )
+    return {bucket: 1.0 - baseline_share}
+
+
+def _tech_tag_delta(text: str, baseline_tech_tags: set[str]) -> dict[str, list[str]]:
     current_tags = set(extract_tech_tags(text))
-    tech_tag_delta = {
+    return {
         "added": sorted(current_tags - baseline_tech_tags),
         "removed": sorted(baseline_tech_tags - current_tags),
     }
 
-    diff = {
-        "vectorizer_version": VECTORIZER_VERSION,
-        "drift_score": drift_score,
-        "top_terms_delta": top_terms_delta,
-        "role_bucket_delta": role_bucket_delta,
-        "tech_tag_delta": tech_tag_delta,
-    }
-    return diff, tokens
-
 
 def aggregate_baseline(signals: Iterable[dict]) -> tuple[list[str], dict[str, int], set[str]]:
     texts: list[str] = []
@@ -3,31 +3,42 @@ from __future__ import annotations
 import time
 from datetime import datetime, timezone
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from data.storage.db import AuditLog, SessionLocal
+from app.services.audit_sink import audit_sink
 
 
-class AuditLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class AuditLogMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         started = time.perf_counter()
-        response = await call_next(request)
-        duration_ms = int((time.perf_counter() - started) * 1000)
-
-        api_key_id = getattr(request.state, "api_key_id", None)
-        tenant_id = getattr(request.state, "tenant_id", None)
-        with SessionLocal() as session:
-            session.add(
-                AuditLog(
-                    api_key_id=api_key_id,
-                    tenant_id=tenant_id,
-                    method=request.method,
-                    path=request.url.path,
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                    created_at=datetime.now(timezone.utc),
-                )
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            state = scope.get("state", {})
+            audit_sink.record(
+                {
+                    "api_key_id": state.get("api_key_id"),
+                    "tenant_id": state.get("tenant_id"),
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                    "created_at": datetime.now(timezone.utc),
+                }
             )
-            session.commit()
-        return response
@@ -9,7 +9,7 @@ from agents.intent_inference.agent import IntentInferenceAgent
 from app.schemas.company import CompanyCreate, CompanyRead
 from app.schemas.explain import ExplainResponse
 from app.schemas.signal_event import SignalEventRead
-from app.services.cache_service import invalidate_cache_prefix
+from app.services.cache_service import invalidate_cache
 from data.storage.db import SignalEvent, get_session
 from data.storage.repositories import company_repo, intents_repo, signals_repo
 
@@ -49,18 +49,14 @@ def ingest_company_signals(
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     harvester = SignalHarvesterAgent(session)
-    inserted = harvester.harvest(company, source)
+    new_signals = harvester.harvest_signals(company, source)
     intents_created = 0
     if infer:
-        recent_signals = signals_repo.list_recent_signals(
-            session, tenant_id, company_id, limit=50
-        )
         inferencer = IntentInferenceAgent(session)
-        intents_created = len(inferencer.infer(recent_signals))
-    invalidate_cache_prefix(session, f"dashboard:{tenant_id}:{company_id}")
-    invalidate_cache_prefix(session, f"timeline:{tenant_id}:{company_id}")
-    invalidate_cache_prefix(session, f"timeline:ipo_prep:{tenant_id}:{company_id}")
-    return {"inserted": inserted, "intents_created": intents_created}
+        intents_created = len(inferencer.infer(new_signals))
+    for namespace in ("dashboard", "timeline", "ipo_prep_timeline"):
+        invalidate_cache(session, namespace, tenant_id, company_id)
+    return {"inserted": len(new_signals), "intents_created": intents_created}
 
 
 @router.get("/{company_id}/signals/recent", response_model=list[SignalEventRead])
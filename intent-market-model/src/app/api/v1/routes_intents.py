@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.schemas.intent import IntentDashboard, IntentDashboardItem, IntentHypothesisRead, IntentSummary
-from app.services.cache_service import get_cached_response, set_cached_response
+from app.services.cache_service import CacheKey, get_cached_response, set_cached_response
 from app.services.translator_service import TranslatorService
 from data.storage.db import get_session
 from data.storage.repositories import company_repo, intents_repo
@@ -48,7 +48,7 @@ def intent_dashboard(tenant_id: int, company_id: int, session: Session = Depends
     company = company_repo.get_company(session, tenant_id, company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    cache_key = f"dashboard:{tenant_id}:{company_id}"
+    cache_key = CacheKey("dashboard", tenant_id, company_id)
     cached = get_cached_response(session, cache_key)
     if cached:
         return cached
@@ -15,11 +15,12 @@ router = APIRouter()
 def run_pipeline(
     tenant_id: int,
     source: str = Query(default="mock"),
+    rescore_window: int | None = Query(default=None, ge=1, le=1000),
     session: Session = Depends(get_session),
 ):
     companies = company_repo.list_companies(session, tenant_id)
     orchestrator = Orchestrator(session)
-    results = orchestrator.run(companies, source=source)
+    results = orchestrator.run(companies, source=source, rescore_window=rescore_window)
     return {"processed": len(results), "inserted": results}
 
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.schemas.api_key import ApiKeyCreate, ApiKeyCreated, ApiKeyRead
 from app.schemas.tenant import TenantCreate, TenantRead
+from app.services.api_key_cache import api_key_cache
 from core.utils.hashing import hash_string
 from data.storage.db import get_session
 from data.storage.db import ApiKey
@@ -50,6 +51,7 @@ def create_api_key(
         rate_limit_per_min=payload.rate_limit_per_min or 60,
     )
     api_key = api_keys_repo.create_api_key(session, api_key)
+    api_key_cache.invalidate(key_hash=api_key.key_hash)
     return ApiKeyCreated(
         id=api_key.id,
         tenant_id=api_key.tenant_id,
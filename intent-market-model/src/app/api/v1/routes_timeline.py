@@ -12,7 +12,7 @@ from app.schemas.timeline import (
     ReadinessTimeline,
     ReadinessTimelinePoint,
 )
-from app.services.cache_service import get_cached_response, set_cached_response
+from app.services.cache_service import CacheKey, get_cached_response, set_cached_response
 from data.storage.db import SignalEvent, get_session
 from data.storage.repositories import company_repo, intents_repo
 
@@ -29,7 +29,7 @@ def intent_timeline(
     company = company_repo.get_company(session, tenant_id, company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    cache_key = f"timeline:{tenant_id}:{company_id}:{days}"
+    cache_key = CacheKey("timeline", tenant_id, company_id, str(days))
     cached = get_cached_response(session, cache_key)
     if cached:
         return cached
@@ -61,7 +61,7 @@ def ipo_prep_timeline(
     company = company_repo.get_company(session, tenant_id, company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    cache_key = f"timeline:ipo_prep:{tenant_id}:{company_id}:{days}"
+    cache_key = CacheKey("ipo_prep_timeline", tenant_id, company_id, str(days))
     cached = get_cached_response(session, cache_key)
     if cached:
         return cached
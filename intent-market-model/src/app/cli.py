@@ -3,10 +3,12 @@ from __future__ import annotations
 import typer
 
 from agents.intent_inference.agent import IntentInferenceAgent
+from agents.intent_inference.rescoring import plan_rescore, run_rescore
 from agents.signal_harvester.agent import SignalHarvesterAgent
 from agents.orchestrator import Orchestrator
-from data.storage.db import SessionLocal
-from data.storage.repositories import company_repo, signals_repo
+from data.storage.db import SessionLocal, engine
+from data.storage.migrator import run_migrations
+from data.storage.repositories import company_repo, intent_summary_repo, signals_repo
 
 app = typer.Typer(help="Intent-Level Market Model CLI")
 
@@ -23,18 +25,62 @@ def ingest(tenant_id: int, company_id: int, source: str = "mock") -> None:
 
 
 @app.command()
-def infer(tenant_id: int, company_id: int) -> None:
+def infer(tenant_id: int, company_id: int, window: int = 50) -> None:
     with SessionLocal() as session:
-        signals = signals_repo.list_recent_signals(session, tenant_id, company_id, limit=50)
+        signals = signals_repo.list_recent_signals(session, tenant_id, company_id, limit=window)
         agent = IntentInferenceAgent(session)
         intents = agent.infer(signals)
         typer.echo(f"Inserted {len(intents)} intents")
 
 
 @app.command()
-def pipeline(tenant_id: int, source: str = "mock") -> None:
+def pipeline(
+    tenant_id: int, source: str = "mock", rescore_window: int | None = typer.Option(None)
+) -> None:
     with SessionLocal() as session:
         companies = company_repo.list_companies(session, tenant_id)
         orchestrator = Orchestrator(session)
-        results = orchestrator.run(companies, source=source)
+        results = orchestrator.run(companies, source=source, rescore_window=rescore_window)
         typer.echo(results)
+
+
+@app.command("rebuild-summaries")
+def rebuild_summaries(tenant_id: int | None = typer.Option(None)) -> None:
+    with SessionLocal() as session:
+        rows = intent_summary_repo.rebuild_intent_summaries(session, tenant_id)
+        typer.echo(f"Rebuilt {rows} summary rows")
+
+
+@app.command()
+def migrate() -> None:
+    applied = run_migrations(engine)
+    for migration in applied:
+        typer.echo(f"Applied {migration.path.name}")
+    typer.echo(f"{len(applied)} migrations applied")
+
+
+@app.command()
+def rescore(
+    tenant_id: int | None = typer.Option(None),
+    from_version: str | None = typer.Option(None),
+    workers: int | None = typer.Option(None),
+    batch_size: int | None = typer.Option(None),
+    dry_run: bool = typer.Option(False),
+) -> None:
+    with SessionLocal() as session:
+        plan = plan_rescore(session, tenant_id=tenant_id, from_version=from_version)
+    typer.echo(
+        f"Rule set {plan.to_version}: {plan.signal_count} signals across "
+        f"{len(plan.signals)} companies affected by {', '.join(plan.changed_rules) or 'no rule changes'}"
+    )
+    if dry_run:
+        return
+    result = run_rescore(plan, workers=workers, batch_size=batch_size)
+    typer.echo(
+        f"Rescored {result.signals} signals into {result.intents} intents, "
+        f"restamped {result.stamped} unchanged intents"
+    )
+    for company_id, error in result.errors.items():
+        typer.echo(f"Company {company_id} failed: {error}")
+    if result.errors:
+        raise typer.Exit(code=1)
@@ -15,6 +15,11 @@ const timelineEl = document.getElementById("intent-timeline");
 const backtestPortfolioSummary = document.getElementById("backtest-portfolio-summary");
 const backtestPortfolioTable = document.getElementById("backtest-portfolio-table");
 const watchlistTable = document.getElementById("watchlist-table");
+const watchlistPrev = document.getElementById("watchlist-prev");
+const watchlistNext = document.getElementById("watchlist-next");
+const watchlistRange = document.getElementById("watchlist-range");
+const WATCHLIST_PAGE_SIZE = 100;
+const watchlistPage = { tenantId: null, offset: 0, total: 0, nextOffset: null };
 const readinessTimeline = document.getElementById("readiness-timeline");
 const explainPanel = document.getElementById("explain-panel");
 
@@ -470,8 +475,24 @@ const loadBacktestPortfolio = async (tenantId) => {
   });
 };
 
-const loadWatchlist = async (tenantId) => {
-  const data = await api(`/tenants/${tenantId}/watchlist`);
+const renderWatchlistPager = () => {
+  const { offset, total, nextOffset } = watchlistPage;
+  watchlistPrev.disabled = offset === 0;
+  watchlistNext.disabled = nextOffset === null;
+  watchlistRange.textContent = total
+    ? `${offset + 1}–${Math.min(offset + WATCHLIST_PAGE_SIZE, total)} of ${total} companies`
+    : "";
+};
+
+const loadWatchlist = async (tenantId, offset = 0) => {
+  const data = await api(
+    `/tenants/${tenantId}/watchlist?limit=${WATCHLIST_PAGE_SIZE}&offset=${offset}`
+  );
+  watchlistPage.tenantId = tenantId;
+  watchlistPage.offset = data.offset;
+  watchlistPage.total = data.total;
+  watchlistPage.nextOffset = data.next_offset;
+  renderWatchlistPager();
   watchlistTable.innerHTML = "";
   if (!data.items || !data.items.length) {
     watchlistTable.innerHTML = "<p>No companies yet. Add a company to get started.</p>";
@@ -614,6 +635,18 @@ const bind = () => {
   document.getElementById("run-backtest").addEventListener("click", () => {
     runBacktest().catch((err) => setStatus(backtestStatus, err.message, "#d84845"));
   });
+  watchlistPrev.addEventListener("click", () => {
+    const offset = Math.max(0, watchlistPage.offset - WATCHLIST_PAGE_SIZE);
+    loadWatchlist(watchlistPage.tenantId, offset).catch((err) =>
+      setStatus(tenantStatus, err.message, "#d84845")
+    );
+  });
+  watchlistNext.addEventListener("click", () => {
+    if (watchlistPage.nextOffset === null) return;
+    loadWatchlist(watchlistPage.tenantId, watchlistPage.nextOffset).catch((err) =>
+      setStatus(tenantStatus, err.message, "#d84845")
+    );
+  });
 };
 
 bind();
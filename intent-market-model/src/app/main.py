@@ -18,6 +18,9 @@ from app.api.v1.routes_tenants import router as tenants_router
 from app.api.v1.routes_watchlist import router as watchlist_router
 from app.api.middleware.auth import ApiKeyAuthMiddleware
 from app.api.middleware.audit import AuditLogMiddleware
+from app.services.api_key_cache import api_key_cache
+from app.services.audit_sink import audit_sink
+from app.services.cache_service import cache_maintenance
 from core.config import get_settings
 from core.logger import setup_logging
 from data.storage.db import init_db, SessionLocal
@@ -37,6 +40,9 @@ app.add_middleware(AuditLogMiddleware)
 @app.on_event("startup")
 def on_startup() -> None:
     init_db()
+    api_key_cache.start_flusher(SessionLocal)
+    audit_sink.start(SessionLocal)
+    cache_maintenance.start(SessionLocal)
     settings = get_settings()
     if settings.enable_scheduler:
         thread = threading.Thread(
@@ -47,6 +53,13 @@ def on_startup() -> None:
         thread.start()
 
 
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    api_key_cache.stop_flusher(SessionLocal)
+    audit_sink.stop()
+    cache_maintenance.stop()
+
+
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
@@ -76,10 +89,19 @@ def _scheduler_loop(interval_hours: int, source: str) -> None:
             with SessionLocal() as session:
                 tenants = tenant_repo.list_tenants(session)
                 orchestrator = Orchestrator(session)
-                for tenant in tenants:
-                    companies = company_repo.list_companies(session, tenant.id)
-                    orchestrator.run(companies, source=source)
-                logger.info("Scheduled pipeline run completed")
+                companies = [
+                    company
+                    for tenant in tenants
+                    for company in company_repo.list_companies(session, tenant.id)
+                ]
+                result = orchestrator.run_concurrent(
+                    companies, source=source, workers=get_settings().pipeline_workers
+                )
+                logger.info(
+                    "Scheduled pipeline run completed (%d companies, %d failed)",
+                    len(result.inserted) + len(result.errors),
+                    len(result.errors),
+                )
         except Exception as exc:
             logger.exception("Scheduled pipeline run failed: %s", exc)
         time.sleep(sleep_seconds)
@@ -18,4 +18,8 @@ class WatchlistItem(BaseModel):
 
 class WatchlistResponse(BaseModel):
     tenant_id: int
+    total: int
+    limit: int
+    offset: int
+    next_offset: int | None
     items: list[WatchlistItem]
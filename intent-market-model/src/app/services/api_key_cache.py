@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import threading
+import time
+from typing import Callable
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from core.config import get_settings
+from core.utils.time import utc_now
+from data.storage.db import ApiKey
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedApiKey:
+    id: int
+    tenant_id: int
+    rate_limit_per_min: int
+
+    @classmethod
+    def from_record(cls, record: ApiKey) -> CachedApiKey:
+        return cls(
+            id=record.id,
+            tenant_id=record.tenant_id,
+            rate_limit_per_min=record.rate_limit_per_min or 60,
+        )
+
+
+class ApiKeyCache:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        touch_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.touch_interval_seconds = touch_interval_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[CachedApiKey | None, float]] = OrderedDict()
+        self._pending_touches: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def lookup(self, key_hash: str) -> tuple[bool, CachedApiKey | None]:
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry and entry[1] > self._clock():
+                self._entries.move_to_end(key_hash)
+                return True, entry[0]
+        return False, None
+
+    def resolve(
+        self, key_hash: str, loader: Callable[[str], CachedApiKey | None]
+    ) -> CachedApiKey | None:
+        found, api_key = self.lookup(key_hash)
+        if found:
+            return api_key
+        api_key = loader(key_hash)
+        with self._lock:
+            self._entries[key_hash] = (api_key, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return api_key
+
+    def invalidate(self, key_hash: str | None = None, api_key_id: int | None = None) -> None:
+        with self._lock:
+            if key_hash is not None:
+                self._entries.pop(key_hash, None)
+            if api_key_id is not None:
+                for cached_hash, (api_key, _) in list(self._entries.items()):
+                    if api_key and api_key.id == api_key_id:
+                        del self._entries[cached_hash]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending_touches.clear()
+
+    def touch(self, api_key_id: int) -> None:
+        with self._lock:
+            self._pending_touches[api_key_id] = utc_now()
+
+    def flush(self, session_factory: Callable[[], Session]) -> int:
+        with self._lock:
+            touches, self._pending_touches = self._pending_touches, {}
+        if not touches:
+            return 0
+        try:
+            with session_factory() as session:
+                session.execute(
+                    update(ApiKey),
+                    [
+                        {"id": api_key_id, "last_used_at": last_used_at}
+                        for api_key_id, last_used_at in touches.items()
+                    ],
+                )
+                session.commit()
+        except Exception:
+            with self._lock:
+                for api_key_id, last_used_at in touches.items():
+                    self._pending_touches.setdefault(api_key_id, last_used_at)
+            raise
+        return len(touches)
+
+    def start_flusher(self, session_factory: Callable[[], Session]) -> None:
+        if self._flusher and self._flusher.is_alive():
+            return
+        self._stop.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            args=(session_factory,),
+            name="api-key-touch-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def stop_flusher(self, session_factory: Callable[[], Session]) -> None:
+        self._stop.set()
+        if self._flusher:
+            self._flusher.join()
+            self._flusher = None
+        self.flush(session_factory)
+
+    def _flush_loop(self, session_factory: Callable[[], Session]) -> None:
+        while not self._stop.wait(self.touch_interval_seconds):
+            try:
+                self.flush(session_factory)
+            except Exception:
+                logger.exception("Failed to flush API key last_used_at updates")
+
+
+settings = get_settings()
+api_key_cache = ApiKeyCache(
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+    max_entries=settings.api_key_cache_max_entries,
+    touch_interval_seconds=settings.api_key_touch_interval_seconds,
+)
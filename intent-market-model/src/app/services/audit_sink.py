@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from core.config import get_settings
+from data.storage.db import AuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class AuditSink:
+    def __init__(self, max_queue: int, batch_size: int, flush_interval_ms: int) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.dropped = 0
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: threading.Thread | None = None
+
+    def record(self, entry: dict) -> bool:
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        if self._writer and self._writer.is_alive():
+            return
+        self._stop.clear()
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            args=(session_factory,),
+            name="audit-log-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        if not self._writer:
+            return
+        self._stop.set()
+        self._writer.join(timeout)
+        self._writer = None
+
+    def _write_loop(self, session_factory: Callable[[], Session]) -> None:
+        batch: list[dict] = []
+        deadline = None
+        while True:
+            timeout = self.flush_interval
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None
+            if self._stop.is_set():
+                if entry is not None:
+                    batch.append(entry)
+                batch.extend(_drain(self._queue))
+                for start in range(0, len(batch), self.batch_size):
+                    self._flush(session_factory, batch[start : start + self.batch_size])
+                return
+            if entry is not None:
+                batch.append(entry)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size or (
+                batch and deadline is not None and time.monotonic() >= deadline
+            ):
+                self._flush(session_factory, batch)
+                batch = []
+                deadline = None
+
+    def _flush(self, session_factory: Callable[[], Session], batch: list[dict]) -> None:
+        if not batch:
+            return
+        try:
+            with session_factory() as session:
+                session.execute(insert(AuditLog), batch)
+                session.commit()
+        except Exception:
+            logger.exception("Failed to write %d audit log records", len(batch))
+            with self._lock:
+                self.dropped += len(batch)
+            return
+        with self._lock:
+            self.written += len(batch)
+
+
+def _drain(pending: queue.Queue) -> list[dict]:
+    entries: list[dict] = []
+    while True:
+        try:
+            entry = pending.get_nowait()
+        except queue.Empty:
+            return entries
+        entries.append(entry)
+
+
+settings = get_settings()
+audit_sink = AuditSink(
+    max_queue=settings.audit_queue_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval_ms=settings.audit_flush_interval_ms,
+)
@@ -1,45 +1,258 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import logging
+import threading
+from typing import Callable
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
-from data.storage.db import ResponseCache
+from core.config import get_settings
+from core.utils.time import ensure_utc
+from data.storage.db import ResponseCache, ResponseCacheGeneration
+from data.storage.repositories._columns import dialect_insert
 
+logger = logging.getLogger(__name__)
 
-def get_cached_response(session: Session, cache_key: str) -> dict | None:
-    now = datetime.now(timezone.utc)
-    record = (
-        session.execute(
-            select(ResponseCache)
-            .where(ResponseCache.cache_key == cache_key)
-            .where(ResponseCache.expires_at > now)
+_TENANT_SCOPE = 0
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    namespace: str
+    tenant_id: int
+    company_id: int | None = None
+    variant: str = ""
+
+    def __str__(self) -> str:
+        return f"{self.namespace}:{self.tenant_id}:{self.company_id}:{self.variant}"
+
+    def in_scope(self, namespace: str, tenant_id: int, company_id: int | None) -> bool:
+        if self.namespace != namespace or self.tenant_id != tenant_id:
+            return False
+        return company_id is None or self.company_id == company_id
+
+
+class LocalResponseCache:
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.max_entries = max_entries
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.stats = {"local_hits": 0, "db_hits": 0, "misses": 0, "evictions": 0}
+        self._entries: OrderedDict[CacheKey, tuple[dict, datetime, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, cache_key: CacheKey, now: datetime, generation: int) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if not entry:
+                return None
+            if entry[1] <= now or entry[2] != generation:
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            self.stats["local_hits"] += 1
+            return entry[0]
+
+    def put(
+        self,
+        cache_key: CacheKey,
+        payload: dict,
+        expires_at: datetime,
+        now: datetime,
+        generation: int,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[cache_key] = (payload, min(expires_at, now + self.ttl), generation)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, namespace: str, tenant_id: int, company_id: int | None) -> None:
+        with self._lock:
+            for cache_key in [
+                key for key in self._entries if key.in_scope(namespace, tenant_id, company_id)
+            ]:
+                del self._entries[cache_key]
+
+    def record(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheMaintenance:
+    def __init__(self, interval_seconds: float, max_entries: int) -> None:
+        self.interval_seconds = interval_seconds
+        self.max_entries = max_entries
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self, session: Session) -> dict[str, int]:
+        return {
+            "expired": sweep_expired(session),
+            "evicted": enforce_max_entries(session, self.max_entries),
+        }
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(session_factory,),
+            name="response-cache-maintenance",
+            daemon=True,
         )
-        .scalars()
-        .first()
-    )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _loop(self, session_factory: Callable[[], Session]) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                with session_factory() as session:
+                    removed = self.run_once(session)
+                if removed["expired"] or removed["evicted"]:
+                    logger.info(
+                        "Response cache sweep removed %d expired and %d excess rows",
+                        removed["expired"],
+                        removed["evicted"],
+                    )
+            except Exception:
+                logger.exception("Response cache maintenance failed")
+
+
+settings = get_settings()
+local_cache = LocalResponseCache(
+    max_entries=settings.response_cache_local_max_entries,
+    ttl_seconds=settings.response_cache_local_ttl_seconds,
+)
+cache_maintenance = CacheMaintenance(
+    interval_seconds=settings.response_cache_sweep_interval_seconds,
+    max_entries=settings.response_cache_max_entries,
+)
+
+
+def get_cached_response(session: Session, cache_key: CacheKey) -> dict | None:
+    now = datetime.now(timezone.utc)
+    generation = cache_generation(session, cache_key)
+    payload = local_cache.get(cache_key, now, generation)
+    if payload is not None:
+        return payload
+    record = session.execute(
+        select(ResponseCache.payload, ResponseCache.expires_at)
+        .where(ResponseCache.cache_key == str(cache_key))
+        .where(ResponseCache.expires_at > now)
+    ).first()
     if not record:
+        local_cache.record("misses")
         return None
+    local_cache.record("db_hits")
+    local_cache.put(cache_key, record.payload, ensure_utc(record.expires_at), now, generation)
     return record.payload
 
 
-def set_cached_response(session: Session, cache_key: str, payload: dict, ttl_seconds: int = 600) -> None:
-    expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
-    record = (
-        session.execute(select(ResponseCache).where(ResponseCache.cache_key == cache_key))
-        .scalars()
-        .first()
+def set_cached_response(
+    session: Session, cache_key: CacheKey, payload: dict, ttl_seconds: int = 600
+) -> None:
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    statement = dialect_insert(session)(ResponseCache).values(
+        cache_key=str(cache_key),
+        namespace=cache_key.namespace,
+        tenant_id=cache_key.tenant_id,
+        company_id=cache_key.company_id,
+        payload=payload,
+        expires_at=expires_at,
+        created_at=now,
     )
-    if record:
-        record.payload = payload
-        record.expires_at = expires_at
-    else:
-        record = ResponseCache(cache_key=cache_key, payload=payload, expires_at=expires_at)
-        session.add(record)
+    statement = statement.on_conflict_do_update(
+        index_elements=["cache_key"],
+        set_={"payload": statement.excluded.payload, "expires_at": statement.excluded.expires_at},
+    )
+    generation = cache_generation(session, cache_key)
+    session.execute(statement)
     session.commit()
+    local_cache.put(cache_key, payload, expires_at, now, generation)
 
 
-def invalidate_cache_prefix(session: Session, prefix: str) -> None:
-    session.execute(delete(ResponseCache).where(ResponseCache.cache_key.like(f"{prefix}%")))
+def invalidate_cache(
+    session: Session, namespace: str, tenant_id: int, company_id: int | None = None
+) -> None:
+    statement = (
+        delete(ResponseCache)
+        .where(ResponseCache.namespace == namespace)
+        .where(ResponseCache.tenant_id == tenant_id)
+    )
+    if company_id is not None:
+        statement = statement.where(ResponseCache.company_id == company_id)
+    session.execute(statement)
+    generation = dialect_insert(session)(ResponseCacheGeneration).values(
+        namespace=namespace,
+        tenant_id=tenant_id,
+        company_id=company_id or _TENANT_SCOPE,
+        generation=1,
+        updated_at=datetime.now(timezone.utc),
+    )
+    generation = generation.on_conflict_do_update(
+        index_elements=["namespace", "tenant_id", "company_id"],
+        set_={
+            "generation": ResponseCacheGeneration.generation + 1,
+            "updated_at": generation.excluded.updated_at,
+        },
+    )
+    session.execute(generation)
     session.commit()
+    local_cache.invalidate(namespace, tenant_id, company_id)
+
+
+def cache_generation(session: Session, cache_key: CacheKey) -> int:
+    return session.execute(
+        select(func.coalesce(func.sum(ResponseCacheGeneration.generation), 0))
+        .where(ResponseCacheGeneration.namespace == cache_key.namespace)
+        .where(ResponseCacheGeneration.tenant_id == cache_key.tenant_id)
+        .where(
+            ResponseCacheGeneration.company_id.in_(
+                {_TENANT_SCOPE, cache_key.company_id or _TENANT_SCOPE}
+            )
+        )
+    ).scalar_one()
+
+
+def sweep_expired(session: Session) -> int:
+    result = session.execute(
+        delete(ResponseCache).where(ResponseCache.expires_at <= datetime.now(timezone.utc))
+    )
+    session.commit()
+    return result.rowcount or 0
+
+
+def enforce_max_entries(session: Session, max_entries: int) -> int:
+    excess = session.execute(select(func.count(ResponseCache.id))).scalar_one() - max_entries
+    if excess <= 0:
+        return 0
+    oldest = (
+        select(ResponseCache.id).order_by(ResponseCache.expires_at, ResponseCache.id).limit(excess)
+    )
+    result = session.execute(
+        delete(ResponseCache).where(ResponseCache.id.in_(oldest.scalar_subquery()))
+    )
+    session.commit()
+    return result.rowcount or 0
+
+
+def cache_stats() -> dict[str, int]:
+    return dict(local_cache.stats)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import threading
+import time
+from typing import Callable, Protocol
+
+from sqlalchemy.orm import Session
+
+from core.config import get_settings
+from core.utils.time import utc_now
+from data.storage.db import SessionLocal
+from data.storage.repositories import rate_limits_repo
+
+
+class RateLimiter(Protocol):
+    blocking: bool
+
+    def allow(self, api_key_id: int, limit_per_min: int) -> bool: ...
+
+
+class InMemoryRateLimiter:
+    blocking = False
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[int, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, api_key_id: int, limit_per_min: int) -> bool:
+        capacity = float(limit_per_min)
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(api_key_id, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * capacity / 60.0)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            self._buckets[api_key_id] = (tokens, now)
+        return allowed
+
+
+class DatabaseRateLimiter:
+    blocking = True
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        clock: Callable[[], datetime] = utc_now,
+        prune_interval_seconds: float = 60.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._clock = clock
+        self._prune_interval = timedelta(seconds=prune_interval_seconds)
+        self._pruned_at: datetime | None = None
+        self._prune_lock = threading.Lock()
+
+    def allow(self, api_key_id: int, limit_per_min: int) -> bool:
+        now = self._clock()
+        window_start = now.replace(second=0, microsecond=0)
+        with self._session_factory() as session:
+            count = rate_limits_repo.increment_window(
+                session, api_key_id, window_start, limit_per_min
+            )
+            if self._should_prune(now):
+                rate_limits_repo.delete_windows_before(session, window_start)
+        return count is not None
+
+    def _should_prune(self, now: datetime) -> bool:
+        with self._prune_lock:
+            if self._pruned_at is not None and now - self._pruned_at < self._prune_interval:
+                return False
+            self._pruned_at = now
+            return True
+
+
+def build_rate_limiter(backend: str) -> RateLimiter:
+    if backend == "memory":
+        return InMemoryRateLimiter()
+    if backend == "database":
+        return DatabaseRateLimiter(SessionLocal)
+    raise ValueError(f"Unknown rate limiter backend: {backend}")
+
+
+settings = get_settings()
+rate_limiter = build_rate_limiter(settings.rate_limiter_backend)
@@ -17,6 +17,24 @@ class Settings(BaseSettings):
     enable_scheduler: bool = False
     scheduler_interval_hours: int = 24
     scheduler_source: str = "mock"
+    pipeline_workers: int = 4
+    greenhouse_api_base: str = "https://boards-api.greenhouse.io"
+    http_max_concurrency: int = 32
+    http_per_host_limit: int = 8
+    http_host_interval_ms: int = 0
+    api_key_cache_ttl_seconds: int = 60
+    api_key_cache_max_entries: int = 10000
+    api_key_touch_interval_seconds: int = 60
+    rate_limiter_backend: str = "memory"
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 200
+    audit_flush_interval_ms: int = 500
+    response_cache_local_max_entries: int = 1024
+    response_cache_local_ttl_seconds: int = 30
+    response_cache_max_entries: int = 50000
+    response_cache_sweep_interval_seconds: int = 300
+    rescore_workers: int = 4
+    rescore_batch_size: int = 200
 
 
 @lru_cache
@@ -45,6 +45,16 @@ def keyword_scores(text: str, keywords: dict[str, Iterable[str]] = KEYWORDS) ->
     return scores
 
 
+def term_counts(text: str, terms: Iterable[str]) -> dict[str, int]:
+    return {term: text.count(term) for term in dict.fromkeys(terms)}
+
+
+def keyword_scores_from_counts(
+    counts: dict[str, int], keywords: dict[str, Iterable[str]] = KEYWORDS
+) -> dict[str, int]:
+    return {label: sum(counts[term] for term in terms) for label, terms in keywords.items()}
+
+
 def extract_tech_tags(text: str) -> list[str]:
     normalized = normalize_text(text)
     tags = []
@@ -10,3 +10,9 @@ def parse_datetime(value: str | datetime) -> datetime:
     if isinstance(value, datetime):
         return value
     return parser.isoparse(value)
+
+
+def ensure_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "intent-market-model/0.1"
+NOT_MODIFIED = object()
+
+
+@dataclass
+class CachedValidators:
+    etag: str | None = None
+    last_modified: str | None = None
+    content_digest: str | None = None
+
+
+@dataclass
+class HttpCache:
+    entries: dict[str, CachedValidators] = field(default_factory=dict)
+    updated: dict[str, CachedValidators] = field(default_factory=dict)
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        cached = self.entries.get(url)
+        headers: dict[str, str] = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+
+class AsyncHttpClient:
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        per_host_limit: int | None = None,
+        host_interval_ms: int | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        settings = get_settings()
+        self.max_concurrency = max_concurrency or settings.http_max_concurrency
+        self.per_host_limit = per_host_limit or settings.http_per_host_limit
+        if host_interval_ms is None:
+            host_interval_ms = settings.http_host_interval_ms
+        self.host_interval = host_interval_ms / 1000.0
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._host_last_start: dict[str, float] = {}
+
+    async def __aenter__(self) -> AsyncHttpClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        host = urlsplit(url).netloc
+        async with self._slots, self._host_slot(host):
+            await self._wait_politely(host)
+            return await self._client.get(url, headers=headers)
+
+    async def get_json(self, url: str, cache: HttpCache | None = None) -> Any:
+        headers = cache.request_headers(url) if cache else None
+        try:
+            response = await self.get(url, headers=headers)
+            if cache and response.status_code == 304:
+                return NOT_MODIFIED
+            response.raise_for_status()
+            if cache:
+                digest = hashlib.sha256(response.content).hexdigest()
+                previous = cache.entries.get(url)
+                cache.updated[url] = CachedValidators(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    content_digest=digest,
+                )
+                if previous and previous.content_digest == digest:
+                    return NOT_MODIFIED
+            return response.json()
+        except (httpx.HTTPError, json.JSONDecodeError) as exc:
+            logger.warning("HTTP fetch failed for %s: %s", url, exc)
+            return None
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host]
+
+    async def _wait_politely(self, host: str) -> None:
+        if self.host_interval <= 0:
+            return
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            elapsed = time.monotonic() - self._host_last_start.get(host, 0.0)
+            if elapsed < self.host_interval:
+                await asyncio.sleep(self.host_interval - elapsed)
+            self._host_last_start[host] = time.monotonic()
@@ -7,18 +7,43 @@ from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from core.config import get_settings
+from data.connectors.http_client import NOT_MODIFIED, USER_AGENT, AsyncHttpClient, HttpCache
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 def fetch_job_posts(company_domain: str) -> list[dict[str, Any]]:
     board = _resolve_board_slug(company_domain)
     if not board:
         return []
-    url = f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs?content=true"
-    payload = _fetch_json(url)
+    payload = _fetch_json(_board_url(board))
     if not payload:
         return []
+    return _parse_jobs(payload)
+
+
+async def fetch_job_posts_async(
+    company_domain: str, client: AsyncHttpClient, cache: HttpCache | None = None
+) -> list[dict[str, Any]] | None:
+    board = _resolve_board_slug(company_domain)
+    if not board:
+        return []
+    payload = await client.get_json(_board_url(board), cache)
+    if payload is NOT_MODIFIED:
+        return None
+    if not payload:
+        return []
+    return _parse_jobs(payload)
+
+
+def _board_url(board: str) -> str:
+    base = settings.greenhouse_api_base.rstrip("/")
+    return f"{base}/v1/boards/{board}/jobs?content=true"
+
+
+def _parse_jobs(payload: dict[str, Any]) -> list[dict[str, Any]]:
     jobs = payload.get("jobs", [])
     results: list[dict[str, Any]] = []
     for job in jobs:
@@ -69,7 +94,7 @@ def _load_board_map() -> dict[str, str]:
 
 
 def _fetch_json(url: str) -> dict[str, Any] | None:
-    request = Request(url, headers={"User-Agent": "intent-market-model/0.1"})
+    request = Request(url, headers={"User-Agent": USER_AGENT})
     try:
         with urlopen(request, timeout=10) as response:
             return json.loads(response.read().decode("utf-8"))
@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from typing import Any
 
+from data.connectors.http_client import AsyncHttpClient, HttpCache
+
 
 def fetch_job_posts(company_domain: str) -> list[dict[str, Any]]:
     _ = company_domain
     return []
+
+
+async def fetch_job_posts_async(
+    company_domain: str, client: AsyncHttpClient, cache: HttpCache | None = None
+) -> list[dict[str, Any]] | None:
+    _ = (client, cache)
+    return fetch_job_posts(company_domain)
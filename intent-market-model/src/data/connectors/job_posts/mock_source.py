@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from core.config import get_settings
+from data.connectors.http_client import AsyncHttpClient, HttpCache
 
 settings = get_settings()
 
@@ -15,3 +16,10 @@ def fetch_job_posts(company_domain: str) -> list[dict[str, Any]]:
     if not fixture_file.exists():
         return []
     return json.loads(fixture_file.read_text(encoding="utf-8"))
+
+
+async def fetch_job_posts_async(
+    company_domain: str, client: AsyncHttpClient, cache: HttpCache | None = None
+) -> list[dict[str, Any]] | None:
+    _ = (client, cache)
+    return fetch_job_posts(company_domain)
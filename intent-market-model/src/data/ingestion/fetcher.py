@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from data.connectors.http_client import AsyncHttpClient, HttpCache
 from data.connectors.job_posts import greenhouse, lever, mock_source
 
 CONNECTORS = {
@@ -10,9 +11,25 @@ CONNECTORS = {
     "lever": lever.fetch_job_posts,
 }
 
+ASYNC_CONNECTORS = {
+    "mock": mock_source.fetch_job_posts_async,
+    "greenhouse": greenhouse.fetch_job_posts_async,
+    "lever": lever.fetch_job_posts_async,
+}
+
 
 def fetch_posts(company_domain: str, source: str) -> list[dict[str, Any]]:
     connector = CONNECTORS.get(source)
     if not connector:
         raise ValueError(f"Unknown source: {source}")
     return connector(company_domain)
+
+
+async def fetch_posts_async(
+    company_domain: str, source: str, client: AsyncHttpClient, cache: HttpCache | None = None
+) -> list[dict[str, Any]] | None:
+    connector = ASYNC_CONNECTORS.get(source)
+    if not connector:
+        raise ValueError(f"Unknown source: {source}")
+    return await connector(company_domain, client, cache)
+
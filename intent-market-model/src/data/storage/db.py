@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 from typing import Generator
 
 from sqlalchemy import (
@@ -9,18 +8,21 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     create_engine,
     select,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker
 
 from core.config import get_settings
 from core.types import EmbeddingType, JSONDict
 from core.utils.time import utc_now
+from data.storage.migrator import run_migrations
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,15 @@ class SignalEvent(Base):
     __tablename__ = "signal_events"
     __table_args__ = (
         UniqueConstraint("company_id", "event_hash", name="idx_signal_events_hash"),
+        Index("idx_signal_events_company_time", "tenant_id", "company_id", "timestamp"),
+        Index(
+            "idx_signal_events_unscored",
+            "tenant_id",
+            "company_id",
+            "id",
+            postgresql_where=text("scored_at IS NULL"),
+            sqlite_where=text("scored_at IS NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -81,13 +92,47 @@ class SignalEvent(Base):
     embedding: Mapped[list[float] | None] = mapped_column(
         EmbeddingType(get_settings().embedding_dim)
     )
+    scored_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
     company = relationship("Company", back_populates="signals")
 
 
+class CompanyBaseline(Base):
+    __tablename__ = "company_baselines"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id", "company_id", "vectorizer_version", name="idx_company_baselines_key"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=False)
+    company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=False)
+    vectorizer_version: Mapped[str] = mapped_column(String(50), nullable=False)
+    doc_count: Mapped[int] = mapped_column(Integer, default=0)
+    doc_freq: Mapped[list[float]] = mapped_column(JSONDict(), default=list)
+    role_counts: Mapped[dict] = mapped_column(JSONDict(), default=dict)
+    tech_tag_counts: Mapped[dict] = mapped_column(JSONDict(), default=dict)
+    term_counts: Mapped[list[dict]] = mapped_column(JSONDict(), default=list)
+    day_buckets: Mapped[list[dict]] = mapped_column(JSONDict(), default=list)
+    last_signal_id: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
 class IntentHypothesis(Base):
     __tablename__ = "intent_hypotheses"
+    __table_args__ = (
+        Index("idx_intent_tenant_company_created", "tenant_id", "company_id", "created_at"),
+        Index(
+            "idx_intent_company_type_created",
+            "tenant_id",
+            "company_id",
+            "intent_type",
+            "created_at",
+        ),
+        Index("idx_intent_ruleset_version", "ruleset_version"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=False)
@@ -101,13 +146,67 @@ class IntentHypothesis(Base):
     rule_hits_json: Mapped[list[dict]] = mapped_column(JSONDict(), default=list)
     explanations_json: Mapped[list[dict]] = mapped_column(JSONDict(), default=list)
     explanation: Mapped[str] = mapped_column(Text, nullable=False)
+    ruleset_version: Mapped[str | None] = mapped_column(String(64))
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
     company = relationship("Company", back_populates="intents")
 
 
+class RuleSet(Base):
+    __tablename__ = "rule_sets"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    rules: Mapped[list[dict]] = mapped_column(JSONDict(), default=list)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
+class IntentEvidence(Base):
+    __tablename__ = "intent_evidence"
+    __table_args__ = (
+        UniqueConstraint(
+            "signal_event_id", "intent_type", "intent_id", name="idx_intent_evidence_key"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    intent_id: Mapped[int] = mapped_column(
+        ForeignKey("intent_hypotheses.id", ondelete="CASCADE"), nullable=False
+    )
+    signal_event_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    intent_type: Mapped[str] = mapped_column(String(100), nullable=False)
+
+
+class CompanyIntentSummary(Base):
+    __tablename__ = "company_intent_summary"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id", "intent_type", "company_id", name="idx_company_intent_summary_key"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=False)
+    company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=False)
+    intent_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    latest_intent_id: Mapped[int | None] = mapped_column(Integer)
+    latest_readiness: Mapped[float | None] = mapped_column(Float)
+    previous_readiness: Mapped[float | None] = mapped_column(Float)
+    score_delta: Mapped[float | None] = mapped_column(Float)
+    confidence: Mapped[float | None] = mapped_column(Float)
+    alert_eligible: Mapped[bool] = mapped_column(Boolean, default=False)
+    alert_reason: Mapped[str | None] = mapped_column(Text)
+    top_rule_hits: Mapped[list[str]] = mapped_column(JSONDict(), default=list)
+    last_intent_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True))
+    last_signal_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
 class OutcomeEvent(Base):
     __tablename__ = "outcome_events"
+    __table_args__ = (
+        Index("idx_outcome_events_company_time", "tenant_id", "company_id", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=False)
@@ -145,6 +244,9 @@ class IntentGraphEdge(Base):
 
 class IntentBacktestResult(Base):
     __tablename__ = "intent_backtest_results"
+    __table_args__ = (
+        Index("idx_backtest_results_company_run", "tenant_id", "company_id", "run_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=False)
@@ -175,6 +277,9 @@ class ApiKey(Base):
 
 class RateLimit(Base):
     __tablename__ = "rate_limits"
+    __table_args__ = (
+        UniqueConstraint("api_key_id", "window_start", name="idx_rate_limits_window"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     api_key_id: Mapped[int] = mapped_column(ForeignKey("api_keys.id"), nullable=False)
@@ -184,14 +289,54 @@ class RateLimit(Base):
 
 class ResponseCache(Base):
     __tablename__ = "response_cache"
+    __table_args__ = (
+        UniqueConstraint("cache_key", name="idx_response_cache_key"),
+        Index("idx_response_cache_scope", "namespace", "tenant_id", "company_id"),
+        Index("idx_response_cache_expires", "expires_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     cache_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    namespace: Mapped[str | None] = mapped_column(String(64))
+    tenant_id: Mapped[int | None] = mapped_column(Integer)
+    company_id: Mapped[int | None] = mapped_column(Integer)
     payload: Mapped[dict] = mapped_column(JSONDict(), default=dict)
     expires_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
 
 
+class ResponseCacheGeneration(Base):
+    __tablename__ = "response_cache_generations"
+    __table_args__ = (
+        UniqueConstraint(
+            "namespace", "tenant_id", "company_id", name="idx_response_cache_generation_scope"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    namespace: Mapped[str] = mapped_column(String(64), nullable=False)
+    tenant_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    company_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
+class ConnectorFetchState(Base):
+    __tablename__ = "connector_fetch_state"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "company_id", "url", name="idx_connector_fetch_state_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=False)
+    company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=False)
+    url: Mapped[str] = mapped_column(String(512), nullable=False)
+    etag: Mapped[str | None] = mapped_column(String(255))
+    last_modified: Mapped[str | None] = mapped_column(String(64))
+    content_digest: Mapped[str | None] = mapped_column(String(64))
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
@@ -203,6 +348,8 @@ class AuditLog(Base):
     status_code: Mapped[int] = mapped_column(Integer, nullable=False)
     duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=utc_now)
+
+
 settings = get_settings()
 engine = create_engine(settings.database_url, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
@@ -220,15 +367,7 @@ def init_db() -> None:
     if engine.dialect.name != "postgresql":
         Base.metadata.create_all(bind=engine)
         return
-
-    migrations_path = Path(__file__).parent / "migrations.sql"
-    if migrations_path.exists():
-        sql = migrations_path.read_text(encoding="utf-8")
-        with engine.begin() as connection:
-            for statement in [s.strip() for s in sql.split(";") if s.strip()]:
-                connection.exec_driver_sql(statement)
-    else:
-        Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
 
 
 def ensure_company_exists(company_id: int) -> None:
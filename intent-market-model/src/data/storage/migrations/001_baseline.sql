@@ -74,6 +74,23 @@ DROP INDEX IF EXISTS idx_signal_events_hash;
 CREATE UNIQUE INDEX IF NOT EXISTS idx_signal_events_hash
   ON signal_events (company_id, event_hash);
 
+CREATE TABLE IF NOT EXISTS company_baselines (
+  id SERIAL PRIMARY KEY,
+  tenant_id INTEGER NOT NULL REFERENCES tenants(id),
+  company_id INTEGER NOT NULL REFERENCES companies(id),
+  vectorizer_version VARCHAR(50) NOT NULL,
+  doc_count INTEGER DEFAULT 0,
+  doc_freq JSONB DEFAULT '[]'::jsonb,
+  role_counts JSONB DEFAULT '{}'::jsonb,
+  tech_tag_counts JSONB DEFAULT '{}'::jsonb,
+  documents JSONB DEFAULT '[]'::jsonb,
+  last_signal_id INTEGER DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_company_baselines_key
+  ON company_baselines (tenant_id, company_id, vectorizer_version);
+
 CREATE TABLE IF NOT EXISTS intent_hypotheses (
   id SERIAL PRIMARY KEY,
   tenant_id INTEGER NOT NULL REFERENCES tenants(id),
@@ -93,9 +110,6 @@ CREATE TABLE IF NOT EXISTS intent_hypotheses (
 ALTER TABLE companies
   ADD COLUMN IF NOT EXISTS greenhouse_board VARCHAR(255);
 
-CREATE INDEX IF NOT EXISTS idx_intent_company_created
-  ON intent_hypotheses (company_id, created_at DESC);
-
 ALTER TABLE intent_hypotheses
   ADD COLUMN IF NOT EXISTS readiness_score FLOAT;
 
@@ -111,6 +125,27 @@ ALTER TABLE intent_hypotheses
 ALTER TABLE intent_hypotheses
   ADD COLUMN IF NOT EXISTS explanations_json JSONB DEFAULT '[]'::jsonb;
 
+CREATE TABLE IF NOT EXISTS company_intent_summary (
+  id SERIAL PRIMARY KEY,
+  tenant_id INTEGER NOT NULL REFERENCES tenants(id),
+  company_id INTEGER NOT NULL REFERENCES companies(id),
+  intent_type VARCHAR(100) NOT NULL,
+  latest_intent_id INTEGER,
+  latest_readiness FLOAT,
+  previous_readiness FLOAT,
+  score_delta FLOAT,
+  confidence FLOAT,
+  alert_eligible BOOLEAN DEFAULT FALSE,
+  alert_reason TEXT,
+  top_rule_hits JSONB DEFAULT '[]'::jsonb,
+  last_intent_at TIMESTAMPTZ,
+  last_signal_at TIMESTAMPTZ,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_company_intent_summary_key
+  ON company_intent_summary (tenant_id, intent_type, company_id);
+
 CREATE TABLE IF NOT EXISTS outcome_events (
   id SERIAL PRIMARY KEY,
   tenant_id INTEGER NOT NULL REFERENCES tenants(id),
@@ -184,14 +219,44 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_rate_limits_window
 CREATE TABLE IF NOT EXISTS response_cache (
   id SERIAL PRIMARY KEY,
   cache_key VARCHAR(255) NOT NULL,
+  namespace VARCHAR(64),
+  tenant_id INTEGER,
+  company_id INTEGER,
   payload JSONB DEFAULT '{}'::jsonb,
   expires_at TIMESTAMPTZ NOT NULL,
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
+ALTER TABLE response_cache
+  ADD COLUMN IF NOT EXISTS namespace VARCHAR(64);
+
+ALTER TABLE response_cache
+  ADD COLUMN IF NOT EXISTS tenant_id INTEGER;
+
+ALTER TABLE response_cache
+  ADD COLUMN IF NOT EXISTS company_id INTEGER;
+
+DELETE FROM response_cache
+  WHERE namespace IS NULL;
+
 CREATE UNIQUE INDEX IF NOT EXISTS idx_response_cache_key
   ON response_cache (cache_key);
 
+CREATE INDEX IF NOT EXISTS idx_response_cache_scope
+  ON response_cache (namespace, tenant_id, company_id);
+
+CREATE INDEX IF NOT EXISTS idx_response_cache_expires
+  ON response_cache (expires_at);
+
+CREATE TABLE IF NOT EXISTS connector_fetch_state (
+  id SERIAL PRIMARY KEY,
+  url VARCHAR(512) NOT NULL UNIQUE,
+  etag VARCHAR(255),
+  last_modified VARCHAR(64),
+  content_digest VARCHAR(64),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
 CREATE TABLE IF NOT EXISTS audit_logs (
   id SERIAL PRIMARY KEY,
   api_key_id INTEGER REFERENCES api_keys(id),
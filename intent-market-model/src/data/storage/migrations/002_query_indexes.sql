@@ -0,0 +1,18 @@
+-- Composite indexes matching the tenant/company scoped reads in the repositories.
+
+CREATE INDEX IF NOT EXISTS idx_signal_events_company_time
+  ON signal_events (tenant_id, company_id, timestamp DESC);
+
+DROP INDEX IF EXISTS idx_intent_company_created;
+
+CREATE INDEX IF NOT EXISTS idx_intent_tenant_company_created
+  ON intent_hypotheses (tenant_id, company_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_intent_company_type_created
+  ON intent_hypotheses (tenant_id, company_id, intent_type, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_outcome_events_company_time
+  ON outcome_events (tenant_id, company_id, timestamp DESC);
+
+CREATE INDEX IF NOT EXISTS idx_backtest_results_company_run
+  ON intent_backtest_results (tenant_id, company_id, run_at DESC);
@@ -0,0 +1,19 @@
+CREATE TABLE IF NOT EXISTS intent_evidence (
+  id SERIAL PRIMARY KEY,
+  intent_id INTEGER NOT NULL REFERENCES intent_hypotheses(id) ON DELETE CASCADE,
+  signal_event_id INTEGER NOT NULL,
+  intent_type VARCHAR(100) NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_intent_evidence_key
+  ON intent_evidence (signal_event_id, intent_type, intent_id);
+
+INSERT INTO intent_evidence (intent_id, signal_event_id, intent_type)
+SELECT DISTINCT hypothesis.id, (item ->> 'signal_event_id')::INTEGER, hypothesis.intent_type
+FROM intent_hypotheses AS hypothesis
+CROSS JOIN LATERAL jsonb_array_elements(
+  CASE WHEN jsonb_typeof(hypothesis.evidence) = 'array'
+    THEN hypothesis.evidence ELSE '[]'::jsonb END
+) AS item
+WHERE item ->> 'signal_event_id' IS NOT NULL
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,12 @@
+ALTER TABLE intent_hypotheses
+  ADD COLUMN IF NOT EXISTS ruleset_version VARCHAR(64);
+
+CREATE INDEX IF NOT EXISTS idx_intent_ruleset_version
+  ON intent_hypotheses (ruleset_version);
+
+CREATE TABLE IF NOT EXISTS rule_sets (
+  id SERIAL PRIMARY KEY,
+  version VARCHAR(64) NOT NULL UNIQUE,
+  rules JSONB DEFAULT '[]'::jsonb,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,6 @@
+ALTER TABLE intent_evidence
+  DROP CONSTRAINT IF EXISTS intent_evidence_intent_id_fkey;
+
+ALTER TABLE intent_evidence
+  ADD CONSTRAINT intent_evidence_intent_id_fkey
+  FOREIGN KEY (intent_id) REFERENCES intent_hypotheses(id) ON DELETE CASCADE;
@@ -0,0 +1,63 @@
+WITH ranked AS (
+  SELECT
+    id,
+    tenant_id,
+    company_id,
+    intent_type,
+    readiness_score,
+    confidence,
+    alert_eligible,
+    alert_reason,
+    CASE WHEN jsonb_typeof(rule_hits_json) = 'array'
+      THEN rule_hits_json ELSE '[]'::jsonb END AS rule_hits,
+    created_at,
+    ROW_NUMBER() OVER (
+      PARTITION BY tenant_id, company_id, intent_type
+      ORDER BY created_at DESC, id DESC
+    ) AS row_rank
+  FROM intent_hypotheses
+)
+INSERT INTO company_intent_summary (
+  tenant_id, company_id, intent_type, latest_intent_id, latest_readiness,
+  previous_readiness, score_delta, confidence, alert_eligible, alert_reason,
+  top_rule_hits, last_intent_at, last_signal_at, updated_at
+)
+SELECT
+  latest.tenant_id,
+  latest.company_id,
+  latest.intent_type,
+  latest.id,
+  latest.readiness_score,
+  previous.readiness_score,
+  CASE WHEN previous.id IS NOT NULL AND latest.readiness_score IS NOT NULL
+    THEN latest.readiness_score - COALESCE(previous.readiness_score, 0) END,
+  latest.confidence,
+  COALESCE(latest.alert_eligible, FALSE),
+  latest.alert_reason,
+  COALESCE(
+    (
+      SELECT jsonb_agg(hit.value ->> 'rule_name' ORDER BY hit.hit_index)
+      FROM jsonb_array_elements(latest.rule_hits) WITH ORDINALITY AS hit(value, hit_index)
+      WHERE hit.hit_index <= 3 AND hit.value ->> 'rule_name' IS NOT NULL
+    ),
+    '[]'::jsonb
+  ),
+  latest.created_at,
+  NULL,
+  NOW()
+FROM ranked AS latest
+LEFT JOIN ranked AS previous
+  ON previous.tenant_id = latest.tenant_id
+  AND previous.company_id = latest.company_id
+  AND previous.intent_type = latest.intent_type
+  AND previous.row_rank = 2
+WHERE latest.row_rank = 1
+ON CONFLICT (tenant_id, intent_type, company_id) DO NOTHING;
+
+INSERT INTO company_intent_summary (
+  tenant_id, company_id, intent_type, alert_eligible, top_rule_hits, last_signal_at, updated_at
+)
+SELECT tenant_id, company_id, '*', FALSE, '[]'::jsonb, MAX(timestamp), NOW()
+FROM signal_events
+GROUP BY tenant_id, company_id
+ON CONFLICT (tenant_id, intent_type, company_id) DO NOTHING;
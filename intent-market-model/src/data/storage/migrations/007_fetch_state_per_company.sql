@@ -0,0 +1,11 @@
+DELETE FROM connector_fetch_state;
+
+ALTER TABLE connector_fetch_state
+  ADD COLUMN IF NOT EXISTS tenant_id INTEGER NOT NULL REFERENCES tenants(id),
+  ADD COLUMN IF NOT EXISTS company_id INTEGER NOT NULL REFERENCES companies(id);
+
+ALTER TABLE connector_fetch_state
+  DROP CONSTRAINT IF EXISTS connector_fetch_state_url_key;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_connector_fetch_state_key
+  ON connector_fetch_state (tenant_id, company_id, url);
@@ -0,0 +1,6 @@
+DELETE FROM company_baselines;
+
+ALTER TABLE company_baselines
+  DROP COLUMN IF EXISTS documents,
+  ADD COLUMN IF NOT EXISTS term_counts JSONB DEFAULT '[]'::jsonb,
+  ADD COLUMN IF NOT EXISTS day_buckets JSONB DEFAULT '[]'::jsonb;
@@ -0,0 +1,10 @@
+-- Signals whose inference never committed keep scored_at NULL so the next
+-- pipeline run scores them. Existing signals were scored when they landed.
+
+ALTER TABLE signal_events ADD COLUMN IF NOT EXISTS scored_at TIMESTAMPTZ;
+
+UPDATE signal_events SET scored_at = created_at WHERE scored_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_signal_events_unscored
+  ON signal_events (tenant_id, company_id, id)
+  WHERE scored_at IS NULL;
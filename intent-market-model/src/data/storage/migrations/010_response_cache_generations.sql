@@ -0,0 +1,14 @@
+-- Invalidation bumps a generation per (namespace, tenant, company); company_id 0
+-- covers the whole tenant. Local cache tiers compare it on every hit.
+
+CREATE TABLE IF NOT EXISTS response_cache_generations (
+  id SERIAL PRIMARY KEY,
+  namespace VARCHAR(64) NOT NULL,
+  tenant_id INTEGER NOT NULL,
+  company_id INTEGER NOT NULL DEFAULT 0,
+  generation INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_response_cache_generation_scope
+  ON response_cache_generations (namespace, tenant_id, company_id);
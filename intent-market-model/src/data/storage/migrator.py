@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import re
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+from core.utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+_ADVISORY_LOCK_KEY = 4_871_220_513
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+_DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    def statements(self) -> list[str]:
+        return split_statements(self.path.read_text(encoding="utf-8"))
+
+
+def split_statements(sql: str) -> list[str]:
+    statements: list[str] = []
+    start = 0
+    has_code = False
+    idx = 0
+    while idx < len(sql):
+        char = sql[idx]
+        if sql.startswith("--", idx):
+            end = sql.find("\n", idx)
+            idx = len(sql) if end == -1 else end + 1
+            continue
+        if sql.startswith("/*", idx):
+            end = sql.find("*/", idx + 2)
+            idx = len(sql) if end == -1 else end + 2
+            continue
+        if char == ";":
+            if has_code:
+                statements.append(sql[start:idx].strip())
+            start = idx + 1
+            has_code = False
+        elif not char.isspace():
+            has_code = True
+            if char in ("'", '"'):
+                idx = _quoted_end(sql, idx, char)
+                continue
+            tag = _DOLLAR_TAG.match(sql, idx)
+            if tag and not (idx and (sql[idx - 1].isalnum() or sql[idx - 1] in "_$")):
+                end = sql.find(tag.group(0), tag.end())
+                idx = len(sql) if end == -1 else end + len(tag.group(0))
+                continue
+        idx += 1
+    if has_code:
+        statements.append(sql[start:].strip())
+    return statements
+
+
+def _quoted_end(sql: str, idx: int, quote: str) -> int:
+    idx += 1
+    while idx < len(sql):
+        if sql[idx] == quote:
+            if sql.startswith(quote * 2, idx):
+                idx += 2
+                continue
+            return idx + 1
+        idx += 1
+    return idx
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations: dict[int, Migration] = {}
+    for path in directory.glob("*.sql"):
+        match = _FILENAME.match(path.name)
+        if not match:
+            raise ValueError(f"Migration file name must look like 001_name.sql: {path.name}")
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(
+                f"Duplicate migration version {version}: "
+                f"{migrations[version].path.name}, {path.name}"
+            )
+        migrations[version] = Migration(version=version, name=match.group(2), path=path)
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def run_migrations(engine: Engine, directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    migrations = discover_migrations(directory)
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+            )
+        schema_migrations.create(connection, checkfirst=True)
+        applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+        pending = [migration for migration in migrations if migration.version not in applied]
+        for migration in pending:
+            logger.info("Applying migration %s", migration.path.name)
+            for statement in migration.statements():
+                connection.exec_driver_sql(statement)
+            connection.execute(
+                insert(schema_migrations).values(
+                    version=migration.version, name=migration.name, applied_at=utc_now()
+                )
+            )
+    return pending
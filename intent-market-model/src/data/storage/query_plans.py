@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import re
+from typing import Callable
+
+from sqlalchemy import Select, UniqueConstraint, text
+from sqlalchemy.orm import Session
+
+from data.storage.db import Base
+from data.storage.migrator import discover_migrations
+from data.storage.repositories import (
+    backtest_repo,
+    intent_summary_repo,
+    intents_repo,
+    outcomes_repo,
+    signals_repo,
+)
+
+_TENANT_ID = 1
+_COMPANY_ID = 1
+_SINCE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)$")
+_POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+_CREATE_INDEX = re.compile(r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.I)
+_DROP_INDEX = re.compile(r"DROP\s+INDEX\s+(?:IF\s+EXISTS\s+)?(\w+)", re.I)
+
+
+HOT_QUERIES: dict[str, Callable[[], Select]] = {
+    "signals_repo.get_signal_by_hash": lambda: signals_repo.signal_by_hash_query(
+        _TENANT_ID, _COMPANY_ID, "hash"
+    ),
+    "signals_repo.list_recent_signals": lambda: signals_repo.recent_signals_query(
+        _TENANT_ID, _COMPANY_ID
+    ),
+    "signals_repo.list_signals_since": lambda: signals_repo.signals_since_query(
+        _TENANT_ID, _COMPANY_ID, _SINCE
+    ),
+    "signals_repo.latest_signal_time_by_source": lambda: (
+        signals_repo.latest_signal_time_by_source_query(_TENANT_ID, _COMPANY_ID, _SINCE)
+    ),
+    "signals_repo.list_unscored_signals": lambda: signals_repo.unscored_signals_query(
+        _TENANT_ID, _COMPANY_ID
+    ),
+    "signals_repo.list_baseline_documents": lambda: signals_repo.baseline_documents_query(
+        _TENANT_ID, _COMPANY_ID, 0, _SINCE
+    ),
+    "intents_repo.list_latest_intents": lambda: intents_repo.latest_intents_query(
+        _TENANT_ID, _COMPANY_ID
+    ),
+    "intents_repo.list_intents_since": lambda: intents_repo.intents_since_query(
+        _TENANT_ID, _COMPANY_ID, _SINCE, "IPO_PREP"
+    ),
+    "intents_repo.list_intent_times_since": lambda: intents_repo.intent_times_since_query(
+        _TENANT_ID, _COMPANY_ID, _SINCE, "IPO_PREP", 70.0
+    ),
+    "intents_repo.list_evidence_pairs": lambda: intents_repo.evidence_pairs_query([1, 2, 3]),
+    "intent_summary_repo.refresh_intent_summaries": lambda: (
+        intent_summary_repo.intent_rows_query({_TENANT_ID}, {_COMPANY_ID}, {"IPO_PREP"})
+    ),
+    "intent_summary_repo.record_intents": lambda: intent_summary_repo.summary_rows_query(
+        {(_TENANT_ID, _COMPANY_ID, "IPO_PREP")}
+    ),
+    "outcomes_repo.list_outcomes": lambda: outcomes_repo.outcomes_query(_TENANT_ID, _COMPANY_ID),
+    "outcomes_repo.list_outcomes_since": lambda: outcomes_repo.outcomes_since_query(
+        _TENANT_ID, _COMPANY_ID, _SINCE
+    ),
+    "backtest_repo.latest_run": lambda: backtest_repo.latest_run_query(_TENANT_ID, _COMPANY_ID),
+    "backtest_repo.list_latest_run_results": lambda: backtest_repo.run_results_query(
+        _TENANT_ID, _COMPANY_ID, _SINCE
+    ),
+}
+
+
+def explain(session: Session, statement: Select) -> list[str]:
+    dialect = session.get_bind().dialect
+    prefix = "EXPLAIN QUERY PLAN" if dialect.name == "sqlite" else "EXPLAIN"
+    compiled = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    rows = session.connection().exec_driver_sql(f"{prefix} {compiled}").all()
+    if dialect.name == "sqlite":
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def sequential_scans(session: Session, names: list[str] | None = None) -> dict[str, list[str]]:
+    tables = set(Base.metadata.tables)
+    if session.get_bind().dialect.name == "sqlite":
+        pattern = _SQLITE_SCAN
+    else:
+        pattern = _POSTGRES_SCAN
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+    failures: dict[str, list[str]] = {}
+    try:
+        for name in names or list(HOT_QUERIES):
+            plan = explain(session, HOT_QUERIES[name]())
+            if any(
+                match and match.group(1) in tables
+                for match in (pattern.search(line.strip()) for line in plan)
+            ):
+                failures[name] = plan
+    finally:
+        session.rollback()
+    return failures
+
+
+def declared_indexes() -> set[str]:
+    names: set[str] = set()
+    for table in Base.metadata.tables.values():
+        names.update(index.name for index in table.indexes if index.name)
+        names.update(
+            constraint.name
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint) and constraint.name
+        )
+    return names
+
+
+def migration_indexes() -> set[str]:
+    names: set[str] = set()
+    for migration in discover_migrations():
+        for statement in migration.statements():
+            dropped = _DROP_INDEX.search(statement)
+            if dropped:
+                names.discard(dropped.group(1))
+            created = _CREATE_INDEX.search(statement)
+            if created:
+                names.add(created.group(1))
+    return names
+
+
+def missing_indexes(session: Session) -> list[str]:
+    # SQLite builds its schema from the models, so check the migrations that
+    # Postgres runs; on Postgres check the live schema.
+    if session.get_bind().dialect.name == "sqlite":
+        present = migration_indexes()
+    else:
+        present = set(
+            session.execute(
+                text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()")
+            ).scalars()
+        )
+    return sorted(declared_indexes() - present)
@@ -1,21 +1,33 @@
 from data.storage.repositories import (
     api_keys_repo,
+    baselines_repo,
     company_repo,
+    fetch_state_repo,
+    intent_summary_repo,
     intents_repo,
     signals_repo,
     graph_repo,
     tenant_repo,
     outcomes_repo,
+    rate_limits_repo,
+    rule_sets_repo,
     backtest_repo,
+    watchlist_repo,
 )
 
 __all__ = [
     "api_keys_repo",
+    "baselines_repo",
     "company_repo",
+    "fetch_state_repo",
+    "intent_summary_repo",
     "intents_repo",
     "signals_repo",
     "graph_repo",
     "tenant_repo",
     "outcomes_repo",
+    "rate_limits_repo",
+    "rule_sets_repo",
     "backtest_repo",
+    "watchlist_repo",
 ]
@@ -1,37 +1,59 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import desc, select
+from sqlalchemy import Select, desc, insert, select
 from sqlalchemy.orm import Session
 
 from data.storage.db import IntentBacktestResult
+from data.storage.repositories._columns import insert_values
 
 
 def insert_results(session: Session, results: list[IntentBacktestResult]) -> list[IntentBacktestResult]:
-    session.add_all(results)
+    if not results:
+        return []
+    rows = session.execute(
+        insert(IntentBacktestResult).returning(
+            IntentBacktestResult.id,
+            IntentBacktestResult.run_at,
+            IntentBacktestResult.created_at,
+            sort_by_parameter_order=True,
+        ),
+        [insert_values(result) for result in results],
+    ).all()
     session.commit()
-    for result in results:
-        session.refresh(result)
+    for result, row in zip(results, rows):
+        result.id = row.id
+        result.run_at = row.run_at
+        result.created_at = row.created_at
     return results
 
 
-def list_latest_run_results(
-    session: Session, tenant_id: int, company_id: int
-) -> list[IntentBacktestResult]:
-    latest_run = session.execute(
+def latest_run_query(tenant_id: int, company_id: int) -> Select:
+    return (
         select(IntentBacktestResult.run_at)
         .where(IntentBacktestResult.tenant_id == tenant_id)
         .where(IntentBacktestResult.company_id == company_id)
         .order_by(desc(IntentBacktestResult.run_at))
         .limit(1)
-    ).scalar()
+    )
+
+
+def run_results_query(tenant_id: int, company_id: int, run_at: datetime) -> Select:
+    return (
+        select(IntentBacktestResult)
+        .where(IntentBacktestResult.tenant_id == tenant_id)
+        .where(IntentBacktestResult.company_id == company_id)
+        .where(IntentBacktestResult.run_at == run_at)
+    )
+
+
+def list_latest_run_results(
+    session: Session, tenant_id: int, company_id: int
+) -> list[IntentBacktestResult]:
+    latest_run = session.execute(latest_run_query(tenant_id, company_id)).scalar()
     if not latest_run:
         return []
     return list(
-        session.execute(
-            select(IntentBacktestResult)
-            .where(IntentBacktestResult.tenant_id == tenant_id)
-            .where(IntentBacktestResult.company_id == company_id)
-            .where(IntentBacktestResult.run_at == latest_run)
-        ).scalars()
+        session.execute(run_results_query(tenant_id, company_id, latest_run)).scalars()
     )
+
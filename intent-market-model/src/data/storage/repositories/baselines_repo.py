@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from sqlalchemy import Delete, delete, select
+from sqlalchemy.orm import Session
+
+from core.utils.time import utc_now
+from data.storage.db import CompanyBaseline
+
+
+def get_baseline(
+    session: Session, tenant_id: int, company_id: int, vectorizer_version: str
+) -> CompanyBaseline | None:
+    return session.execute(
+        select(CompanyBaseline)
+        .where(CompanyBaseline.tenant_id == tenant_id)
+        .where(CompanyBaseline.company_id == company_id)
+        .where(CompanyBaseline.vectorizer_version == vectorizer_version)
+    ).scalars().first()
+
+
+def save_baseline(
+    session: Session,
+    tenant_id: int,
+    company_id: int,
+    vectorizer_version: str,
+    snapshot: dict,
+    last_signal_id: int,
+) -> CompanyBaseline:
+    record = get_baseline(session, tenant_id, company_id, vectorizer_version)
+    if not record:
+        record = CompanyBaseline(
+            tenant_id=tenant_id,
+            company_id=company_id,
+            vectorizer_version=vectorizer_version,
+        )
+        session.add(record)
+    record.doc_count = snapshot["doc_count"]
+    record.doc_freq = snapshot["doc_freq"]
+    record.role_counts = snapshot["role_counts"]
+    record.tech_tag_counts = snapshot["tech_tag_counts"]
+    record.term_counts = snapshot["term_counts"]
+    record.day_buckets = snapshot["day_buckets"]
+    record.last_signal_id = last_signal_id
+    record.updated_at = utc_now()
+    session.commit()
+    return record
+
+
+def delete_baselines(session: Session, tenant_id: int, company_id: int) -> None:
+    session.execute(delete_baselines_statement(tenant_id, company_id))
+    session.commit()
+
+
+def delete_baselines_statement(tenant_id: int, company_id: int) -> Delete:
+    return (
+        delete(CompanyBaseline)
+        .where(CompanyBaseline.tenant_id == tenant_id)
+        .where(CompanyBaseline.company_id == company_id)
+    )
+
+
+def to_snapshot(record: CompanyBaseline) -> dict:
+    return {
+        "doc_count": record.doc_count,
+        "doc_freq": record.doc_freq,
+        "role_counts": record.role_counts or {},
+        "tech_tag_counts": record.tech_tag_counts or {},
+        "term_counts": record.term_counts or [],
+        "day_buckets": record.day_buckets or [],
+    }
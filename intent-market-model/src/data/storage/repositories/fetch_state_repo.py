@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from core.utils.time import utc_now
+from data.storage.db import ConnectorFetchState
+
+
+def load_states(
+    session: Session, companies: list[tuple[int, int]]
+) -> dict[tuple[int, int], dict[str, dict[str, str | None]]]:
+    if not companies:
+        return {}
+    rows = session.execute(
+        select(
+            ConnectorFetchState.tenant_id,
+            ConnectorFetchState.company_id,
+            ConnectorFetchState.url,
+            ConnectorFetchState.etag,
+            ConnectorFetchState.last_modified,
+            ConnectorFetchState.content_digest,
+        ).where(
+            tuple_(ConnectorFetchState.tenant_id, ConnectorFetchState.company_id).in_(companies)
+        )
+    ).all()
+    states: dict[tuple[int, int], dict[str, dict[str, str | None]]] = {}
+    for row in rows:
+        states.setdefault((row.tenant_id, row.company_id), {})[row.url] = {
+            "etag": row.etag,
+            "last_modified": row.last_modified,
+            "content_digest": row.content_digest,
+        }
+    return states
+
+
+def save_states(
+    session: Session,
+    tenant_id: int,
+    company_id: int,
+    states: dict[str, dict[str, str | None]],
+) -> None:
+    if not states:
+        return
+    existing = {
+        record.url: record
+        for record in session.execute(
+            select(ConnectorFetchState)
+            .where(ConnectorFetchState.tenant_id == tenant_id)
+            .where(ConnectorFetchState.company_id == company_id)
+            .where(ConnectorFetchState.url.in_(list(states)))
+        ).scalars()
+    }
+    now = utc_now()
+    for url, state in states.items():
+        record = existing.get(url)
+        if not record:
+            record = ConnectorFetchState(tenant_id=tenant_id, company_id=company_id, url=url)
+            session.add(record)
+        record.etag = state.get("etag")
+        record.last_modified = state.get("last_modified")
+        record.content_digest = state.get("content_digest")
+        record.updated_at = now
+    session.commit()
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import Select, and_, case, delete, desc, func, insert, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from core.utils.time import ensure_utc, utc_now
+from data.storage.db import CompanyIntentSummary, IntentHypothesis, SignalEvent
+from data.storage.repositories._columns import dialect_insert
+
+COMPANY_ROLLUP = "*"
+_SUMMARY_KEY = ["tenant_id", "intent_type", "company_id"]
+_INTENT_FIELDS = (
+    "latest_intent_id",
+    "latest_readiness",
+    "previous_readiness",
+    "score_delta",
+    "confidence",
+    "alert_eligible",
+    "alert_reason",
+    "top_rule_hits",
+    "last_intent_at",
+    "updated_at",
+)
+_TOP_RULE_HITS = 3
+
+
+def refresh_intent_summaries(session: Session, keys: Iterable[tuple[int, int, str]]) -> int:
+    keys = set(keys)
+    if not keys:
+        return 0
+    rows = [
+        row
+        for row in _intent_rows(
+            session,
+            tenant_ids={key[0] for key in keys},
+            company_ids={key[1] for key in keys},
+            intent_types={key[2] for key in keys},
+        )
+        if (row["tenant_id"], row["company_id"], row["intent_type"]) in keys
+    ]
+    missing = keys - {(row["tenant_id"], row["company_id"], row["intent_type"]) for row in rows}
+    if missing:
+        session.execute(
+            delete(CompanyIntentSummary).where(
+                tuple_(
+                    CompanyIntentSummary.tenant_id,
+                    CompanyIntentSummary.company_id,
+                    CompanyIntentSummary.intent_type,
+                ).in_(missing)
+            )
+        )
+    if rows:
+        statement = dialect_insert(session)(CompanyIntentSummary)
+        statement = statement.on_conflict_do_update(
+            index_elements=_SUMMARY_KEY,
+            set_={field: statement.excluded[field] for field in _INTENT_FIELDS},
+        )
+        session.execute(statement, rows)
+    return len(rows)
+
+
+def record_intents(session: Session, intents: Iterable[IntentHypothesis]) -> int:
+    batches: dict[tuple[int, int, str], list[IntentHypothesis]] = {}
+    for intent in intents:
+        key = (intent.tenant_id, intent.company_id, intent.intent_type)
+        batches.setdefault(key, []).append(intent)
+    if not batches:
+        return 0
+    current = {
+        (row.tenant_id, row.company_id, row.intent_type): row
+        for row in session.execute(summary_rows_query(set(batches)))
+    }
+    now = utc_now()
+    rows = []
+    out_of_order = set()
+    for key, batch in batches.items():
+        batch.sort(key=lambda intent: (ensure_utc(intent.created_at), intent.id))
+        summary = current.get(key)
+        if (
+            summary is not None
+            and summary.last_intent_at is not None
+            and ensure_utc(batch[0].created_at) < ensure_utc(summary.last_intent_at)
+        ):
+            out_of_order.add(key)
+            continue
+        if len(batch) > 1:
+            rows.append(_intent_row(batch[-1], True, batch[-2].readiness_score, now))
+        elif summary is not None and summary.latest_intent_id is not None:
+            rows.append(_intent_row(batch[-1], True, summary.latest_readiness, now))
+        else:
+            rows.append(_intent_row(batch[-1], False, None, now))
+    refresh_intent_summaries(session, out_of_order)
+    if rows:
+        statement = dialect_insert(session)(CompanyIntentSummary)
+        statement = statement.on_conflict_do_update(
+            index_elements=_SUMMARY_KEY,
+            set_={field: statement.excluded[field] for field in _INTENT_FIELDS},
+        )
+        session.execute(statement, rows)
+    return len(rows) + len(out_of_order)
+
+
+def summary_rows_query(keys: set[tuple[int, int, str]]) -> Select:
+    return select(
+        CompanyIntentSummary.tenant_id,
+        CompanyIntentSummary.company_id,
+        CompanyIntentSummary.intent_type,
+        CompanyIntentSummary.latest_intent_id,
+        CompanyIntentSummary.latest_readiness,
+        CompanyIntentSummary.last_intent_at,
+    ).where(
+        tuple_(
+            CompanyIntentSummary.tenant_id,
+            CompanyIntentSummary.company_id,
+            CompanyIntentSummary.intent_type,
+        ).in_(keys)
+    )
+
+
+def record_signals(session: Session, signals: Iterable[SignalEvent]) -> int:
+    latest: dict[tuple[int, int], datetime] = {}
+    for signal in signals:
+        key = (signal.tenant_id, signal.company_id)
+        timestamp = ensure_utc(signal.timestamp)
+        if key not in latest or timestamp > latest[key]:
+            latest[key] = timestamp
+    if not latest:
+        return 0
+    now = utc_now()
+    statement = dialect_insert(session)(CompanyIntentSummary)
+    statement = statement.on_conflict_do_update(
+        index_elements=_SUMMARY_KEY,
+        set_={
+            "last_signal_at": case(
+                (
+                    or_(
+                        CompanyIntentSummary.last_signal_at.is_(None),
+                        statement.excluded.last_signal_at > CompanyIntentSummary.last_signal_at,
+                    ),
+                    statement.excluded.last_signal_at,
+                ),
+                else_=CompanyIntentSummary.last_signal_at,
+            ),
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    session.execute(
+        statement,
+        [
+            _summary_row(
+                tenant_id, company_id, COMPANY_ROLLUP, last_signal_at=timestamp, updated_at=now
+            )
+            for (tenant_id, company_id), timestamp in latest.items()
+        ],
+    )
+    return len(latest)
+
+
+def refresh_signal_rollups(session: Session, companies: Iterable[tuple[int, int]]) -> int:
+    companies = set(companies)
+    if not companies:
+        return 0
+    rows = [
+        row
+        for row in _rollup_rows(
+            session,
+            tenant_ids={tenant_id for tenant_id, _ in companies},
+            company_ids={company_id for _, company_id in companies},
+        )
+        if (row["tenant_id"], row["company_id"]) in companies
+    ]
+    session.execute(
+        delete(CompanyIntentSummary)
+        .where(CompanyIntentSummary.intent_type == COMPANY_ROLLUP)
+        .where(
+            tuple_(CompanyIntentSummary.tenant_id, CompanyIntentSummary.company_id).in_(companies)
+        )
+    )
+    if rows:
+        session.execute(insert(CompanyIntentSummary), rows)
+    return len(rows)
+
+
+def rebuild_intent_summaries(session: Session, tenant_id: int | None = None) -> int:
+    statement = delete(CompanyIntentSummary)
+    if tenant_id is not None:
+        statement = statement.where(CompanyIntentSummary.tenant_id == tenant_id)
+    session.execute(statement)
+    tenant_ids = {tenant_id} if tenant_id is not None else None
+    rows = _intent_rows(session, tenant_ids=tenant_ids) + _rollup_rows(session, tenant_ids)
+    if rows:
+        session.execute(insert(CompanyIntentSummary), rows)
+    session.commit()
+    return len(rows)
+
+
+def intent_rows_query(
+    tenant_ids: set[int] | None = None,
+    company_ids: set[int] | None = None,
+    intent_types: set[str] | None = None,
+) -> Select:
+    ranked = select(
+        IntentHypothesis.id,
+        IntentHypothesis.tenant_id,
+        IntentHypothesis.company_id,
+        IntentHypothesis.intent_type,
+        IntentHypothesis.readiness_score,
+        IntentHypothesis.confidence,
+        IntentHypothesis.alert_eligible,
+        IntentHypothesis.alert_reason,
+        IntentHypothesis.rule_hits_json,
+        IntentHypothesis.created_at,
+        func.row_number()
+        .over(
+            partition_by=(
+                IntentHypothesis.tenant_id,
+                IntentHypothesis.company_id,
+                IntentHypothesis.intent_type,
+            ),
+            order_by=(desc(IntentHypothesis.created_at), desc(IntentHypothesis.id)),
+        )
+        .label("rank"),
+    )
+    if tenant_ids is not None:
+        ranked = ranked.where(IntentHypothesis.tenant_id.in_(tenant_ids))
+    if company_ids is not None:
+        ranked = ranked.where(IntentHypothesis.company_id.in_(company_ids))
+    if intent_types is not None:
+        ranked = ranked.where(IntentHypothesis.intent_type.in_(intent_types))
+    ranked = ranked.subquery()
+    latest = ranked.alias("latest")
+    previous = ranked.alias("previous")
+    return (
+        select(
+            latest,
+            previous.c.id.label("previous_id"),
+            previous.c.readiness_score.label("previous_readiness"),
+        )
+        .select_from(latest)
+        .outerjoin(
+            previous,
+            and_(
+                previous.c.tenant_id == latest.c.tenant_id,
+                previous.c.company_id == latest.c.company_id,
+                previous.c.intent_type == latest.c.intent_type,
+                previous.c.rank == 2,
+            ),
+        )
+        .where(latest.c.rank == 1)
+    )
+
+
+def _intent_rows(
+    session: Session,
+    tenant_ids: set[int] | None = None,
+    company_ids: set[int] | None = None,
+    intent_types: set[str] | None = None,
+) -> list[dict]:
+    now = utc_now()
+    return [
+        _intent_row(row, row.previous_id is not None, row.previous_readiness, now)
+        for row in session.execute(intent_rows_query(tenant_ids, company_ids, intent_types))
+    ]
+
+
+def _intent_row(
+    intent, has_previous: bool, previous_readiness: float | None, now: datetime
+) -> dict:
+    score_delta = None
+    if has_previous and intent.readiness_score is not None:
+        score_delta = intent.readiness_score - (previous_readiness or 0.0)
+    rule_names = [hit.get("rule_name") for hit in intent.rule_hits_json or []]
+    return _summary_row(
+        intent.tenant_id,
+        intent.company_id,
+        intent.intent_type,
+        latest_intent_id=intent.id,
+        latest_readiness=intent.readiness_score,
+        previous_readiness=previous_readiness,
+        score_delta=score_delta,
+        confidence=intent.confidence,
+        alert_eligible=bool(intent.alert_eligible),
+        alert_reason=intent.alert_reason,
+        top_rule_hits=[name for name in rule_names[:_TOP_RULE_HITS] if name],
+        last_intent_at=intent.created_at,
+        updated_at=now,
+    )
+
+
+def _rollup_rows(
+    session: Session, tenant_ids: set[int] | None = None, company_ids: set[int] | None = None
+) -> list[dict]:
+    query = select(
+        SignalEvent.tenant_id,
+        SignalEvent.company_id,
+        func.max(SignalEvent.timestamp).label("last_signal_at"),
+    ).group_by(SignalEvent.tenant_id, SignalEvent.company_id)
+    if tenant_ids is not None:
+        query = query.where(SignalEvent.tenant_id.in_(tenant_ids))
+    if company_ids is not None:
+        query = query.where(SignalEvent.company_id.in_(company_ids))
+    now = utc_now()
+    return [
+        _summary_row(
+            row.tenant_id,
+            row.company_id,
+            COMPANY_ROLLUP,
+            last_signal_at=row.last_signal_at,
+            updated_at=now,
+        )
+        for row in session.execute(query)
+    ]
+
+
+def _summary_row(tenant_id: int, company_id: int, intent_type: str, **fields) -> dict:
+    row = {
+        "tenant_id": tenant_id,
+        "company_id": company_id,
+        "intent_type": intent_type,
+        "latest_intent_id": None,
+        "latest_readiness": None,
+        "previous_readiness": None,
+        "score_delta": None,
+        "confidence": None,
+        "alert_eligible": False,
+        "alert_reason": None,
+        "top_rule_hits": [],
+        "last_intent_at": None,
+        "last_signal_at": None,
+    }
+    row.update(fields)
+    return row
@@ -1,27 +1,154 @@
 from __future__ import annotations
 
-from sqlalchemy import desc, select
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import Select, delete, desc, insert, or_, select, update
 from sqlalchemy.orm import Session
 
-from data.storage.db import IntentHypothesis
+from data.storage.db import IntentEvidence, IntentHypothesis
+from data.storage.repositories._columns import dialect_insert, insert_values
+from data.storage.repositories import intent_summary_repo
 
 
 def insert_intents(session: Session, intents: list[IntentHypothesis]) -> list[IntentHypothesis]:
-    session.add_all(intents)
+    if not intents:
+        return []
+    rows = session.execute(
+        insert(IntentHypothesis).returning(
+            IntentHypothesis.id, IntentHypothesis.created_at, sort_by_parameter_order=True
+        ),
+        [insert_values(intent) for intent in intents],
+    ).all()
+    for intent, row in zip(intents, rows):
+        intent.id = row.id
+        intent.created_at = row.created_at
+    evidence_rows = _evidence_rows(intents)
+    if evidence_rows:
+        session.execute(
+            dialect_insert(session)(IntentEvidence).on_conflict_do_nothing(), evidence_rows
+        )
+    intent_summary_repo.record_intents(session, intents)
     session.commit()
-    for intent in intents:
-        session.refresh(intent)
     return intents
 
 
-def list_latest_intents(
-    session: Session,
+def evidence_pairs_query(signal_ids: list[int]) -> Select:
+    return (
+        select(IntentEvidence.intent_type, IntentEvidence.signal_event_id)
+        .where(IntentEvidence.signal_event_id.in_(signal_ids))
+        .distinct()
+    )
+
+
+def list_evidence_pairs(session: Session, signal_ids: Iterable[int]) -> set[tuple[str, int]]:
+    signal_ids = list(set(signal_ids))
+    if not signal_ids:
+        return set()
+    return {
+        (row.intent_type, row.signal_event_id)
+        for row in session.execute(evidence_pairs_query(signal_ids))
+    }
+
+
+def list_ruleset_versions(session: Session, tenant_id: int | None = None) -> set[str | None]:
+    query = select(IntentHypothesis.ruleset_version).distinct()
+    if tenant_id is not None:
+        query = query.where(IntentHypothesis.tenant_id == tenant_id)
+    return set(session.execute(query).scalars())
+
+
+def list_rule_hit_signals(
+    session: Session, version: str, rule_names: Iterable[str], tenant_id: int | None = None
+) -> set[tuple[int, int, int]]:
+    rule_names = set(rule_names)
+    if not rule_names:
+        return set()
+    query = (
+        select(
+            IntentHypothesis.tenant_id,
+            IntentHypothesis.company_id,
+            IntentHypothesis.rule_hits_json,
+            IntentEvidence.signal_event_id,
+        )
+        .join(IntentEvidence, IntentEvidence.intent_id == IntentHypothesis.id)
+        .where(IntentHypothesis.ruleset_version == version)
+    )
+    if tenant_id is not None:
+        query = query.where(IntentHypothesis.tenant_id == tenant_id)
+    return {
+        (row.tenant_id, row.company_id, row.signal_event_id)
+        for row in session.execute(query)
+        if any(hit.get("rule_name") in rule_names for hit in row.rule_hits_json or [])
+    }
+
+
+def list_version_signals(
+    session: Session, exclude_versions: Iterable[str], tenant_id: int | None = None
+) -> set[tuple[int, int, int]]:
+    query = (
+        select(
+            IntentHypothesis.tenant_id,
+            IntentHypothesis.company_id,
+            IntentEvidence.signal_event_id,
+        )
+        .join(IntentEvidence, IntentEvidence.intent_id == IntentHypothesis.id)
+        .where(
+            or_(
+                IntentHypothesis.ruleset_version.is_(None),
+                IntentHypothesis.ruleset_version.not_in(list(exclude_versions)),
+            )
+        )
+    )
+    if tenant_id is not None:
+        query = query.where(IntentHypothesis.tenant_id == tenant_id)
+    return {tuple(row) for row in session.execute(query.distinct())}
+
+
+def delete_signal_intents(session: Session, signal_ids: Iterable[int]) -> set[tuple[int, int, str]]:
+    signal_ids = list(set(signal_ids))
+    if not signal_ids:
+        return set()
+    return _delete_intents(
+        session,
+        IntentHypothesis.id.in_(
+            select(IntentEvidence.intent_id).where(IntentEvidence.signal_event_id.in_(signal_ids))
+        ),
+    )
+
+
+def delete_company_intents(
+    session: Session, tenant_id: int, company_id: int
+) -> set[tuple[int, int, str]]:
+    return _delete_intents(
+        session,
+        IntentHypothesis.tenant_id == tenant_id,
+        IntentHypothesis.company_id == company_id,
+    )
+
+
+def stamp_ruleset_version(
+    session: Session, from_version: str, to_version: str, tenant_id: int | None = None
+) -> int:
+    statement = (
+        update(IntentHypothesis)
+        .where(IntentHypothesis.ruleset_version == from_version)
+        .values(ruleset_version=to_version)
+    )
+    if tenant_id is not None:
+        statement = statement.where(IntentHypothesis.tenant_id == tenant_id)
+    result = session.execute(statement)
+    session.commit()
+    return result.rowcount or 0
+
+
+def latest_intents_query(
     tenant_id: int,
     company_id: int,
     limit: int = 10,
     intent_types: list[str] | None = None,
     min_confidence: float | None = None,
-) -> list[IntentHypothesis]:
+) -> Select:
     query = select(IntentHypothesis).where(
         IntentHypothesis.tenant_id == tenant_id,
         IntentHypothesis.company_id == company_id,
@@ -30,7 +157,18 @@ def list_latest_intents(
         query = query.where(IntentHypothesis.intent_type.in_(intent_types))
     if min_confidence is not None:
         query = query.where(IntentHypothesis.confidence >= min_confidence)
-    query = query.order_by(desc(IntentHypothesis.created_at)).limit(limit)
+    return query.order_by(desc(IntentHypothesis.created_at)).limit(limit)
+
+
+def list_latest_intents(
+    session: Session,
+    tenant_id: int,
+    company_id: int,
+    limit: int = 10,
+    intent_types: list[str] | None = None,
+    min_confidence: float | None = None,
+) -> list[IntentHypothesis]:
+    query = latest_intents_query(tenant_id, company_id, limit, intent_types, min_confidence)
     return list(session.execute(query).scalars())
 
 
@@ -45,6 +183,20 @@ def list_company_intents(session: Session, tenant_id: int, company_id: int) -> l
     )
 
 
+def intents_since_query(
+    tenant_id: int, company_id: int, since, intent_type: str | None = None
+) -> Select:
+    query = (
+        select(IntentHypothesis)
+        .where(IntentHypothesis.tenant_id == tenant_id)
+        .where(IntentHypothesis.company_id == company_id)
+        .where(IntentHypothesis.created_at >= since)
+    )
+    if intent_type:
+        query = query.where(IntentHypothesis.intent_type == intent_type)
+    return query.order_by(IntentHypothesis.created_at)
+
+
 def list_intents_since(
     session: Session,
     tenant_id: int,
@@ -52,13 +204,72 @@ def list_intents_since(
     since,
     intent_type: str | None = None,
 ) -> list[IntentHypothesis]:
+    query = intents_since_query(tenant_id, company_id, since, intent_type)
+    return list(session.execute(query).scalars())
+
+
+def intent_times_since_query(
+    tenant_id: int,
+    company_id: int,
+    since,
+    intent_type: str | None = None,
+    min_readiness: float | None = None,
+) -> Select:
     query = (
-        select(IntentHypothesis)
+        select(IntentHypothesis.created_at)
         .where(IntentHypothesis.tenant_id == tenant_id)
         .where(IntentHypothesis.company_id == company_id)
         .where(IntentHypothesis.created_at >= since)
     )
     if intent_type:
         query = query.where(IntentHypothesis.intent_type == intent_type)
-    query = query.order_by(IntentHypothesis.created_at)
+    if min_readiness is not None:
+        query = query.where(IntentHypothesis.readiness_score >= min_readiness)
+    return query.order_by(IntentHypothesis.created_at)
+
+
+def list_intent_times_since(
+    session: Session,
+    tenant_id: int,
+    company_id: int,
+    since,
+    intent_type: str | None = None,
+    min_readiness: float | None = None,
+) -> list[datetime]:
+    query = intent_times_since_query(tenant_id, company_id, since, intent_type, min_readiness)
     return list(session.execute(query).scalars())
+
+
+def _delete_intents(session: Session, *criteria) -> set[tuple[int, int, str]]:
+    rows = session.execute(
+        select(
+            IntentHypothesis.id,
+            IntentHypothesis.tenant_id,
+            IntentHypothesis.company_id,
+            IntentHypothesis.intent_type,
+        ).where(*criteria)
+    ).all()
+    if not rows:
+        return set()
+    ids = [row.id for row in rows]
+    session.execute(delete(IntentEvidence).where(IntentEvidence.intent_id.in_(ids)))
+    session.execute(delete(IntentHypothesis).where(IntentHypothesis.id.in_(ids)))
+    keys = {(row.tenant_id, row.company_id, row.intent_type) for row in rows}
+    intent_summary_repo.refresh_intent_summaries(session, keys)
+    return keys
+
+
+def _evidence_rows(intents: list[IntentHypothesis]) -> list[dict]:
+    rows = {}
+    for intent in intents:
+        for item in intent.evidence or []:
+            signal_id = item.get("signal_event_id")
+            if signal_id is None:
+                continue
+            key = (int(signal_id), intent.intent_type, intent.id)
+            rows[key] = {
+                "signal_event_id": key[0],
+                "intent_type": key[1],
+                "intent_id": key[2],
+            }
+    return list(rows.values())
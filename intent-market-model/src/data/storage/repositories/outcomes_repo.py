@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import desc, select
+from sqlalchemy import Select, desc, select
 from sqlalchemy.orm import Session
 
 from data.storage.db import OutcomeEvent
@@ -14,29 +14,33 @@ def create_outcome(session: Session, outcome: OutcomeEvent) -> OutcomeEvent:
     return outcome
 
 
+def outcomes_query(tenant_id: int, company_id: int, limit: int = 100) -> Select:
+    return (
+        select(OutcomeEvent)
+        .where(OutcomeEvent.tenant_id == tenant_id)
+        .where(OutcomeEvent.company_id == company_id)
+        .order_by(desc(OutcomeEvent.timestamp))
+        .limit(limit)
+    )
+
+
 def list_outcomes(
     session: Session, tenant_id: int, company_id: int, limit: int = 100
 ) -> list[OutcomeEvent]:
-    return list(
-        session.execute(
-            select(OutcomeEvent)
-            .where(OutcomeEvent.tenant_id == tenant_id)
-            .where(OutcomeEvent.company_id == company_id)
-            .order_by(desc(OutcomeEvent.timestamp))
-            .limit(limit)
-        ).scalars()
+    return list(session.execute(outcomes_query(tenant_id, company_id, limit)).scalars())
+
+
+def outcomes_since_query(tenant_id: int, company_id: int, since: datetime) -> Select:
+    return (
+        select(OutcomeEvent)
+        .where(OutcomeEvent.tenant_id == tenant_id)
+        .where(OutcomeEvent.company_id == company_id)
+        .where(OutcomeEvent.timestamp >= since)
+        .order_by(desc(OutcomeEvent.timestamp))
     )
 
 
 def list_outcomes_since(
     session: Session, tenant_id: int, company_id: int, since: datetime
 ) -> list[OutcomeEvent]:
-    return list(
-        session.execute(
-            select(OutcomeEvent)
-            .where(OutcomeEvent.tenant_id == tenant_id)
-            .where(OutcomeEvent.company_id == company_id)
-            .where(OutcomeEvent.timestamp >= since)
-            .order_by(desc(OutcomeEvent.timestamp))
-        ).scalars()
-    )
+    return list(session.execute(outcomes_since_query(tenant_id, company_id, since)).scalars())
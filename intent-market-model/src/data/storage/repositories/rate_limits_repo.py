@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from data.storage.db import RateLimit
+from data.storage.repositories._columns import dialect_insert
+
+
+def increment_window(
+    session: Session, api_key_id: int, window_start: datetime, limit: int
+) -> int | None:
+    statement = dialect_insert(session)(RateLimit).values(
+        api_key_id=api_key_id, window_start=window_start, count=1
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["api_key_id", "window_start"],
+        set_={"count": RateLimit.count + 1},
+        where=RateLimit.count < limit,
+    ).returning(RateLimit.count)
+    count = session.execute(statement).scalar_one_or_none()
+    session.commit()
+    return count
+
+
+def delete_windows_before(session: Session, cutoff: datetime) -> int:
+    result = session.execute(delete(RateLimit).where(RateLimit.window_start < cutoff))
+    session.commit()
+    return result.rowcount or 0
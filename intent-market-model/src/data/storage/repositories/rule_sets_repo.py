@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from sqlalchemy import desc, select
+from sqlalchemy.orm import Session
+
+from core.utils.time import utc_now
+from data.storage.db import RuleSet
+from data.storage.repositories._columns import dialect_insert
+
+
+def save_rule_set(session: Session, version: str, rules: list[dict]) -> None:
+    session.execute(
+        dialect_insert(session)(RuleSet)
+        .values(version=version, rules=rules, created_at=utc_now())
+        .on_conflict_do_nothing(index_elements=["version"])
+    )
+
+
+def get_rule_set(session: Session, version: str) -> RuleSet | None:
+    return session.execute(select(RuleSet).where(RuleSet.version == version)).scalars().first()
+
+
+def latest_rule_set(session: Session, exclude_version: str | None = None) -> RuleSet | None:
+    query = select(RuleSet)
+    if exclude_version is not None:
+        query = query.where(RuleSet.version != exclude_version)
+    return session.execute(
+        query.order_by(desc(RuleSet.created_at), desc(RuleSet.id)).limit(1)
+    ).scalars().first()
@@ -1,26 +1,53 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import select, desc
+from typing import Iterable, Iterator
+from sqlalchemy import Row, Select, delete, func, select, desc, update
 from sqlalchemy.orm import Session
 
 from core.config import get_settings
 from data.storage.db import SignalEvent
+from data.storage.repositories._columns import dialect_insert, insert_values
+from data.storage.repositories import baselines_repo, intent_summary_repo
 
 settings = get_settings()
 
+_TOKEN_SCAN_BATCH = 2000
 
-def get_signal_by_hash(
-    session: Session, tenant_id: int, company_id: int, event_hash: str
-) -> SignalEvent | None:
-    return session.execute(
+
+def signal_by_hash_query(tenant_id: int, company_id: int, event_hash: str) -> Select:
+    return (
         select(SignalEvent)
         .where(SignalEvent.tenant_id == tenant_id)
         .where(SignalEvent.company_id == company_id)
         .where(SignalEvent.event_hash == event_hash)
+    )
+
+
+def get_signal_by_hash(
+    session: Session, tenant_id: int, company_id: int, event_hash: str
+) -> SignalEvent | None:
+    return session.execute(
+        signal_by_hash_query(tenant_id, company_id, event_hash)
     ).scalars().first()
 
 
+def list_existing_hashes(
+    session: Session, tenant_id: int, company_id: int, event_hashes: Iterable[str]
+) -> set[str]:
+    event_hashes = list(set(event_hashes))
+    if not event_hashes:
+        return set()
+    return set(
+        session.execute(
+            select(SignalEvent.event_hash)
+            .where(SignalEvent.tenant_id == tenant_id)
+            .where(SignalEvent.company_id == company_id)
+            .where(SignalEvent.event_hash.in_(event_hashes))
+        ).scalars()
+    )
+
+
 def insert_signal(session: Session, signal: SignalEvent) -> SignalEvent | None:
     existing = get_signal_by_hash(
         session, signal.tenant_id, signal.company_id, signal.event_hash
@@ -28,27 +55,137 @@ def insert_signal(session: Session, signal: SignalEvent) -> SignalEvent | None:
     if existing:
         return None
     session.add(signal)
+    session.flush()
+    intent_summary_repo.record_signals(session, [signal])
     session.commit()
     session.refresh(signal)
     return signal
 
 
+def insert_signals(session: Session, signals: list[SignalEvent]) -> list[int]:
+    if not signals:
+        return []
+    statement = (
+        dialect_insert(session)(SignalEvent)
+        .on_conflict_do_nothing(index_elements=["company_id", "event_hash"])
+        .returning(SignalEvent.id, SignalEvent.company_id, SignalEvent.event_hash)
+    )
+    rows = session.execute(statement, [insert_values(signal) for signal in signals]).all()
+    inserted = {(row.company_id, row.event_hash): row.id for row in rows}
+    new_signals: list[SignalEvent] = []
+    for signal in signals:
+        signal_id = inserted.pop((signal.company_id, signal.event_hash), None)
+        if signal_id is not None:
+            signal.id = signal_id
+            new_signals.append(signal)
+    intent_summary_repo.record_signals(session, new_signals)
+    session.commit()
+    return [signal.id for signal in new_signals]
+
+
+def delete_signals(
+    session: Session, tenant_id: int, company_id: int, source: str | None = None
+) -> int:
+    statement = (
+        delete(SignalEvent)
+        .where(SignalEvent.tenant_id == tenant_id)
+        .where(SignalEvent.company_id == company_id)
+    )
+    if source is not None:
+        statement = statement.where(SignalEvent.source == source)
+    result = session.execute(statement)
+    if result.rowcount:
+        session.execute(baselines_repo.delete_baselines_statement(tenant_id, company_id))
+    intent_summary_repo.refresh_signal_rollups(session, [(tenant_id, company_id)])
+    return result.rowcount or 0
+
+
+def recent_signals_query(tenant_id: int, company_id: int, limit: int = 50) -> Select:
+    return (
+        select(SignalEvent)
+        .where(SignalEvent.tenant_id == tenant_id)
+        .where(SignalEvent.company_id == company_id)
+        .order_by(desc(SignalEvent.timestamp))
+        .limit(limit)
+    )
+
+
 def list_recent_signals(
     session: Session, tenant_id: int, company_id: int, limit: int = 50
 ) -> list[SignalEvent]:
+    return list(session.execute(recent_signals_query(tenant_id, company_id, limit)).scalars())
+
+
+def unscored_signals_query(tenant_id: int, company_id: int) -> Select:
+    return (
+        select(SignalEvent)
+        .where(SignalEvent.tenant_id == tenant_id)
+        .where(SignalEvent.company_id == company_id)
+        .where(SignalEvent.scored_at.is_(None))
+        .order_by(SignalEvent.id)
+    )
+
+
+def list_unscored_signals(session: Session, tenant_id: int, company_id: int) -> list[SignalEvent]:
+    return list(session.execute(unscored_signals_query(tenant_id, company_id)).scalars())
+
+
+def mark_scored(session: Session, signal_ids: Iterable[int]) -> None:
+    signal_ids = list(set(signal_ids))
+    if not signal_ids:
+        return
+    session.execute(
+        update(SignalEvent)
+        .where(SignalEvent.id.in_(signal_ids))
+        .where(SignalEvent.scored_at.is_(None))
+        .values(scored_at=datetime.now(timezone.utc))
+    )
+
+
+def list_signals_by_ids(session: Session, signal_ids: Iterable[int]) -> list[SignalEvent]:
+    signal_ids = list(set(signal_ids))
+    if not signal_ids:
+        return []
     return list(
         session.execute(
-            select(SignalEvent)
-            .where(SignalEvent.tenant_id == tenant_id)
-            .where(SignalEvent.company_id == company_id)
-            .order_by(desc(SignalEvent.timestamp))
-            .limit(limit)
+            select(SignalEvent).where(SignalEvent.id.in_(signal_ids)).order_by(SignalEvent.id)
         ).scalars()
     )
 
 
+def iter_signal_tokens(
+    session: Session, signal_types: Iterable[str], tenant_id: int | None = None
+) -> Iterator[Row]:
+    query = select(
+        SignalEvent.id,
+        SignalEvent.tenant_id,
+        SignalEvent.company_id,
+        SignalEvent.signal_type,
+        SignalEvent.vectorizer_version,
+        SignalEvent.tokens,
+    ).where(SignalEvent.signal_type.in_(list(set(signal_types))))
+    if tenant_id is not None:
+        query = query.where(SignalEvent.tenant_id == tenant_id)
+    return iter(session.execute(query.execution_options(yield_per=_TOKEN_SCAN_BATCH)))
+
+
+def list_signal_texts(session: Session, signal_ids: Iterable[int]) -> dict[int, str]:
+    signal_ids = list(set(signal_ids))
+    if not signal_ids:
+        return {}
+    return dict(
+        session.execute(
+            select(SignalEvent.id, SignalEvent.raw_text).where(SignalEvent.id.in_(signal_ids))
+        ).all()
+    )
+
+
+def baseline_window_start() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=settings.baseline_window_days)
+
+
 def list_baseline_signals(session: Session, tenant_id: int, company_id: int) -> list[SignalEvent]:
-    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.baseline_window_days)
+    cutoff = baseline_window_start()
     return list(
         session.execute(
             select(SignalEvent)
@@ -60,15 +197,66 @@ def list_baseline_signals(session: Session, tenant_id: int, company_id: int) ->
     )
 
 
+def baseline_documents_query(
+    tenant_id: int, company_id: int, after_id: int, since: datetime
+) -> Select:
+    return (
+        select(
+            SignalEvent.id,
+            SignalEvent.timestamp,
+            SignalEvent.raw_text,
+            SignalEvent.structured_fields,
+        )
+        .where(SignalEvent.tenant_id == tenant_id)
+        .where(SignalEvent.company_id == company_id)
+        .where(SignalEvent.id > after_id)
+        .where(SignalEvent.timestamp >= since)
+        .order_by(SignalEvent.id)
+    )
+
+
+def list_baseline_documents(
+    session: Session, tenant_id: int, company_id: int, after_id: int = 0
+) -> list[Row]:
+    return list(
+        session.execute(
+            baseline_documents_query(tenant_id, company_id, after_id, baseline_window_start())
+        )
+    )
+
+
+def signals_since_query(tenant_id: int, company_id: int, since: datetime) -> Select:
+    return (
+        select(SignalEvent)
+        .where(SignalEvent.tenant_id == tenant_id)
+        .where(SignalEvent.company_id == company_id)
+        .where(SignalEvent.timestamp >= since)
+        .order_by(desc(SignalEvent.timestamp))
+    )
+
+
 def list_signals_since(
     session: Session, tenant_id: int, company_id: int, since: datetime
 ) -> list[SignalEvent]:
-    return list(
-        session.execute(
-            select(SignalEvent)
-            .where(SignalEvent.tenant_id == tenant_id)
-            .where(SignalEvent.company_id == company_id)
-            .where(SignalEvent.timestamp >= since)
-            .order_by(desc(SignalEvent.timestamp))
-        ).scalars()
+    return list(session.execute(signals_since_query(tenant_id, company_id, since)).scalars())
+
+
+def latest_signal_time_by_source_query(
+    tenant_id: int, company_id: int, since: datetime
+) -> Select:
+    return (
+        select(SignalEvent.source, func.max(SignalEvent.timestamp))
+        .where(SignalEvent.tenant_id == tenant_id)
+        .where(SignalEvent.company_id == company_id)
+        .where(SignalEvent.timestamp >= since)
+        .group_by(SignalEvent.source)
     )
+
+
+def latest_signal_time_by_source(
+    session: Session, tenant_id: int, company_id: int, since: datetime
+) -> dict[str, datetime]:
+    rows = session.execute(
+        latest_signal_time_by_source_query(tenant_id, company_id, since)
+    ).all()
+    return {source: timestamp for source, timestamp in rows}
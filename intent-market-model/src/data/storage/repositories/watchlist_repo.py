@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from sqlalchemy import Row, and_, desc, func, nulls_last, select
+from sqlalchemy.orm import Session, aliased
+
+from data.storage.db import Company, CompanyIntentSummary
+from data.storage.repositories.intent_summary_repo import COMPANY_ROLLUP
+
+WATCHLIST_SORTS = ("company", "readiness", "delta")
+
+
+def list_watchlist(
+    session: Session,
+    tenant_id: int,
+    limit: int | None = None,
+    offset: int = 0,
+    sort: str = "company",
+    intent_type: str = "IPO_PREP",
+) -> list[Row]:
+    if sort not in WATCHLIST_SORTS:
+        raise ValueError(f"Unknown watchlist sort: {sort}")
+    summary = aliased(CompanyIntentSummary, name="summary")
+    rollup = aliased(CompanyIntentSummary, name="rollup")
+    query = (
+        select(
+            Company.id.label("company_id"),
+            Company.name.label("company_name"),
+            summary.latest_readiness.label("readiness_score"),
+            summary.score_delta,
+            summary.confidence,
+            summary.alert_eligible,
+            summary.alert_reason,
+            summary.top_rule_hits,
+            rollup.last_signal_at.label("last_signal_date"),
+        )
+        .outerjoin(
+            summary,
+            and_(
+                summary.tenant_id == tenant_id,
+                summary.intent_type == intent_type,
+                summary.company_id == Company.id,
+            ),
+        )
+        .outerjoin(
+            rollup,
+            and_(
+                rollup.tenant_id == tenant_id,
+                rollup.intent_type == COMPANY_ROLLUP,
+                rollup.company_id == Company.id,
+            ),
+        )
+        .where(Company.tenant_id == tenant_id)
+    )
+    if sort == "readiness":
+        query = query.order_by(nulls_last(desc(summary.latest_readiness)), Company.id)
+    elif sort == "delta":
+        query = query.order_by(nulls_last(desc(summary.score_delta)), Company.id)
+    else:
+        query = query.order_by(Company.id)
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return list(session.execute(query).all())
+
+
+def count_watchlist(session: Session, tenant_id: int) -> int:
+    return session.execute(
+        select(func.count(Company.id)).where(Company.tenant_id == tenant_id)
+    ).scalar_one()
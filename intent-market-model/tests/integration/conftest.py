@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from data.storage import db
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'test.db'}")
+    event.listen(
+        engine, "connect", lambda connection, _: connection.execute("PRAGMA foreign_keys=ON")
+    )
+    db.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def session(session_factory):
+    with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def company(session):
+    tenant = db.Tenant(name="Main")
+    session.add(tenant)
+    session.flush()
+    company = db.Company(tenant_id=tenant.id, name="Acme", domain="acme.example")
+    session.add(company)
+    session.commit()
+    return company
@@ -0,0 +1,58 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.api.middleware import audit, auth
+from app.services.api_key_cache import ApiKeyCache, CachedApiKey
+from app.services.audit_sink import AuditSink
+from app.services.rate_limiter import InMemoryRateLimiter
+from core.utils.hashing import hash_string
+
+
+def test_asgi_middleware_authenticates_limits_and_audits(monkeypatch):
+    keys = {hash_string("secret"): CachedApiKey(id=3, tenant_id=1, rate_limit_per_min=2)}
+    sink = AuditSink(max_queue=100, batch_size=10, flush_interval_ms=50)
+    monkeypatch.setattr(auth, "_load_api_key", keys.get)
+    monkeypatch.setattr(
+        auth, "api_key_cache", ApiKeyCache(ttl_seconds=60, max_entries=10, touch_interval_seconds=60)
+    )
+    monkeypatch.setattr(auth, "rate_limiter", InMemoryRateLimiter())
+    monkeypatch.setattr(audit, "audit_sink", sink)
+
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/tenants/{tenant_id}/watchlist")
+    def watchlist(tenant_id: int, request: Request):
+        return {"tenant_id": tenant_id, "api_key_id": request.state.api_key_id}
+
+    app.add_middleware(auth.ApiKeyAuthMiddleware, allow_paths={"/health"})
+    app.add_middleware(audit.AuditLogMiddleware)
+
+    async def run_requests():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return [
+                await client.get("/health"),
+                await client.get("/tenants/1/watchlist"),
+                await client.get("/tenants/1/watchlist", headers={"X-API-Key": "wrong"}),
+                await client.get("/tenants/2/watchlist", headers={"X-API-Key": "secret"}),
+                await client.get("/tenants/1/watchlist", headers={"X-API-Key": "secret"}),
+                await client.get("/tenants/1/watchlist", headers={"X-API-Key": "secret"}),
+                await client.get("/tenants/1/watchlist", headers={"X-API-Key": "secret"}),
+            ]
+
+    responses = asyncio.run(run_requests())
+
+    assert [response.status_code for response in responses] == [200, 401, 401, 403, 200, 200, 429]
+    assert responses[4].json() == {"tenant_id": 1, "api_key_id": 3}
+    records = [sink._queue.get_nowait() for _ in range(sink._queue.qsize())]
+    assert [record["status_code"] for record in records] == [200, 401, 401, 403, 200, 200, 429]
+    assert records[4]["api_key_id"] == 3
+    assert records[4]["tenant_id"] == 1
+    assert records[0]["api_key_id"] is None
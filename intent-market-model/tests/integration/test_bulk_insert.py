@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from data.storage import db
+from data.storage.repositories import backtest_repo, intents_repo
+
+
+def test_bulk_inserts_fill_ids_without_per_row_selects(engine, session, company):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statements: list[str] = []
+
+    intents = [
+        db.IntentHypothesis(
+            tenant_id=company.tenant_id,
+            company_id=company.id,
+            intent_type="IPO_PREP",
+            confidence=0.5,
+            readiness_score=float(idx),
+            explanation=f"intent {idx}",
+            created_at=start + timedelta(hours=idx),
+        )
+        for idx in range(300)
+    ]
+    results = [
+        db.IntentBacktestResult(
+            tenant_id=company.tenant_id,
+            company_id=company.id,
+            outcome_type="IPO",
+            outcome_timestamp=start,
+            run_at=start,
+        )
+        for _ in range(1200)
+    ]
+
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0])
+    )
+    intents_repo.insert_intents(session, intents)
+    backtest_repo.insert_results(session, results)
+
+    assert statements.count("SELECT") == 1
+    stored = dict(session.query(db.IntentHypothesis.id, db.IntentHypothesis.explanation))
+    assert [stored[intent.id] for intent in intents] == [
+        intent.explanation for intent in intents
+    ]
+    assert intents[0].evidence == [] and intents[0].alert_eligible is False
+    assert len({result.id for result in results}) == 1200
+    assert all(result.created_at is not None for result in results)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from data.connectors.http_client import AsyncHttpClient, HttpCache
+from data.connectors.job_posts import greenhouse
+from data.ingestion.fetcher import fetch_posts_async
+
+
+class _BoardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    active = 0
+    peak = 0
+    connections: set[int] = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            type(self).active += 1
+            type(self).peak = max(type(self).peak, type(self).active)
+            type(self).connections.add(self.client_address[1])
+        time.sleep(0.05)
+        board = self.path.split("/")[3]
+        body = json.dumps(
+            {
+                "jobs": [
+                    {
+                        "id": 1,
+                        "title": f"Controller at {board}",
+                        "updated_at": "2024-05-01T00:00:00Z",
+                        "departments": [{"name": "Finance"}],
+                        "location": {"name": "Remote"},
+                    }
+                ]
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.lock:
+            type(self).active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_async_greenhouse_fetch_respects_host_limit(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BoardHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        greenhouse.settings, "greenhouse_api_base", f"http://127.0.0.1:{server.server_port}"
+    )
+
+    async def fetch_all():
+        async with AsyncHttpClient(max_concurrency=16, per_host_limit=3) as client:
+            return await asyncio.gather(
+                *(fetch_posts_async(f"board{idx}", "greenhouse", client) for idx in range(12))
+            )
+
+    try:
+        results = asyncio.run(fetch_all())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [posts[0]["title"] for posts in results] == [
+        f"Controller at board{idx}" for idx in range(12)
+    ]
+    assert results[0][0]["team"] == "Finance"
+    assert _BoardHandler.peak <= 3
+    assert len(_BoardHandler.connections) <= 3
+
+
+class _ConditionalBoardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list[dict] = []
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        board = self.path.split("/")[3]
+        if board == "etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"jobs": [{"id": 1, "title": "Controller"}]}).encode("utf-8")
+        self.send_response(200)
+        if board == "etag":
+            self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_conditional_fetch_short_circuits_unchanged_boards(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ConditionalBoardHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        greenhouse.settings, "greenhouse_api_base", f"http://127.0.0.1:{server.server_port}"
+    )
+
+    async def fetch_twice(board):
+        async with AsyncHttpClient() as client:
+            first_cache = HttpCache()
+            first = await fetch_posts_async(board, "greenhouse", client, first_cache)
+            second_cache = HttpCache(entries=first_cache.updated)
+            second = await fetch_posts_async(board, "greenhouse", client, second_cache)
+            return first, second, first_cache.updated, second_cache.updated
+
+    try:
+        etag_first, etag_second, etag_state, etag_updated = asyncio.run(fetch_twice("etag"))
+        digest_first, digest_second, digest_state, _ = asyncio.run(fetch_twice("plain"))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert etag_first[0]["title"] == "Controller"
+    assert etag_second is None
+    assert etag_updated == {}
+    assert next(iter(etag_state.values())).etag == '"v1"'
+    assert _ConditionalBoardHandler.requests[1].get("If-None-Match") == '"v1"'
+    assert digest_first[0]["title"] == "Controller"
+    assert digest_second is None
+    assert next(iter(digest_state.values())).content_digest
@@ -1,4 +1,5 @@
 import importlib
+from datetime import datetime, timezone
 import os
 from pathlib import Path
 
@@ -35,3 +36,90 @@ def test_ingest_from_fixtures():
 
         assert inserted > 0
         assert session.query(db.SignalEvent).count() == inserted
+        assert session.query(db.CompanyBaseline).count() == 1
+
+
+def test_bulk_insert_skips_existing_hashes():
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+    from core.config import get_settings
+
+    get_settings.cache_clear()
+
+    import data.storage.db as db
+
+    importlib.reload(db)
+    db.init_db()
+
+    from data.storage.repositories import signals_repo
+
+    importlib.reload(signals_repo)
+
+    def build_signal(company, event_hash):
+        return db.SignalEvent(
+            tenant_id=company.tenant_id,
+            company_id=company.id,
+            source="mock",
+            timestamp=datetime.now(timezone.utc),
+            signal_type="job_post",
+            raw_text=f"post {event_hash}",
+            event_hash=event_hash,
+        )
+
+    with db.SessionLocal() as session:
+        tenant = db.Tenant(name="Test Tenant")
+        session.add(tenant)
+        session.commit()
+        company = db.Company(tenant_id=tenant.id, name="Acme AI", domain="acme-ai.com")
+        session.add(company)
+        session.commit()
+
+        first = signals_repo.insert_signals(
+            session, [build_signal(company, "a"), build_signal(company, "b")]
+        )
+        batch = [build_signal(company, "a"), build_signal(company, "c")]
+        second = signals_repo.insert_signals(session, batch)
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert batch[1].id == second[0]
+        assert session.query(db.SignalEvent).count() == 3
+
+
+def test_harvest_baseline_only_counts_inserted_signals(session, company, monkeypatch):
+    from agents.signal_harvester.agent import SignalHarvesterAgent
+    from data.storage import db
+    from data.storage.repositories import signals_repo
+
+    posted_at = datetime.now(timezone.utc).isoformat()
+
+    def post(title):
+        return {"title": title, "description": f"{title} on aws", "posted_at": posted_at}
+
+    harvester = SignalHarvesterAgent(session)
+    assert harvester.harvest(company, "mock", [post("CFO"), post("Controller")]) == 2
+    monkeypatch.setattr(signals_repo, "list_existing_hashes", lambda *args: set())
+    assert harvester.harvest(company, "mock", [post("CFO"), post("Treasurer")]) == 1
+
+    record = session.query(db.CompanyBaseline).one()
+    assert record.doc_count == 3
+    assert sum(count for bucket in record.day_buckets for _, count in bucket["rows"]) == 3
+
+
+def test_delete_signals_drops_company_baseline(session, company):
+    from agents.signal_harvester.agent import SignalHarvesterAgent
+    from data.storage import db
+    from data.storage.repositories import signals_repo
+
+    posted_at = datetime.now(timezone.utc).isoformat()
+    harvester = SignalHarvesterAgent(session)
+    harvester.harvest(company, "mock", [{"title": "CFO", "description": "CFO", "posted_at": posted_at}])
+    assert session.query(db.CompanyBaseline).count() == 1
+
+    assert signals_repo.delete_signals(session, company.tenant_id, company.id, source="mock") == 1
+    session.rollback()
+    assert session.query(db.CompanyBaseline).count() == 1
+
+    signals_repo.delete_signals(session, company.tenant_id, company.id, source="mock")
+    session.commit()
+    assert session.query(db.CompanyBaseline).count() == 0
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete
+
+from agents.intent_inference import agent
+from data.storage import db
+from data.storage.repositories import intents_repo, signals_repo
+
+
+def test_infer_skips_signals_with_recorded_evidence(session, company, monkeypatch):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    fused: list[list[int]] = []
+
+    def fuse(signals):
+        fused.append([signal.id for signal in signals])
+        return [
+            db.IntentHypothesis(
+                company_id=signal.company_id,
+                intent_type="COST_PRESSURE",
+                confidence=0.6,
+                evidence=[{"signal_event_id": signal.id}],
+                explanation="",
+                created_at=signal.timestamp,
+            )
+            for signal in signals
+        ]
+
+    monkeypatch.setattr(agent, "fuse", fuse)
+
+    def add_signals(count: int, offset: int) -> list[db.SignalEvent]:
+        signals = [
+            db.SignalEvent(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                source="mock",
+                signal_type="job_post",
+                timestamp=start + timedelta(days=offset + idx),
+                raw_text="",
+                event_hash=f"hash-{offset + idx}",
+            )
+            for idx in range(count)
+        ]
+        signals_repo.insert_signals(session, signals)
+        return signals
+
+    inference = agent.IntentInferenceAgent(session)
+    first = add_signals(2, 0)
+    assert len(inference.infer(first)) == 2
+    assert inference.infer(first) == []
+    second = add_signals(1, 2)
+    assert len(inference.infer(first + second)) == 1
+
+    assert fused == [[s.id for s in first], [], [s.id for s in second]]
+    assert session.query(db.IntentEvidence).count() == 3
+    assert intents_repo.list_evidence_pairs(session, [s.id for s in first]) == {
+        ("COST_PRESSURE", s.id) for s in first
+    }
+
+
+def test_deleting_an_intent_cascades_to_its_evidence(session, company):
+    signal = db.SignalEvent(
+        tenant_id=company.tenant_id,
+        company_id=company.id,
+        source="mock",
+        signal_type="job_post",
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        raw_text="",
+        event_hash="hash",
+    )
+    signals_repo.insert_signals(session, [signal])
+    intents_repo.insert_intents(
+        session,
+        [
+            db.IntentHypothesis(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                intent_type="COST_PRESSURE",
+                confidence=0.6,
+                evidence=[{"signal_event_id": signal.id}],
+                explanation="",
+            )
+        ],
+    )
+    session.execute(delete(db.IntentHypothesis))
+    session.commit()
+    assert session.query(db.IntentEvidence).count() == 0
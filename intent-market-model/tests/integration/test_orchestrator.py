@@ -0,0 +1,172 @@
+import asyncio
+import importlib
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+
+
+def test_concurrent_run_isolates_company_failures(tmp_path, monkeypatch):
+    fixtures_path = Path(__file__).parents[2] / "data" / "fixtures"
+    os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{tmp_path / 'pipeline.db'}"
+    os.environ["FIXTURES_PATH"] = str(fixtures_path)
+
+    from core.config import get_settings
+
+    get_settings.cache_clear()
+
+    import data.storage.db as db
+
+    importlib.reload(db)
+    db.init_db()
+
+    import agents.orchestrator as orchestrator_module
+
+    importlib.reload(orchestrator_module)
+    from agents.signal_harvester.agent import SignalHarvesterAgent
+
+    original_harvest = SignalHarvesterAgent.harvest_signals
+
+    def harvest_signals(self, company, source, raw_items=None):
+        if company.domain == "broken.example":
+            raise RuntimeError("board unavailable")
+        return original_harvest(self, company, source, raw_items)
+
+    monkeypatch.setattr(SignalHarvesterAgent, "harvest_signals", harvest_signals)
+
+    with db.SessionLocal() as session:
+        tenant = db.Tenant(name="Test Tenant")
+        session.add(tenant)
+        session.commit()
+        companies = [
+            db.Company(tenant_id=tenant.id, name="Acme AI", domain="acme-ai.com"),
+            db.Company(tenant_id=tenant.id, name="Broken", domain="broken.example"),
+            db.Company(tenant_id=tenant.id, name="Sunwave", domain="sunwave.io"),
+        ]
+        session.add_all(companies)
+        session.commit()
+
+        orchestrator = orchestrator_module.Orchestrator(session)
+        result = orchestrator.run_concurrent(companies, source="mock", workers=2)
+
+        acme, broken, sunwave = companies
+        assert result.inserted[acme.id] > 0
+        assert result.inserted[sunwave.id] > 0
+        assert result.errors == {broken.id: "board unavailable"}
+
+
+def test_prefetch_limits_companies_in_flight(monkeypatch):
+    import agents.orchestrator as orchestrator_module
+
+    active = 0
+    peak = 0
+
+    async def fetch_posts_async(company_key, source, client, cache):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return [{"title": company_key}]
+
+    monkeypatch.setattr(orchestrator_module, "fetch_posts_async", fetch_posts_async)
+    pending: queue.Queue = queue.Queue(maxsize=2)
+    consumed: list[int] = []
+
+    def consume() -> None:
+        while len(consumed) < 20:
+            consumed.append(pending.get()[1])
+            time.sleep(0.002)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    jobs = [(1, company_id, {"greenhouse": f"board-{company_id}"}) for company_id in range(20)]
+    enqueued: set[int] = set()
+    asyncio.run(orchestrator_module._prefetch(jobs, {}, pending, enqueued))
+    consumer.join()
+
+    assert sorted(consumed) == list(range(20))
+    assert enqueued == set(range(20))
+    assert peak <= 2
+
+
+def test_companies_sharing_a_board_keep_separate_fetch_state(session, company, monkeypatch):
+    import agents.orchestrator as orchestrator_module
+    from data.connectors.http_client import CachedValidators
+    from data.storage import db
+    from data.storage.repositories import fetch_state_repo
+
+    url = "https://boards.example/shared"
+    other = db.Company(tenant_id=company.tenant_id, name="Globex")
+    session.add(other)
+    session.commit()
+    keys = [(company.tenant_id, company.id), (other.tenant_id, other.id)]
+    fetch_state_repo.save_states(
+        session, *keys[0], {url: {"etag": '"v1"', "content_digest": "abc"}}
+    )
+    states = fetch_state_repo.load_states(session, keys)
+    assert list(states) == [keys[0]]
+
+    headers: dict[int, dict[str, str]] = {}
+
+    async def fetch_posts_async(company_key, source, client, cache):
+        headers[len(headers)] = cache.request_headers(url)
+        return [{"title": company_key}]
+
+    monkeypatch.setattr(orchestrator_module, "fetch_posts_async", fetch_posts_async)
+    validators = {
+        key: {state_url: CachedValidators(**state) for state_url, state in by_url.items()}
+        for key, by_url in states.items()
+    }
+    pending: queue.Queue = queue.Queue(maxsize=1)
+    jobs = [(tenant_id, company_id, {"greenhouse": "shared"}) for tenant_id, company_id in keys]
+    consumer = threading.Thread(target=lambda: [pending.get() for _ in jobs])
+    consumer.start()
+    asyncio.run(orchestrator_module._prefetch(jobs, validators, pending, set()))
+    consumer.join()
+
+    assert headers == {0: {"If-None-Match": '"v1"'}, 1: {}}
+
+
+def test_next_run_scores_signals_left_by_failed_inference(session, company, monkeypatch):
+    import pytest
+
+    import agents.orchestrator as orchestrator_module
+    from agents.intent_inference.agent import IntentInferenceAgent
+    from data.storage import db
+    from data.storage.repositories import signals_repo
+
+    original_infer = IntentInferenceAgent.infer
+    calls = 0
+
+    def infer(self, signals):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("scorer unavailable")
+        return original_infer(self, signals)
+
+    monkeypatch.setattr(IntentInferenceAgent, "infer", infer)
+    posted_at = "2024-03-01T00:00:00+00:00"
+    posts = {
+        "mock": [
+            {
+                "title": "Chief Financial Officer",
+                "description": "CFO to lead SOX readiness, investor relations and the 10-K",
+                "posted_at": posted_at,
+            }
+        ]
+    }
+    orchestrator = orchestrator_module.Orchestrator(session)
+    with pytest.raises(RuntimeError):
+        orchestrator._process_company(company, ["mock"], posts)
+    session.rollback()
+    unscored = signals_repo.list_unscored_signals(session, company.tenant_id, company.id)
+    assert len(unscored) == 1
+    assert session.query(db.IntentHypothesis).count() == 0
+
+    assert orchestrator._process_company(company, ["mock"], posts) == 0
+    assert signals_repo.list_unscored_signals(session, company.tenant_id, company.id) == []
+    evidence = session.query(db.IntentEvidence).all()
+    assert evidence and {row.signal_event_id for row in evidence} == {unscored[0].id}
@@ -0,0 +1,24 @@
+from sqlalchemy import text
+
+from data.storage.query_plans import HOT_QUERIES, missing_indexes, sequential_scans
+
+
+def test_hot_queries_use_indexes(engine, session_factory):
+    with session_factory() as session:
+        assert sequential_scans(session) == {}
+        assert missing_indexes(session) == []
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX idx_outcome_events_company_time"))
+    engine.dispose()
+    with session_factory() as session:
+        failures = sequential_scans(session, [name for name in HOT_QUERIES if "outcomes" in name])
+    assert sorted(failures) == ["outcomes_repo.list_outcomes", "outcomes_repo.list_outcomes_since"]
+
+
+def test_missing_indexes_checks_migrations_on_sqlite(session, monkeypatch):
+    from data.storage import query_plans
+
+    migrated = query_plans.migration_indexes() - {"idx_outcome_events_company_time"}
+    monkeypatch.setattr(query_plans, "migration_indexes", lambda: migrated)
+    assert missing_indexes(session) == ["idx_outcome_events_company_time"]
@@ -0,0 +1,126 @@
+import copy
+import re
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from agents.intent_inference import agent, rescoring
+from agents.intent_inference.scorers import rule_scorer
+from agents.signal_harvester.features.semantic_drift import VECTORIZER_VERSION, tokenize_text
+from data.storage import db
+from data.storage.repositories import signals_repo
+
+_TEXTS = [
+    ("job_post", "Hiring a CFO to scale our finance team", True),
+    ("job_post", "Investor Relations manager for our IR program", True),
+    ("job_post", "Treasury analyst to run cash forecasting", True),
+    ("sec_filing", "Draft Form S-1 with SEC reporting controls", True),
+    ("job_post", "Data engineer for analytics pipelines", True),
+    ("job_post", "Treasury operations lead", False),
+]
+
+
+def _use_rules(monkeypatch, rules: list[dict]) -> None:
+    monkeypatch.setattr(rule_scorer, "IPO_PREP_RULES", rules)
+    monkeypatch.setattr(
+        rule_scorer,
+        "_RULE_PATTERNS",
+        [
+            {**rule, "compiled": [re.compile(pattern, re.IGNORECASE) for pattern in rule["patterns"]]}
+            for rule in rules
+        ],
+    )
+    monkeypatch.setattr(rule_scorer, "_MATCHERS", {})
+    monkeypatch.setattr(rule_scorer, "RULESET_VERSION", rule_scorer.ruleset_version(rules))
+
+
+def _snapshot(session) -> dict[int, list[tuple]]:
+    rows = session.execute(
+        select(db.IntentEvidence.signal_event_id, db.IntentHypothesis).join(
+            db.IntentHypothesis, db.IntentHypothesis.id == db.IntentEvidence.intent_id
+        )
+    ).all()
+    snapshot: dict[int, list[tuple]] = {}
+    for signal_id, intent in rows:
+        snapshot.setdefault(signal_id, []).append(
+            (
+                intent.intent_type,
+                intent.readiness_score,
+                intent.confidence,
+                intent.alert_eligible,
+                [hit["rule_name"] for hit in intent.rule_hits_json or []],
+                intent.ruleset_version,
+            )
+        )
+    return {signal_id: sorted(intents) for signal_id, intents in snapshot.items()}
+
+
+def test_rescore_only_touches_signals_affected_by_rule_changes(
+    session, session_factory, company, monkeypatch
+):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    old_version = rule_scorer.RULESET_VERSION
+    companies = [company, db.Company(tenant_id=company.tenant_id, name="Globex")]
+    session.add(companies[1])
+    session.commit()
+    signals = [
+        db.SignalEvent(
+            tenant_id=company.tenant_id,
+            company_id=companies[idx % 2].id,
+            source="mock",
+            signal_type=signal_type,
+            timestamp=start + timedelta(days=idx),
+            raw_text=text,
+            vectorizer_version=VECTORIZER_VERSION if tokenized else None,
+            tokens=tokenize_text(text) if tokenized else [],
+            event_hash=f"hash-{idx}",
+        )
+        for idx, (signal_type, text, tokenized) in enumerate(_TEXTS)
+    ]
+    signal_ids = signals_repo.insert_signals(session, signals)
+    by_company = {
+        company.id: [signal.id for signal in signals if signal.company_id == company.id]
+        for company in companies
+    }
+    inference = agent.IntentInferenceAgent(session)
+    for company_signal_ids in by_company.values():
+        inference.infer(signals_repo.list_signals_by_ids(session, company_signal_ids))
+    before = _snapshot(session)
+    assert {intent[-1] for intents in before.values() for intent in intents} == {old_version}
+
+    rules = copy.deepcopy(rule_scorer.IPO_PREP_RULES)
+    rules[0]["weight"] = 0.3
+    rules.append(
+        {
+            "name": "Treasury_Build",
+            "patterns": [r"\b(Treasury|cash management)\b"],
+            "weight": 0.07,
+            "signal_types": {"job_post"},
+            "snippet_template": 'Treasury function buildout: "{match}"',
+        }
+    )
+    _use_rules(monkeypatch, rules)
+
+    with session_factory() as session:
+        plan = rescoring.plan_rescore(session)
+    assert plan.from_versions == [old_version]
+    assert plan.changed_rules == ["Exec_Finance_Hire", "Treasury_Build"]
+    assert sorted(
+        signal_id for planned in plan.signals.values() for signal_id in planned
+    ) == [signal_ids[0], signal_ids[2], signal_ids[5]]
+
+    result = rescoring.run_rescore(plan, workers=2, batch_size=1, session_factory=session_factory)
+    assert result.errors == {}
+    assert result.signals == 3
+
+    with session_factory() as session:
+        selective = _snapshot(session)
+        assert selective[signal_ids[1]] == [
+            intent[:-1] + (rule_scorer.RULESET_VERSION,) for intent in before[signal_ids[1]]
+        ]
+        assert "Treasury_Build" in selective[signal_ids[5]][0][4]
+        inference = agent.IntentInferenceAgent(session)
+        for company_signal_ids in by_company.values():
+            inference.rescore(signals_repo.list_signals_by_ids(session, company_signal_ids))
+        assert _snapshot(session) == selective
+        assert rescoring.plan_rescore(session).signals == {}
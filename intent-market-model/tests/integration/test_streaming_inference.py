@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+from agents import orchestrator as orchestrator_module
+from agents.intent_inference import agent
+from data.storage import db
+from data.storage.repositories import signals_repo
+
+
+def test_pipeline_scores_new_signals_outside_latest_window(session, company, monkeypatch):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    fused: list[set[int]] = []
+
+    def fuse(signals):
+        fused.append({signal.id for signal in signals})
+        return [
+            db.IntentHypothesis(
+                company_id=signal.company_id,
+                intent_type="COST_PRESSURE",
+                confidence=0.6,
+                evidence=[{"signal_event_id": signal.id}],
+                explanation="",
+                created_at=signal.timestamp,
+            )
+            for signal in signals
+        ]
+
+    monkeypatch.setattr(agent, "fuse", fuse)
+
+    scored_ids = signals_repo.insert_signals(
+        session,
+        [
+            db.SignalEvent(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                source="mock",
+                signal_type="job_post",
+                timestamp=start + timedelta(days=100 + idx),
+                raw_text="",
+                event_hash=f"recent-{idx}",
+            )
+            for idx in range(60)
+        ],
+    )
+    signals_repo.mark_scored(session, scored_ids)
+    session.commit()
+
+    backdated = [
+        {
+            "title": f"Engineer {idx}",
+            "description": "Backfilled posting",
+            "posted_at": (start + timedelta(days=idx)).isoformat(),
+        }
+        for idx in range(3)
+    ]
+    pipeline = orchestrator_module.Orchestrator(session)
+    inserted = pipeline._process_company(company, ["mock"], {"mock": backdated})
+
+    new_ids = {
+        signal_id
+        for (signal_id,) in session.query(db.SignalEvent.id).filter(
+            db.SignalEvent.event_hash.notlike("recent-%")
+        )
+    }
+    assert inserted == 3
+    assert fused == [new_ids]
+
+    for _ in range(2):
+        pipeline._process_company(company, ["mock"], {"mock": backdated}, rescore_window=50)
+        assert len(fused[-1]) == 50
+        assert not fused[-1] & new_ids
+    assert session.query(db.IntentHypothesis).count() == 53
@@ -0,0 +1,134 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from agents.intent_inference import agent
+from data.storage import db
+from data.storage.repositories import intents_repo, signals_repo
+
+
+def _reference_trust_layer(session, tenant_id: int, intent) -> tuple[bool, int]:
+    if (intent.readiness_score or 0.0) < 70.0:
+        return False, 0
+    reference_time = intent.created_at
+    recent_intents = intents_repo.list_intents_since(
+        session, tenant_id, intent.company_id, reference_time - timedelta(days=60), "IPO_PREP"
+    )
+    persisted = any(
+        prior.readiness_score is not None and prior.readiness_score >= 70.0
+        for prior in recent_intents
+    )
+    recent_signals = signals_repo.list_signals_since(
+        session, tenant_id, intent.company_id, reference_time - timedelta(days=30)
+    )
+    return persisted, len({signal.source for signal in recent_signals})
+
+
+def test_batched_trust_layer_matches_per_intent_queries(session, company):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rng = random.Random(7)
+
+    for idx in range(60):
+        session.add(
+            db.IntentHypothesis(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                intent_type=rng.choice(["IPO_PREP", "COST_PRESSURE"]),
+                confidence=0.5,
+                readiness_score=rng.choice([None, 40.0, 70.0, 90.0]),
+                explanation="",
+                created_at=start + timedelta(days=rng.randint(0, 365)),
+            )
+        )
+        session.add(
+            db.SignalEvent(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                source=rng.choice(["greenhouse", "lever", "mock"]),
+                signal_type="job_post",
+                timestamp=start + timedelta(days=rng.randint(0, 365)),
+                raw_text="",
+                event_hash=f"hash-{idx}",
+            )
+        )
+    session.commit()
+
+    candidates = [
+        (start + timedelta(days=rng.randint(0, 400)), rng.choice([20.0, 70.0, 95.0]))
+        for _ in range(80)
+    ]
+
+    def build():
+        return [
+            db.IntentHypothesis(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                intent_type="IPO_PREP",
+                confidence=0.7,
+                readiness_score=readiness,
+                explanation="",
+                created_at=created_at,
+            )
+            for created_at, readiness in candidates
+        ]
+
+    expected = [_reference_trust_layer(session, company.tenant_id, intent) for intent in build()]
+
+    batched = build()
+    now = datetime.now(timezone.utc)
+    windows = agent._load_trust_windows(session, company.tenant_id, batched, now)
+    for intent in batched:
+        agent._apply_trust_layer(intent, windows.get(intent.company_id), now)
+
+    trust = [intent.explanations_json[-1] for intent in batched]
+    assert [(entry["persisted"], entry["source_count"]) for entry in trust] == expected
+    assert [intent.alert_eligible for intent in batched] == [
+        persisted or source_count >= 2 for persisted, source_count in expected
+    ]
+    assert {intent.alert_eligible for intent in batched} == {True, False}
+
+
+def test_rescore_keeps_persistence_from_rescored_history(session, company, monkeypatch):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def fuse(signals):
+        return [
+            db.IntentHypothesis(
+                company_id=signal.company_id,
+                intent_type="IPO_PREP",
+                confidence=0.7,
+                readiness_score=90.0,
+                evidence=[{"signal_event_id": signal.id}],
+                explanation="",
+                created_at=signal.timestamp,
+            )
+            for signal in signals
+        ]
+
+    monkeypatch.setattr(agent, "fuse", fuse)
+    signals = [
+        db.SignalEvent(
+            tenant_id=company.tenant_id,
+            company_id=company.id,
+            source="mock",
+            signal_type="job_post",
+            timestamp=start + timedelta(days=10 * idx),
+            raw_text="",
+            event_hash=f"hash-{idx}",
+        )
+        for idx in range(3)
+    ]
+    signals_repo.insert_signals(session, signals)
+    inference = agent.IntentInferenceAgent(session)
+    for signal in signals:
+        inference.infer([signal])
+
+    def eligibility():
+        return sorted(
+            (intent.created_at, intent.alert_eligible)
+            for intent in session.query(db.IntentHypothesis)
+        )
+
+    streamed = eligibility()
+    assert [eligible for _, eligible in streamed] == [False, True, True]
+    inference.rescore(list(reversed(signals)))
+    assert eligibility() == streamed
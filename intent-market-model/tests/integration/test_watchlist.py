@@ -0,0 +1,240 @@
+from datetime import datetime, timedelta, timezone
+
+from data.storage import db
+from data.storage.repositories import (
+    intent_summary_repo,
+    intents_repo,
+    signals_repo,
+    watchlist_repo,
+)
+
+
+def _per_company_reference(session, tenant_id: int) -> dict[int, tuple]:
+    reference = {}
+    for company in session.query(db.Company).filter(db.Company.tenant_id == tenant_id):
+        intents = intents_repo.list_latest_intents(
+            session, tenant_id, company.id, limit=2, intent_types=["IPO_PREP"]
+        )
+        delta = None
+        if len(intents) >= 2 and intents[0].readiness_score is not None:
+            delta = intents[0].readiness_score - (intents[1].readiness_score or 0.0)
+        signals = signals_repo.list_recent_signals(session, tenant_id, company.id, limit=1)
+        reference[company.id] = (
+            intents[0].readiness_score if intents else None,
+            delta,
+            intents[0].confidence if intents else None,
+            signals[0].timestamp if signals else None,
+        )
+    return reference
+
+
+def test_watchlist_query_matches_per_company_lookups(session):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    tenants = [db.Tenant(name="Main"), db.Tenant(name="Other")]
+    session.add_all(tenants)
+    session.flush()
+    companies = [
+        db.Company(tenant_id=tenants[idx % 2].id, name=f"Company {idx}", domain=None)
+        for idx in range(8)
+    ]
+    session.add_all(companies)
+    session.flush()
+    for idx, company in enumerate(companies):
+        for step in range(idx % 4):
+            session.add(
+                db.IntentHypothesis(
+                    tenant_id=company.tenant_id,
+                    company_id=company.id,
+                    intent_type="IPO_PREP",
+                    confidence=0.5 + 0.05 * step,
+                    readiness_score=None if (idx, step) == (6, 1) else 40.0 + idx * 3 + step * 7,
+                    explanation="",
+                    created_at=start + timedelta(days=step),
+                )
+            )
+        session.add(
+            db.IntentHypothesis(
+                tenant_id=company.tenant_id,
+                company_id=company.id,
+                intent_type="COST_PRESSURE",
+                confidence=0.9,
+                explanation="",
+                created_at=start + timedelta(days=30),
+            )
+        )
+        if idx % 3:
+            session.add(
+                db.SignalEvent(
+                    tenant_id=company.tenant_id,
+                    company_id=company.id,
+                    source="mock",
+                    signal_type="job_post",
+                    timestamp=start + timedelta(days=idx),
+                    raw_text="",
+                    structured_fields={},
+                    diff={},
+                    event_hash=f"hash-{idx}",
+                )
+            )
+    session.commit()
+    intent_summary_repo.rebuild_intent_summaries(session)
+
+    tenant_id = tenants[0].id
+    reference = _per_company_reference(session, tenant_id)
+    rows = watchlist_repo.list_watchlist(session, tenant_id)
+    assert [row.company_id for row in rows] == sorted(reference)
+    for row in rows:
+        assert (
+            row.readiness_score,
+            row.score_delta,
+            row.confidence,
+            row.last_signal_date,
+        ) == reference[row.company_id]
+
+    by_readiness = watchlist_repo.list_watchlist(session, tenant_id, sort="readiness")
+    scores = [row.readiness_score for row in by_readiness]
+    present = [score for score in scores if score is not None]
+    assert present == sorted(present, reverse=True)
+    assert scores[len(present) :] == [None] * (len(scores) - len(present))
+
+    page = watchlist_repo.list_watchlist(session, tenant_id, limit=2, offset=1, sort="delta")
+    full = watchlist_repo.list_watchlist(session, tenant_id, sort="delta")
+    assert [row.company_id for row in page] == [row.company_id for row in full[1:3]]
+    assert watchlist_repo.count_watchlist(session, tenant_id) == 4
+
+
+def _summary_state(session) -> dict[tuple, tuple]:
+    return {
+        (row.tenant_id, row.company_id, row.intent_type): (
+            row.latest_intent_id,
+            row.latest_readiness,
+            row.previous_readiness,
+            row.score_delta,
+            row.top_rule_hits,
+            row.last_signal_at,
+        )
+        for row in session.query(db.CompanyIntentSummary)
+    }
+
+
+def test_incremental_summary_matches_rebuild(session, company):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    tenant_id = company.tenant_id
+    companies = [company] + [
+        db.Company(tenant_id=tenant_id, name=f"Company {idx}") for idx in (1, 2)
+    ]
+    session.add_all(companies[1:])
+    session.commit()
+
+    for day in (3, 1, 5, 2):
+        signals_repo.insert_signals(
+            session,
+            [
+                db.SignalEvent(
+                    tenant_id=tenant_id,
+                    company_id=company.id,
+                    source="mock",
+                    signal_type="job_post",
+                    timestamp=start + timedelta(days=day + idx),
+                    raw_text="",
+                    event_hash=f"hash-{idx}-{day}",
+                )
+                for idx, company in enumerate(companies[:2])
+            ],
+        )
+        intents_repo.insert_intents(
+            session,
+            [
+                db.IntentHypothesis(
+                    tenant_id=tenant_id,
+                    company_id=company.id,
+                    intent_type=intent_type,
+                    confidence=0.6,
+                    readiness_score=40.0 + day * 5 + idx,
+                    rule_hits_json=[{"rule_name": f"rule_{day}"}, {"rule_name": "shared"}],
+                    explanation="",
+                    created_at=start + timedelta(days=day),
+                )
+                for idx, company in enumerate(companies[1:])
+                for intent_type in ("IPO_PREP", "COST_PRESSURE")
+            ],
+        )
+    signals_repo.insert_signal(
+        session,
+        db.SignalEvent(
+            tenant_id=tenant_id,
+            company_id=companies[2].id,
+            source="mock",
+            signal_type="job_post",
+            timestamp=start,
+            raw_text="",
+            event_hash="single",
+        ),
+    )
+
+    incremental = _summary_state(session)
+    intent_summary_repo.rebuild_intent_summaries(session, tenant_id)
+    assert _summary_state(session) == incremental
+
+    summary = incremental[(tenant_id, companies[1].id, "IPO_PREP")]
+    assert summary[1:5] == (65.0, 55.0, 10.0, ["rule_5", "shared"])
+    rollup = incremental[(tenant_id, companies[1].id, intent_summary_repo.COMPANY_ROLLUP)]
+    assert rollup[5].replace(tzinfo=timezone.utc) == start + timedelta(days=6)
+
+    rows = watchlist_repo.list_watchlist(session, tenant_id)
+    assert [row.readiness_score for row in rows] == [None, 65.0, 66.0]
+    assert rows[0].last_signal_date is not None
+    assert rows[2].top_rule_hits == ["rule_5", "shared"]
+
+    intents_repo.delete_company_intents(session, tenant_id, companies[1].id)
+    signals_repo.delete_signals(session, tenant_id, companies[0].id, source="mock")
+    session.commit()
+    after_delete = _summary_state(session)
+    assert (tenant_id, companies[1].id, "IPO_PREP") not in after_delete
+    assert (tenant_id, companies[0].id, intent_summary_repo.COMPANY_ROLLUP) not in after_delete
+    intent_summary_repo.rebuild_intent_summaries(session, tenant_id)
+    assert _summary_state(session) == after_delete
+
+
+def test_insert_updates_summary_from_existing_row(session, company, monkeypatch):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def intent(day, readiness):
+        return db.IntentHypothesis(
+            tenant_id=company.tenant_id,
+            company_id=company.id,
+            intent_type="IPO_PREP",
+            confidence=0.5,
+            readiness_score=readiness,
+            rule_hits_json=[],
+            explanation="",
+            created_at=start + timedelta(days=day),
+        )
+
+    intents_repo.insert_intents(session, [intent(1, 30.0)])
+    with monkeypatch.context() as patch:
+        patch.setattr(intent_summary_repo, "_intent_rows", None)
+        intents_repo.insert_intents(session, [intent(3, 50.0)])
+        intents_repo.insert_intents(session, [intent(4, 55.0), intent(5, 70.0)])
+    summary = _summary_state(session)[(company.tenant_id, company.id, "IPO_PREP")]
+    assert summary[1:4] == (70.0, 55.0, 15.0)
+
+    intents_repo.insert_intents(session, [intent(2, 90.0)])
+    incremental = _summary_state(session)
+    intent_summary_repo.rebuild_intent_summaries(session)
+    assert _summary_state(session) == incremental
+
+
+def test_watchlist_route_reports_next_offset(session, company):
+    from app.api.v1.routes_watchlist import watchlist
+
+    session.add_all(
+        db.Company(tenant_id=company.tenant_id, name=f"Company {idx}") for idx in range(4)
+    )
+    session.commit()
+
+    first = watchlist(company.tenant_id, limit=2, offset=0, sort="company", session=session)
+    assert (first.total, first.next_offset, len(first.items)) == (5, 2, 2)
+    last = watchlist(company.tenant_id, limit=2, offset=4, sort="company", session=session)
+    assert (last.next_offset, len(last.items)) == (None, 1)
@@ -0,0 +1,56 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.services.api_key_cache import ApiKeyCache, CachedApiKey
+from data.storage import db
+
+
+def test_cache_resolves_once_until_ttl_and_invalidation():
+    now = [0.0]
+    loads: list[str] = []
+
+    def loader(key_hash):
+        loads.append(key_hash)
+        return CachedApiKey(id=1, tenant_id=7, rate_limit_per_min=60) if key_hash == "good" else None
+
+    cache = ApiKeyCache(ttl_seconds=30, max_entries=2, touch_interval_seconds=60, clock=lambda: now[0])
+    assert cache.resolve("good", loader).tenant_id == 7
+    assert cache.resolve("good", loader).id == 1
+    assert cache.resolve("bad", loader) is None
+    assert cache.resolve("bad", loader) is None
+    assert loads == ["good", "bad"]
+
+    cache.invalidate(api_key_id=1)
+    cache.resolve("good", loader)
+    now[0] = 31
+    cache.resolve("good", loader)
+    cache.resolve("other", loader)
+    cache.resolve("bad", loader)
+    assert loads == ["good", "bad", "good", "good", "other", "bad"]
+
+
+def test_touches_are_coalesced_into_one_write_per_key():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    db.Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        tenant = db.Tenant(name="Test Tenant")
+        session.add(tenant)
+        session.flush()
+        session.add_all(
+            [
+                db.ApiKey(tenant_id=tenant.id, name="a", key_hash="a"),
+                db.ApiKey(tenant_id=tenant.id, name="b", key_hash="b"),
+            ]
+        )
+        session.commit()
+
+    cache = ApiKeyCache(ttl_seconds=30, max_entries=10, touch_interval_seconds=60)
+    for _ in range(5):
+        cache.touch(1)
+    cache.touch(2)
+
+    assert cache.flush(session_factory) == 2
+    assert cache.flush(session_factory) == 0
+    with session_factory() as session:
+        assert all(key.last_used_at for key in session.query(db.ApiKey).all())
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.services.audit_sink import AuditSink
+from data.storage import db
+
+
+def _entry(idx: int) -> dict:
+    return {
+        "method": "GET",
+        "path": f"/health/{idx}",
+        "status_code": 200,
+        "duration_ms": idx,
+    }
+
+
+def test_audit_sink_batches_drops_and_flushes_on_stop(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'audit.db'}")
+    db.Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    sink = AuditSink(max_queue=5, batch_size=3, flush_interval_ms=50)
+    assert all(sink.record(_entry(idx)) for idx in range(5))
+    assert not sink.record(_entry(5))
+    assert sink.dropped == 1
+
+    sink.start(session_factory)
+    deadline = time.monotonic() + 2
+    while sink.written < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sink.written == 5
+
+    for idx in range(6, 8):
+        sink.record(_entry(idx))
+    sink.stop()
+
+    with session_factory() as session:
+        paths = {row.path for row in session.query(db.AuditLog).all()}
+    assert paths == {f"/health/{idx}" for idx in range(8) if idx != 5}
+    assert sink.written == 7
+
+
+def test_audit_sink_stop_does_not_block_on_a_full_queue(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'audit.db'}")
+    db.Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    release = threading.Event()
+
+    def slow_factory():
+        release.wait(5)
+        return session_factory()
+
+    sink = AuditSink(max_queue=2, batch_size=1, flush_interval_ms=10)
+    sink.start(slow_factory)
+    sink.record(_entry(0))
+    deadline = time.monotonic() + 2
+    while not sink._queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for idx in range(1, 4):
+        sink.record(_entry(idx))
+    writer = sink._writer
+    started = time.monotonic()
+    sink.stop(timeout=0.2)
+    assert time.monotonic() - started < 1
+
+    release.set()
+    writer.join(5)
+    assert not writer.is_alive()
+    with session_factory() as session:
+        assert session.query(db.AuditLog).count() == sink.written
+    assert (sink.written, sink.dropped) == (3, 1)
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.services import cache_service
+from app.services.cache_service import CacheKey, LocalResponseCache
+from data.storage import db
+
+
+def _session_factory(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'cache.db'}")
+    db.Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_two_tier_cache_hits_upserts_and_invalidates(tmp_path, monkeypatch):
+    session_factory = _session_factory(tmp_path)
+    local = LocalResponseCache(max_entries=2, ttl_seconds=30)
+    monkeypatch.setattr(cache_service, "local_cache", local)
+    dashboard = CacheKey("dashboard", 1, 1)
+
+    with session_factory() as session:
+        assert cache_service.get_cached_response(session, dashboard) is None
+        cache_service.set_cached_response(session, dashboard, {"v": 1})
+        cache_service.set_cached_response(session, dashboard, {"v": 2})
+        assert session.query(db.ResponseCache).count() == 1
+        assert cache_service.get_cached_response(session, dashboard) == {"v": 2}
+
+        local.clear()
+        assert cache_service.get_cached_response(session, dashboard) == {"v": 2}
+        assert cache_service.get_cached_response(session, dashboard) == {"v": 2}
+
+        cache_service.set_cached_response(session, CacheKey("timeline", 1, 1, "30"), {"v": 3})
+        cache_service.set_cached_response(session, CacheKey("timeline", 1, 10, "30"), {"v": 4})
+        cache_service.invalidate_cache(session, "timeline", 1, 1)
+        assert cache_service.get_cached_response(session, CacheKey("timeline", 1, 1, "30")) is None
+        assert cache_service.get_cached_response(session, CacheKey("timeline", 1, 10, "30")) == {
+            "v": 4
+        }
+        assert cache_service.get_cached_response(session, dashboard) == {"v": 2}
+
+    assert cache_service.cache_stats() == {
+        "local_hits": 3,
+        "db_hits": 2,
+        "misses": 2,
+        "evictions": 1,
+    }
+
+
+def test_invalidation_reaches_other_process_local_tiers(tmp_path, monkeypatch):
+    session_factory = _session_factory(tmp_path)
+    workers = [LocalResponseCache(max_entries=8, ttl_seconds=300) for _ in range(2)]
+    timeline = CacheKey("timeline", 1, 1, "30")
+    other_company = CacheKey("timeline", 1, 2, "30")
+
+    def on(worker):
+        monkeypatch.setattr(cache_service, "local_cache", workers[worker])
+
+    with session_factory() as session:
+        on(0)
+        cache_service.set_cached_response(session, timeline, {"v": 1})
+        cache_service.set_cached_response(session, other_company, {"v": 2})
+        on(1)
+        assert cache_service.get_cached_response(session, timeline) == {"v": 1}
+        assert cache_service.get_cached_response(session, other_company) == {"v": 2}
+
+        on(0)
+        cache_service.invalidate_cache(session, "timeline", 1, 1)
+        on(1)
+        assert cache_service.get_cached_response(session, timeline) is None
+        assert cache_service.get_cached_response(session, other_company) == {"v": 2}
+
+        cache_service.set_cached_response(session, timeline, {"v": 3})
+        on(0)
+        assert cache_service.get_cached_response(session, timeline) == {"v": 3}
+        on(1)
+        cache_service.invalidate_cache(session, "timeline", 1)
+        on(0)
+        assert cache_service.get_cached_response(session, other_company) is None
+
+    assert workers[1].stats["local_hits"] == 1
+    assert workers[0].stats["db_hits"] == 1
+
+
+def test_maintenance_sweeps_expired_rows_and_caps_size(tmp_path, monkeypatch):
+    session_factory = _session_factory(tmp_path)
+    monkeypatch.setattr(cache_service, "local_cache", LocalResponseCache(0, 30))
+    now = datetime.now(timezone.utc)
+
+    with session_factory() as session:
+        session.add(
+            db.ResponseCache(
+                cache_key="stale",
+                namespace="timeline",
+                tenant_id=1,
+                company_id=1,
+                payload={},
+                expires_at=now - timedelta(seconds=1),
+            )
+        )
+        session.commit()
+        for days in range(5):
+            cache_service.set_cached_response(
+                session, CacheKey("timeline", 1, 2, str(days)), {"days": days}, ttl_seconds=60 + days
+            )
+
+        removed = cache_service.CacheMaintenance(interval_seconds=60, max_entries=3).run_once(
+            session
+        )
+
+        assert removed == {"expired": 1, "evicted": 2}
+        remaining = sorted(row.cache_key for row in session.query(db.ResponseCache).all())
+        assert remaining == [str(CacheKey("timeline", 1, 2, str(days))) for days in (2, 3, 4)]
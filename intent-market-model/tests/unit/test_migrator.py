@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy import create_engine, inspect, select
+
+from data.storage.migrator import (
+    discover_migrations,
+    run_migrations,
+    schema_migrations,
+    split_statements,
+)
+
+
+def test_runner_applies_only_new_migrations(tmp_path):
+    migrations = tmp_path / "migrations"
+    migrations.mkdir()
+    (migrations / "001_items.sql").write_text(
+        "-- items\nCREATE TABLE items (id INTEGER PRIMARY KEY);\n"
+        "INSERT INTO items (id) VALUES (1);\n",
+        encoding="utf-8",
+    )
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'migrate.db'}")
+
+    assert [migration.version for migration in run_migrations(engine, migrations)] == [1]
+    assert run_migrations(engine, migrations) == []
+
+    (migrations / "002_tags.sql").write_text(
+        "CREATE TABLE tags (id INTEGER PRIMARY KEY);", encoding="utf-8"
+    )
+    applied = run_migrations(engine, migrations)
+    assert [(migration.version, migration.name) for migration in applied] == [(2, "tags")]
+    assert {"items", "tags", "schema_migrations"} <= set(inspect(engine).get_table_names())
+    with engine.connect() as connection:
+        assert connection.execute(select(schema_migrations.c.version)).scalars().all() == [1, 2]
+        assert connection.exec_driver_sql("SELECT COUNT(*) FROM items").scalar_one() == 1
+
+
+def test_failed_migration_is_not_recorded(tmp_path):
+    migrations = tmp_path / "migrations"
+    migrations.mkdir()
+    (migrations / "001_broken.sql").write_text(
+        "INSERT INTO missing (id) VALUES (1);", encoding="utf-8"
+    )
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'migrate.db'}")
+
+    with pytest.raises(Exception):
+        run_migrations(engine, migrations)
+    (migrations / "001_broken.sql").write_text(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY);", encoding="utf-8"
+    )
+    assert [migration.version for migration in run_migrations(engine, migrations)] == [1]
+
+
+def test_discover_rejects_bad_names(tmp_path):
+    (tmp_path / "001_a.sql").write_text("", encoding="utf-8")
+    (tmp_path / "1_b.sql").write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="Duplicate"):
+        discover_migrations(tmp_path)
+    (tmp_path / "1_b.sql").unlink()
+    (tmp_path / "extra.sql").write_text("", encoding="utf-8")
+    with pytest.raises(ValueError, match="001_name.sql"):
+        discover_migrations(tmp_path)
+
+
+def test_split_statements_respects_quotes_comments_and_dollar_quoting():
+    sql = (
+        "-- notes; not a statement\n"
+        "CREATE FUNCTION touch() RETURNS trigger AS $body$\n"
+        "BEGIN NEW.note := 'a;b'; RETURN NEW; END;\n"
+        "$body$ LANGUAGE plpgsql;\n"
+        "INSERT INTO items (note) VALUES ('it''s; fine'), ($$x;y$$);\n"
+        "/* block; comment */ SELECT \"odd;name\" FROM items;;\n"
+        "-- trailing; comment\n"
+    )
+    statements = split_statements(sql)
+    assert len(statements) == 3
+    assert statements[0].endswith("$body$ LANGUAGE plpgsql")
+    assert statements[1] == "INSERT INTO items (note) VALUES ('it''s; fine'), ($$x;y$$)"
+    assert statements[2] == '/* block; comment */ SELECT "odd;name" FROM items'
+
+
+def test_runner_keeps_semicolons_inside_literals(tmp_path):
+    migrations = tmp_path / "migrations"
+    migrations.mkdir()
+    (migrations / "001_notes.sql").write_text(
+        "-- seed (notes; one row)\nCREATE TABLE notes (body TEXT);\n"
+        "INSERT INTO notes (body) VALUES ('first; second');\n",
+        encoding="utf-8",
+    )
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'migrate.db'}")
+
+    run_migrations(engine, migrations)
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT body FROM notes").scalar_one() == "first; second"
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.services.rate_limiter import DatabaseRateLimiter, InMemoryRateLimiter
+from data.storage import db
+
+
+def test_token_bucket_allows_limit_per_minute():
+    now = [0.0]
+    limiter = InMemoryRateLimiter(clock=lambda: now[0])
+
+    assert all(limiter.allow(1, 3) for _ in range(3))
+    assert not limiter.allow(1, 3)
+    assert limiter.allow(2, 3)
+
+    now[0] = 20.0
+    assert limiter.allow(1, 3)
+    assert not limiter.allow(1, 3)
+
+
+def test_database_limiter_counts_shared_windows_and_prunes(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'limits.db'}")
+    db.Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        tenant = db.Tenant(name="Test Tenant")
+        session.add(tenant)
+        session.flush()
+        session.add(db.ApiKey(tenant_id=tenant.id, name="a", key_hash="a"))
+        session.commit()
+
+    now = [datetime(2024, 5, 1, 12, 0, 5, tzinfo=timezone.utc)]
+    workers = [DatabaseRateLimiter(session_factory, clock=lambda: now[0]) for _ in range(2)]
+
+    assert [workers[idx % 2].allow(1, 3) for idx in range(5)] == [True, True, True, False, False]
+    with session_factory() as session:
+        assert session.query(db.RateLimit.count).scalar() == 3
+
+    now[0] += timedelta(minutes=2)
+    assert workers[0].allow(1, 3)
+    with session_factory() as session:
+        assert session.query(db.RateLimit).count() == 1
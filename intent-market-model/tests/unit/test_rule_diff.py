@@ -0,0 +1,47 @@
+from agents.intent_inference.rescoring import RuleRescan, diff_rule_sets, pattern_anchors
+from agents.intent_inference.scorers import rule_scorer
+
+
+def test_pattern_anchors_use_leading_literal_words():
+    assert pattern_anchors(r"\b(CFO|Chief Financial Officer|VP Finance)\b") == {"cfo", "chief", "vp"}
+    assert pattern_anchors(r"\b(SOX|Sarbanes[- ]Oxley|internal controls)\b") == {
+        "sox",
+        "sarbanes",
+        "internal",
+    }
+    assert pattern_anchors(r"\b(FP&A|Strategic Finance)\b") == {"fp", "strategic"}
+    assert pattern_anchors(r"\b(?:roadshow|investor deck)\b") == {"roadshow", "investor"}
+    assert pattern_anchors(r"\bcaps?\b") == {"cap"}
+
+
+def test_pattern_anchors_give_up_on_unanchored_patterns():
+    assert pattern_anchors(r"\b(10-K|Form S-1)\b") is None
+    assert pattern_anchors(r"\b([Cc]FO)\b") is None
+    assert pattern_anchors(r"(?i)cfo") is None
+    assert pattern_anchors(r"\b(a|b)\b") is None
+    assert pattern_anchors(r"(CFO)(VP)") is None
+
+
+def test_diff_rule_sets_separates_rehits_from_rescans():
+    old = rule_scorer.serialize_rules(rule_scorer.IPO_PREP_RULES)
+    new = rule_scorer.serialize_rules(rule_scorer.IPO_PREP_RULES)
+    new[0]["weight"] = 0.3
+    new[1]["patterns"] = new[1]["patterns"] + [r"\b(shareholder relations)\b"]
+    new[2]["signal_types"] = sorted(set(new[2]["signal_types"]) | {"press_release"})
+    removed = new.pop(3)
+    new.append({**removed, "name": "Public_Reporting"})
+
+    rehit, rescans = diff_rule_sets(old, new)
+
+    assert rehit == {
+        "Exec_Finance_Hire",
+        "IR_Hiring",
+        "SOX_Compliance",
+        "Public_Company_Reporting",
+    }
+    assert RuleRescan("IR_Hiring", (r"\b(shareholder relations)\b",), frozenset({"job_post"})) in rescans
+    assert RuleRescan(
+        "SOX_Compliance", tuple(new[2]["patterns"]), frozenset({"press_release"})
+    ) in rescans
+    assert {rescan.name for rescan in rescans} == {"IR_Hiring", "SOX_Compliance", "Public_Reporting"}
+    assert diff_rule_sets(old, old) == (set(), [])
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 
 from agents.intent_inference.scorers import rule_scorer
+from core.utils.text import keyword_scores, keyword_scores_from_counts, term_counts
 
 
 def test_rule_scorer_detects_ipo_prep(monkeypatch):
@@ -24,3 +25,46 @@ def test_rule_scorer_detects_ipo_prep(monkeypatch):
     ipo = next(intent for intent in intents if intent.intent_type == "IPO_PREP")
     assert ipo.readiness_score is not None
     assert ipo.rule_hits_json
+
+
+def _reference_hits(signal_type: str, text: str) -> list[tuple[str, str]]:
+    hits = []
+    for rule in rule_scorer._RULE_PATTERNS:
+        if signal_type not in rule["signal_types"]:
+            continue
+        for pattern in rule["compiled"]:
+            found = pattern.search(text)
+            if found:
+                hits.append((rule["name"], found.group(0)))
+                break
+    return hits
+
+
+def test_rule_matcher_matches_per_rule_search():
+    texts = [
+        "Senior Director of Investor Relations and SOX compliance lead",
+        "Our SOX audit with KPMG precedes the Form S-1 and a roadshow",
+        "Sarbanes Oxley internal controls; the Audit Committee met the independent director",
+        "Controller (FP&A) for revenue recognition under ASC 606 — équipe financière",
+        "SOXX and KEY words, EYE exam, cap table and capital markets counsel",
+        "",
+    ]
+    for signal_type in ("job_post", "sec_filing"):
+        for text in texts:
+            signal = SimpleNamespace(signal_type=signal_type, raw_text=text)
+            hits = rule_scorer._apply_rules(signal)
+            assert [(hit["rule_name"], hit["match"]) for hit in hits] == _reference_hits(
+                signal_type, text
+            )
+            for hit in hits:
+                assert hit["match"] in hit["source_snippet"]
+
+
+def test_term_counts_keep_substring_semantics():
+    text = "contractor to migrate off legacy infrastructure; contract infra cost"
+    counts = term_counts(text, rule_scorer._SCORED_TERMS)
+    for term in rule_scorer._SCORED_TERMS:
+        assert counts[term] == text.count(term)
+    assert counts["contract"] == 2
+    assert counts["infra"] == 2
+    assert keyword_scores_from_counts(counts) == keyword_scores(text)
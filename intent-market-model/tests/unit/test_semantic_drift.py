@@ -0,0 +1,152 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from agents.signal_harvester.features import semantic_drift
+from agents.signal_harvester.features.semantic_drift import DriftBaseline, tokenize_text
+
+BASELINE = [
+    "Senior platform engineer for infrastructure on aws and kubernetes",
+    "Product manager for growth and scaling of the core product",
+    "Security engineer focused on risk, privacy and compliance audit",
+    "Office coordinator for the new york office",
+    "ML platform engineer building a feature store with spark and kafka",
+]
+NEW_TEXT = "Head of compliance and governance to prepare audit and cost efficiency"
+
+
+def _reference_drift(baseline_texts: list[str], text: str) -> tuple[float, list[dict]]:
+    vectorizer = TfidfVectorizer(
+        vocabulary=semantic_drift._VOCAB,
+        tokenizer=tokenize_text,
+        lowercase=False,
+        token_pattern=None,
+    )
+    tfidf = vectorizer.fit_transform(baseline_texts + [text])
+    current_vec = tfidf[-1].toarray()[0]
+    baseline_vec = np.asarray(tfidf[:-1].mean(axis=0)).ravel()
+    similarity = semantic_drift.cosine_similarity(current_vec.tolist(), baseline_vec.tolist())
+    delta = current_vec - baseline_vec
+    terms = vectorizer.get_feature_names_out()
+    top_terms = []
+    for idx in np.argsort(delta)[::-1][:10]:
+        if delta[idx] <= 0:
+            break
+        top_terms.append({"term": terms[idx], "delta": float(delta[idx])})
+    return max(0.0, 1.0 - similarity), top_terms
+
+
+def test_drift_baseline_matches_tfidf_vectorizer():
+    baseline = DriftBaseline()
+    for text in BASELINE:
+        baseline.add(text, {"role_bucket": "infra", "tech_tags": ["aws"]})
+
+    diff, tokens = baseline.score(NEW_TEXT, "job_post", {"role_bucket": "security"})
+    expected_drift, expected_terms = _reference_drift(BASELINE, NEW_TEXT)
+
+    assert tokens == tokenize_text(NEW_TEXT)
+    assert diff["vectorizer_version"] == "tfidf-v1"
+    assert diff["drift_score"] == pytest.approx(expected_drift, abs=1e-12)
+    assert [item["term"] for item in diff["top_terms_delta"]] == [
+        item["term"] for item in expected_terms
+    ]
+    for actual, expected in zip(diff["top_terms_delta"], expected_terms):
+        assert actual["delta"] == pytest.approx(expected["delta"], abs=1e-12)
+    assert diff["role_bucket_delta"] == {"security": 1.0}
+    assert diff["tech_tag_delta"] == {"added": [], "removed": ["aws"]}
+
+
+def test_drift_baseline_grows_incrementally():
+    baseline = DriftBaseline()
+    for idx in range(40):
+        text = BASELINE[idx % len(BASELINE)]
+        diff, tokens = baseline.score(text, "job_post", {})
+        if idx:
+            expected_drift, _ = _reference_drift(
+                [BASELINE[i % len(BASELINE)] for i in range(idx)], text
+            )
+            assert diff["drift_score"] == pytest.approx(expected_drift, abs=1e-12)
+        baseline.add_tokens(tokens)
+    assert baseline.doc_count == 40
+
+
+def test_score_batch_matches_serial_scoring():
+    items = [
+        {
+            "raw_text": text,
+            "signal_type": "job_post",
+            "structured_fields": {"role_bucket": f"bucket-{idx % 3}", "tech_tags": ["kafka"]},
+        }
+        for idx, text in enumerate(BASELINE * 4 + [NEW_TEXT, ""])
+    ]
+    serial = DriftBaseline.from_texts(BASELINE[:2], {"infra": 2}, {"aws"})
+    expected = []
+    for item in items:
+        diff, tokens = serial.score(item["raw_text"], item["signal_type"], item["structured_fields"])
+        serial.add_tokens(tokens, item["structured_fields"])
+        expected.append((diff, tokens))
+
+    batched = DriftBaseline.from_texts(BASELINE[:2], {"infra": 2}, {"aws"})
+    actual = batched.score_batch(items)
+
+    assert len(actual) == len(expected)
+    for (diff, tokens), (expected_diff, expected_tokens) in zip(actual, expected):
+        assert tokens == expected_tokens
+        assert diff["drift_score"] == pytest.approx(expected_diff["drift_score"], abs=1e-12)
+        assert [item["term"] for item in diff["top_terms_delta"]] == [
+            item["term"] for item in expected_diff["top_terms_delta"]
+        ]
+        assert diff["role_bucket_delta"] == expected_diff["role_bucket_delta"]
+        assert diff["tech_tag_delta"] == expected_diff["tech_tag_delta"]
+    assert batched.doc_count == serial.doc_count
+    assert np.array_equal(batched.doc_freq, serial.doc_freq)
+    assert batched.role_counts == serial.role_counts
+
+
+def test_snapshot_round_trip_and_window_eviction():
+    old = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    recent = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    baseline = DriftBaseline()
+    baseline.add(BASELINE[0], {"role_bucket": "infra", "tech_tags": ["aws"]}, old)
+    for text in BASELINE[1:]:
+        baseline.add(text, {"role_bucket": "product", "tech_tags": ["kafka"]}, recent)
+
+    restored = DriftBaseline.from_snapshot(baseline.to_snapshot())
+    assert restored.score(NEW_TEXT, "job_post", {}) == baseline.score(NEW_TEXT, "job_post", {})
+
+    assert restored.evict_before(datetime(2024, 3, 1, tzinfo=timezone.utc)) == 1
+    expected = DriftBaseline()
+    for text in BASELINE[1:]:
+        expected.add(text, {"role_bucket": "product", "tech_tags": ["kafka"]}, recent)
+    assert restored.doc_count == expected.doc_count
+    assert np.array_equal(restored.doc_freq, expected.doc_freq)
+    assert restored.role_counts == {"product": 4}
+    assert restored.tech_tags == {"kafka"}
+    diff, _ = restored.score(NEW_TEXT, "job_post", {"role_bucket": "infra"})
+    expected_diff, _ = expected.score(NEW_TEXT, "job_post", {"role_bucket": "infra"})
+    assert diff == expected_diff
+
+
+def test_snapshot_keeps_aggregates_not_documents():
+    day = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    baseline = DriftBaseline()
+    for idx in range(50):
+        baseline.add(BASELINE[idx % 2], {"role_bucket": "infra", "tech_tags": ["aws"]}, day)
+
+    snapshot = baseline.to_snapshot()
+    assert snapshot["doc_count"] == 50
+    assert len(snapshot["term_counts"]) == 2
+    assert snapshot["day_buckets"] == [
+        {
+            "day": "2024-06-01",
+            "rows": [[0, 25], [1, 25]],
+            "role_counts": {"infra": 50},
+            "tech_tag_counts": {"aws": 50},
+        }
+    ]
+    restored = DriftBaseline.from_snapshot(snapshot)
+    expected_drift, _ = _reference_drift([BASELINE[idx % 2] for idx in range(50)], NEW_TEXT)
+    diff, _ = restored.score(NEW_TEXT, "job_post", {})
+    assert diff["drift_score"] == pytest.approx(expected_drift, abs=1e-12)